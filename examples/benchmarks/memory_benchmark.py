@@ -0,0 +1,223 @@
+"""Memory Benchmark
+
+This script measures the memory used by a synthetic multi-year backtest. The
+backtest is run against an in-memory copy of the securities master database
+that is populated with synthetic prices, so no connection to the Odin
+Securities database is needed.
+
+Every event that is placed on the events queue and every filled position that
+is opened during the backtest is retained. The peak and the retained memory
+traced while trading, the number of live allocations, and the bytes occupied by
+each instance of the retained classes (the object itself and its attribute
+dictionary, if it has one) are reported.
+
+If a baseline git revision is given, such as a revision from before events and
+positions were given slot-based layouts, the same backtest is also run against
+that revision of Odin and the differences between the two are reported. Each
+backtest is run in its own process with its tree of Odin first on the path, and
+the same swing strategy, loaded from this checkout, is traded in both.
+
+Usage:
+    python memory_benchmark.py [n_symbols] [n_years] [baseline]
+"""
+import os
+import io
+import sys
+import gc
+import json
+import time
+import shutil
+import tarfile
+import tempfile
+import subprocess
+import tracemalloc
+import importlib.util
+from collections import defaultdict
+
+
+# The root of the checkout of Odin that contains this script.
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def load_swing_strategy():
+    """Load the swing strategy template of this checkout as a module of the
+    Odin package that is being measured, so that its relative imports resolve
+    against that tree and the same strategy is traded in every tree.
+    """
+    import odin.strategy.templates
+    name = "odin.strategy.templates.swing_strategy"
+    spec = importlib.util.spec_from_file_location(name, os.path.join(
+        ROOT, "odin", "strategy", "templates", "swing_strategy.py"
+    ))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.SwingStrategy
+
+
+def object_bytes(obj):
+    """The bytes occupied by an object and by its attribute dictionary."""
+    n = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        n += sys.getsizeof(obj.__dict__)
+    return n
+
+
+def measure(n_symbols, n_years):
+    """Run the backtest against the tree of Odin that is first on the path and
+    return the measurements as a dictionary.
+    """
+    import pandas as pd
+    from odin.utilities import offline_securities
+    offline_securities.install()
+
+    from odin.events import BacktestEventsQueue
+    from odin.fund import SimulatedFund
+    from odin.handlers.data_handler import DatabaseDataHandler
+    from odin.handlers.execution_handler import SimulatedExecutionHandler
+    from odin.handlers.fund_handler import FundHandler
+    from odin.handlers.portfolio_handler import PortfolioHandler
+    from odin.handlers.position_handler.templates import (
+        SuggestedProportionPositionHandler
+    )
+    from odin.handlers.symbol_handler import FixedSymbolHandler
+    from odin.portfolio import SimulatedPortfolio
+
+    class RecordingEventsQueue(BacktestEventsQueue):
+        """Events queue that retains every event placed on it."""
+        def __init__(self):
+            super(RecordingEventsQueue, self).__init__()
+            self.history = []
+
+        def put(self, event):
+            self.history.append(event)
+            super(RecordingEventsQueue, self).put(event)
+
+    n_sessions = 252 * n_years
+    symbols = offline_securities.generate_securities(
+        n_symbols, n_sessions + 30, start_date="2005-01-03"
+    )
+    sessions = pd.bdate_range("2005-01-03", periods=n_sessions + 30)
+    start, end = sessions[30].to_pydatetime(), sessions[-1].to_pydatetime()
+
+    events = RecordingEventsQueue()
+    porth = PortfolioHandler(10, "swing", 100000.0, "benchmark")
+    dh = DatabaseDataHandler(
+        events, FixedSymbolHandler(symbols, [porth]), start, end, 20,
+        preload=True
+    )
+    posh = SuggestedProportionPositionHandler(dh)
+    portfolio = SimulatedPortfolio(dh, posh, porth)
+    strategy = load_swing_strategy()(portfolio, 0.99, 1.015)
+    fh = FundHandler(events, [strategy], start, "benchmark")
+    fund = SimulatedFund(dh, SimulatedExecutionHandler(dh), fh)
+
+    gc.collect()
+    tracemalloc.start()
+    t = time.time()
+    fund.trade()
+    elapsed = time.time() - t
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    positions = list(porth.filled_positions.values()) + [
+        p for v in porth.closed_positions.values() for p in v
+    ]
+    sizes = defaultdict(lambda: [0, 0])
+    for obj in events.history + positions:
+        s = sizes[type(obj).__name__]
+        s[0] += 1
+        s[1] += object_bytes(obj)
+
+    return {
+        "elapsed": elapsed,
+        "peak": peak,
+        "current": current,
+        "blocks": sum(s.count for s in snapshot.statistics("filename")),
+        "sizes": sizes,
+    }
+
+
+def run(tree, n_symbols, n_years):
+    """Measure the backtest in a separate process with the given tree of Odin
+    first on the path.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [tree] + [p for p in [env.get("PYTHONPATH")] if p]
+    )
+    out = subprocess.check_output(
+        [sys.executable, __file__, "--measure", str(n_symbols), str(n_years)],
+        env=env, cwd=tree
+    )
+    return json.loads(out.decode().splitlines()[-1])
+
+
+def export(revision, directory):
+    """Export a revision of this checkout into the given directory."""
+    archive = subprocess.check_output(
+        ["git", "-C", ROOT, "archive", "--format=tar", revision]
+    )
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(directory)
+
+
+def report(name, m):
+    print("{}: {:0.1f} seconds, peak {:0.1f} MB, retained {:0.1f} MB, live "
+          "blocks {}".format(
+              name, m["elapsed"], m["peak"] / 1e6, m["current"] / 1e6,
+              m["blocks"]
+          ))
+
+
+def main(n_symbols, n_years, baseline=None):
+    print("{} symbols, {} sessions".format(n_symbols, 252 * n_years))
+    current = run(ROOT, n_symbols, n_years)
+    report("current", current)
+    if baseline is None:
+        print("{:<16}{:>10}{:>10}".format("class", "count", "B/obj"))
+        for name, (n, b) in sorted(current["sizes"].items()):
+            print("{:<16}{:>10}{:>10.1f}".format(name, n, b / n))
+        return
+
+    directory = tempfile.mkdtemp()
+    try:
+        export(baseline, directory)
+        base = run(directory, n_symbols, n_years)
+    finally:
+        shutil.rmtree(directory)
+    report(baseline, base)
+    for k, label in (("peak", "Peak"), ("current", "Retained")):
+        print("{} difference: {:0.1f} MB ({:0.0f}%)".format(
+            label, (current[k] - base[k]) / 1e6,
+            100. * (current[k] / base[k] - 1.)
+        ))
+
+    print("{:<16}{:>10}{:>14}{:>14}{:>10}".format(
+        "class", "count", "current B/obj", "base B/obj", "change"
+    ))
+    for name in sorted(set(current["sizes"]) | set(base["sizes"])):
+        n, b = current["sizes"].get(name, [0, 0])
+        m, c = base["sizes"].get(name, [0, 0])
+        if n and m:
+            print("{:<16}{:>10}{:>14.1f}{:>14.1f}{:>9.0f}%".format(
+                name, n, b / n, c / m, 100. * (b / n * m / c - 1.)
+            ))
+        else:
+            # The class exists in only one of the trees.
+            print("{:<16}{:>10}{:>14}{:>14}".format(
+                name, max(n, m), "{:0.1f}".format(b / n) if n else "-",
+                "{:0.1f}".format(c / m) if m else "-"
+            ))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--measure"]:
+        # Run as a worker process and write the measurements as JSON.
+        print(json.dumps(measure(int(sys.argv[2]), int(sys.argv[3]))))
+    else:
+        n_symbols = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+        n_years = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+        baseline = sys.argv[3] if len(sys.argv) > 3 else None
+        main(n_symbols, n_years, baseline)
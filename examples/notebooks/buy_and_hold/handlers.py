@@ -1,4 +1,4 @@
-from odin.events import EventsQueue
+from odin.events import BacktestEventsQueue
 from odin.handlers.portfolio_handler import PortfolioHandler
 from odin.handlers.position_handler.templates import (
     SuggestedProportionPositionHandler
@@ -18,7 +18,7 @@ porth = PortfolioHandler(
 )
 
 # Events queue for handling market data, signals, orders, and fills.
-events = EventsQueue()
+events = BacktestEventsQueue()
 # Symbol handler will determine which symbols will be processed during trading.
 # In this example, we will just trade the S&P 500 ETF (SPY).
 sh = FixedSymbolHandler(settings.symbols, [porth])
@@ -48,8 +48,8 @@ class CointegratedETFStrategy(
 
     def generate_features(self):
         """Implementation of abstract base class method."""
-        bars = self.portfolio.data_handler.bars.ix[:, -15:, :]
-        prices = bars["adj_price_close"]
+        bars = self.portfolio.data_handler.bars
+        prices = bars.frame("adj_price_close", 15)
         weights = np.array([1.0, -1.])
         feats = pd.DataFrame(index=bars.minor_axis)
         ts = prices.dot(weights)
@@ -27,13 +27,13 @@ class BuySellStrategy(AbstractStrategy):
 
     def generate_features(self):
         """Implementation of abstract base class method."""
-        symbols = self.portfolio.data_handler.bars.ix[
-            "adj_price_open", -1, :
-        ].dropna().index
+        symbols = self.portfolio.data_handler.bars.last(
+            "adj_price_open"
+        ).dropna().index
         return pd.DataFrame(index=symbols)
 
     def generate_priority(self, feats):
         """Implementation of abstract base class method."""
-        return self.portfolio.data_handler.bars.ix[
-            "adj_price_open", -1, :
-        ].dropna().index
+        return self.portfolio.data_handler.bars.last(
+            "adj_price_open"
+        ).dropna().index
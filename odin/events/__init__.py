@@ -3,3 +3,5 @@ from .event_types import (
     ManagementEvent,
 )
 from .events_queue import EventsQueue
+from .backtest_events_queue import BacktestEventsQueue
+from .event_journal import EventJournal
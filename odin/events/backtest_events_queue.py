@@ -0,0 +1,74 @@
+from heapq import heappush, heappop
+from queue import Empty
+from ..utilities import params
+
+
+class BacktestEventsQueue(object):
+    """Backtest Events Queue Class
+
+    The backtest events queue processes events in exactly the same order as the
+    events queue, first according to their intrinsic priority and then
+    according to the order in which they were placed into the queue. However,
+    because a backtest places and retrieves every event from a single thread,
+    the queue is implemented as a heap without any of the locking performed by
+    the thread-safe events queue. It should therefore not be used for live
+    trading.
+    """
+    def __init__(self):
+        """Initialize parameters of the backtest events queue."""
+        self.heap = []
+        self.count = 0
+        self.priority_table = dict(params.priority_table)
+
+    def put(self, event):
+        """Place an event into the backtest events queue.
+
+        Parameters
+        ----------
+        event: An event object.
+            The event object to be placed into the events queue. This can be one
+            of a market, signal, order, fill, manage, or rebalance event.
+        """
+        p = self.priority_table[
+            event.event_type, getattr(event, "trade_type", None)
+        ]
+        heappush(self.heap, (p, self.count, event))
+        self.count += 1
+
+    def register(self, event_type, priority):
+        """Set the priority of events of a custom type in this queue. The
+        priorities of the built-in event types cannot be changed, so that the
+        ordering of signal events by their trade type is preserved.
+
+        Parameters
+        ----------
+        event_type: Object.
+            The custom event type whose events are prioritized.
+        priority: Integer.
+            The priority of events of the custom type.
+        """
+        self.priority_table.update(
+            params.custom_priorities(event_type, priority)
+        )
+
+    def get(self, block=True, timeout=None):
+        """Retrieve the event with the highest priority from the backtest events
+        queue. Because no other thread can place events into the queue, an
+        empty exception is raised rather than blocking if the queue is empty.
+        """
+        if not self.heap:
+            raise Empty()
+
+        return heappop(self.heap)[2]
+
+    def empty(self):
+        """Whether or not there are no events in the backtest events queue."""
+        return not self.heap
+
+    def qsize(self):
+        """The number of events in the backtest events queue."""
+        return len(self.heap)
+
+    def clear(self):
+        """Remove all events from the backtest events queue."""
+        self.heap = []
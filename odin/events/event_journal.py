@@ -0,0 +1,367 @@
+import os
+import struct
+import numpy as np
+import pandas as pd
+from .event_types import (
+    MarketEvent, SignalEvent, OrderEvent, FillEvent, RebalanceEvent,
+    ManagementEvent
+)
+from ..utilities.params import Events, TradeTypes, Directions
+
+
+# Every record of the journal begins with a header giving the kind of the record
+# and the number of bytes in its payload.
+header = struct.Struct("<BI")
+# Record kinds.
+string_record, begin_record = 0, 1
+record_kinds = {
+    Events.market: 2, Events.signal: 3, Events.order: 4, Events.fill: 5,
+    Events.rebalance: 6, Events.management: 7,
+}
+# Payloads of the records of the portfolio events and the fund events, following
+# the date and time of the event.
+portfolio_payload = struct.Struct("<IIII")
+signal_payload = struct.Struct("<d")
+order_payload = struct.Struct("<q")
+fill_payload = struct.Struct("<qdd?")
+int64_field = struct.Struct("<q")
+uint32_field = struct.Struct("<I")
+panel_shape = struct.Struct("<III")
+bars_shape = struct.Struct("<IqI")
+
+
+class EventJournal(object):
+    """Event Journal Class
+
+    The event journal is an append-only binary record of the event stream that
+    is processed by a fund. Each market, signal, order, fill, rebalance and
+    management event handled by the fund is appended to the journal as a
+    compact record of fixed-width fields. Strings (symbols, portfolio
+    identifiers, trade types, directions and price fields) are interned: each
+    distinct string is written once and is thereafter referred to by an integer
+    identifier.
+
+    The record of a market event also contains the market data that was
+    available to the fund when the event was handled, so that the trading
+    session can be reproduced without the data source: the prices of the
+    session and the changes to the bars of the data handler since the previous
+    market event. Only the bars of new time periods are written for symbols that
+    were already selected, while the entire window of bars is written for newly
+    selected symbols.
+
+    Each time the fund begins trading a new run is started in the journal, so
+    that a journal may hold the event streams of several consecutive runs (for
+    instance, of a live-trading fund that is restarted every day). Events of
+    custom types are not recorded. If the fund stops while a record is being
+    written, then the incomplete record is ignored when the journal is read and
+    discarded when the journal is reopened.
+
+    Parameters
+    ----------
+    path: String.
+        The path of the journal file. If the file exists, then new records are
+        appended to it.
+    """
+    magic = b"ODINJRNL\x01"
+
+    def __init__(self, path):
+        """Initialize parameters of the event journal object."""
+        self.path = path
+        self.data_handler = None
+        self.strings = {}
+        self.bars_date, self.bars_symbols = None, set()
+        if os.path.isfile(path) and os.path.getsize(path) > 0:
+            # Recover the identifiers of the strings that have already been
+            # interned, and discard an incomplete record left at the end of the
+            # journal by a fund that stopped while it was being written.
+            end = len(self.magic)
+            for kind, p, end in self.__records(path):
+                if kind == string_record:
+                    s = bytes(p[uint32_field.size:]).decode("utf-8")
+                    self.strings[s] = len(self.strings)
+            self.file = open(path, "r+b")
+            self.file.truncate(end)
+            self.file.seek(end)
+        else:
+            self.file = open(path, "wb")
+            self.file.write(self.magic)
+
+    def attach(self, fund):
+        """Record the market data of the data handler of a fund alongside its
+        market events.
+
+        Parameters
+        ----------
+        fund: Fund object.
+            The fund whose event stream is recorded.
+        """
+        self.data_handler = fund.data_handler
+
+    def wrap_handler(self, event_type, handler):
+        """Create a function that records each event of the provided type before
+        it is handled. Handlers of custom event types are not wrapped.
+
+        Parameters
+        ----------
+        event_type: Object.
+            The event type of the events that will be handled.
+        handler: Function.
+            The function that handles events of the provided type.
+        """
+        if event_type not in record_kinds:
+            return handler
+
+        def journaled(event):
+            self.record(event)
+            return handler(event)
+
+        return journaled
+
+    def __write(self, kind, payload):
+        """Append a record to the journal."""
+        self.file.write(header.pack(kind, len(payload)))
+        self.file.write(payload)
+
+    def __intern(self, s):
+        """Retrieve the identifier of a string, writing the string to the
+        journal if it has not been interned.
+        """
+        if s not in self.strings:
+            self.strings[s] = len(self.strings)
+            self.__write(
+                string_record,
+                uint32_field.pack(self.strings[s]) + s.encode("utf-8")
+            )
+
+        return self.strings[s]
+
+    def __ids(self, strings):
+        """Encode an array of interned strings."""
+        return np.array(
+            [self.__intern(str(s)) for s in strings], dtype="<u4"
+        ).tobytes()
+
+    def __panel(self, items, dates, symbols, values):
+        """Encode the price fields, dates, symbols and values of a panel of
+        prices.
+        """
+        dates = pd.DatetimeIndex(dates).values.astype("datetime64[ns]")
+        return b"".join([
+            panel_shape.pack(len(items), len(dates), len(symbols)),
+            self.__ids(items), dates.astype("<i8").tobytes(),
+            self.__ids(symbols),
+            np.ascontiguousarray(values, dtype="<f8").tobytes(),
+        ])
+
+    def __bars(self):
+        """Encode the changes to the bars of the data handler since the
+        previous market event.
+        """
+        bars = self.data_handler.bars
+        dates, selected = bars.major_axis, list(bars.minor_axis)
+        start = dates[0].value if len(dates) > 0 else np.iinfo(np.int64).min
+        if self.bars_date is None:
+            n_new = len(dates)
+        else:
+            n_new = len(dates) - dates.searchsorted(self.bars_date, "right")
+        known = [s for s in selected if s in self.bars_symbols]
+        new = [s for s in selected if s not in self.bars_symbols]
+        view = bars.view()
+        rows = view[:, len(dates) - n_new:, bars.locate(known)]
+        columns = view[:, :, bars.locate(new)]
+
+        self.bars_symbols = set(selected)
+        if len(dates) > 0:
+            self.bars_date = dates[-1]
+
+        return b"".join([
+            bars_shape.pack(bars.capacity, start, len(selected)),
+            self.__ids(selected),
+            self.__panel(bars.items, dates[len(dates) - n_new:], known, rows),
+            self.__panel(bars.items, dates, new, columns),
+        ])
+
+    def begin(self):
+        """Begin a new run of the fund in the journal."""
+        self.bars_date, self.bars_symbols = None, set()
+        self.__write(begin_record, b"")
+
+    def record(self, event):
+        """Append an event to the journal.
+
+        Parameters
+        ----------
+        event: Event object.
+            The event to record. Events of custom types are ignored.
+        """
+        kind = record_kinds.get(event.event_type)
+        if kind is None:
+            return
+
+        payload = int64_field.pack(pd.Timestamp(event.datetime).value)
+        if event.event_type == Events.market:
+            prices = self.data_handler.prices
+            payload += self.__panel(
+                prices.items, prices.major_axis, prices.minor_axis,
+                prices.values
+            ) + self.__bars()
+        elif event.event_type in (Events.signal, Events.order, Events.fill):
+            payload += portfolio_payload.pack(
+                self.__intern(event.symbol),
+                self.__intern(event.trade_type.value),
+                self.__intern(event.direction.value),
+                self.__intern(event.portfolio_id)
+            )
+            if event.event_type == Events.signal:
+                payload += signal_payload.pack(event.suggested_proportion)
+            elif event.event_type == Events.order:
+                payload += order_payload.pack(event.quantity)
+            else:
+                payload += fill_payload.pack(
+                    event.quantity, event.fill_cost, event.commission,
+                    event.is_live
+                )
+
+        self.__write(kind, payload)
+
+    def flush(self):
+        """Write any buffered records to the journal file."""
+        self.file.flush()
+
+    def close(self):
+        """Close the journal file."""
+        self.file.close()
+
+    @classmethod
+    def __records(cls, path):
+        """Iterate over the kind and payload of every complete record in a
+        journal, together with the offset at which the record ends. An
+        incomplete record at the end of the journal is ignored.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        if not data.startswith(cls.magic):
+            raise ValueError("{} is not an event journal.".format(path))
+
+        buf, i = memoryview(data), len(cls.magic)
+        while i + header.size <= len(buf):
+            kind, n = header.unpack_from(buf, i)
+            i += header.size
+            if i + n > len(buf):
+                return
+            yield kind, buf[i:i + n], i + n
+            i += n
+
+    @classmethod
+    def read_strings(cls, path):
+        """Read the interned strings of a journal in the order of their
+        identifiers.
+
+        Parameters
+        ----------
+        path: String.
+            The path of the journal file.
+        """
+        return [
+            bytes(p[uint32_field.size:]).decode("utf-8")
+            for kind, p, _ in cls.__records(path) if kind == string_record
+        ]
+
+    @classmethod
+    def read(cls, path):
+        """Read the events recorded in a journal. For each event, the index of
+        the run in which it was recorded and the event are produced, together
+        with the market data that was recorded with it. The market data of a
+        market event is a dictionary containing the date ('date') and prices
+        ('prices') of the trading session, the capacity of the bars
+        ('capacity'), the date of the oldest bar in the window ('start_date'),
+        the selected symbols ('symbols'), the new bars of previously selected
+        symbols ('rows') and the entire window of bars of newly selected symbols
+        ('columns'). For other events the market data is None.
+
+        Parameters
+        ----------
+        path: String.
+            The path of the journal file.
+        """
+        strings, run = [], -1
+        kinds = {v: k for k, v in record_kinds.items()}
+
+        def ids(p, i, n):
+            values = np.frombuffer(p, dtype="<u4", count=n, offset=i)
+            return [strings[k] for k in values], i + 4 * n
+
+        def panel(p, i):
+            n_items, n_dates, n_symbols = panel_shape.unpack_from(p, i)
+            items, i = ids(p, i + panel_shape.size, n_items)
+            dates = np.frombuffer(p, dtype="<i8", count=n_dates, offset=i)
+            symbols, i = ids(p, i + 8 * n_dates, n_symbols)
+            n = n_items * n_dates * n_symbols
+            values = np.frombuffer(p, dtype="<f8", count=n, offset=i).reshape(
+                (n_items, n_dates, n_symbols)
+            )
+            return pd.Panel(
+                values.copy(), items=items,
+                major_axis=pd.DatetimeIndex(dates.astype("datetime64[ns]")),
+                minor_axis=symbols
+            ), i + 8 * n
+
+        for kind, p, _ in cls.__records(path):
+            if kind == string_record:
+                strings.append(bytes(p[uint32_field.size:]).decode("utf-8"))
+                continue
+            elif kind == begin_record:
+                run += 1
+                continue
+
+            event_type = kinds[kind]
+            date = pd.Timestamp(int64_field.unpack_from(p, 0)[0])
+            i, market = int64_field.size, None
+            if event_type == Events.market:
+                prices, i = panel(p, i)
+                capacity, start, n = bars_shape.unpack_from(p, i)
+                symbols, i = ids(p, i + bars_shape.size, n)
+                rows, i = panel(p, i)
+                columns, i = panel(p, i)
+                market = {
+                    "date": date, "prices": prices, "capacity": capacity,
+                    "start_date": (
+                        None if start == np.iinfo(np.int64).min
+                        else pd.Timestamp(start)
+                    ),
+                    "symbols": symbols, "rows": rows, "columns": columns,
+                }
+                event = MarketEvent(date)
+            elif event_type in (Events.signal, Events.order, Events.fill):
+                symbol, trade_type, direction, portfolio_id = [
+                    strings[k] for k in portfolio_payload.unpack_from(p, i)
+                ]
+                trade_type = TradeTypes(trade_type)
+                direction = Directions(direction)
+                i += portfolio_payload.size
+                if event_type == Events.signal:
+                    proportion, = signal_payload.unpack_from(p, i)
+                    event = SignalEvent(
+                        symbol, proportion, trade_type, direction, date,
+                        portfolio_id
+                    )
+                elif event_type == Events.order:
+                    quantity, = order_payload.unpack_from(p, i)
+                    event = OrderEvent(
+                        symbol, quantity, trade_type, direction, date,
+                        portfolio_id
+                    )
+                else:
+                    quantity, fill_cost, commission, is_live = (
+                        fill_payload.unpack_from(p, i)
+                    )
+                    event = FillEvent(
+                        symbol, quantity, trade_type, direction, fill_cost,
+                        commission, date, portfolio_id, is_live
+                    )
+            elif event_type == Events.rebalance:
+                event = RebalanceEvent(date)
+            else:
+                event = ManagementEvent(date)
+
+            yield run, event, market
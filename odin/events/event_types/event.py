@@ -22,12 +22,63 @@ class Event(object):
         A string indicator of the type of event that is being represented.
     datetime: Datetime object.
         The date and time at which the event was created.
+
+    Events are immutable values. Their attributes are stored in slots rather
+    than in a dictionary, so that the many events created during a backtest
+    occupy little memory, and each attribute can only be assigned once, when
+    the event is created. Two events are equal when they are of the same class
+    and their attributes are equal.
     """
+    __slots__ = ("datetime", "event_type")
+
     def __init__(self, event_type, datetime):
         """Initialize parameters of the event object."""
         self.datetime = datetime
         self.event_type = event_type
 
+    def __setattr__(self, name, value):
+        """Assign an attribute of the event, unless it has already been
+        assigned.
+        """
+        if hasattr(self, name):
+            raise AttributeError(
+                "Cannot modify attribute '{}' of an immutable event.".format(
+                    name
+                )
+            )
+        super(Event, self).__setattr__(name, value)
+
+    def __delattr__(self, name):
+        """Attributes of an event cannot be deleted."""
+        raise AttributeError(
+            "Cannot delete attribute '{}' of an immutable event.".format(name)
+        )
+
+    def __values(self):
+        """The values of the attributes of the event."""
+        values = tuple(
+            getattr(self, s, None) for c in type(self).__mro__
+            for s in c.__dict__.get("__slots__", ())
+        )
+        return values + tuple(sorted(getattr(self, "__dict__", {}).items()))
+
+    def __eq__(self, other):
+        """Events are equal if they are of the same class and have equal
+        attributes.
+        """
+        return (
+            type(self) is type(other) and
+            self.__values() == other.__values()
+        )
+
+    def __ne__(self, other):
+        """Events are unequal if they are not equal."""
+        return not self == other
+
+    def __hash__(self):
+        """Hash the class and the attributes of the event."""
+        return hash((type(self), ) + self.__values())
+
     def __str__(self):
         """String representation of the market event object."""
         return "{}\t{}".format(
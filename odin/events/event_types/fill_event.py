@@ -9,6 +9,8 @@ class FillEvent(PortfolioEvent):
     Stores the quantity of an instrument actually filled and at what price. In
     addition, stores the commission of the trade from the brokerage.
     """
+    __slots__ = ("quantity", "fill_cost", "commission", "price", "is_live")
+
     def __init__(
             self, symbol, quantity, trade_type, direction, fill_cost,
             commission, datetime, portfolio_id, is_live
@@ -6,4 +6,5 @@ class FundEvent(Event):
     This class is to capture all universal properties of events impacting the
     whole fund.
     """
+    __slots__ = ()
 
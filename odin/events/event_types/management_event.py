@@ -9,6 +9,8 @@ class ManagementEvent(FundEvent):
     Typically, this is some percentage of the assets-under-management (AUM) and
     another percentage of the returns.
     """
+    __slots__ = ()
+
     def __init__(self, datetime):
         """Initialize parameters of the management event object."""
         super(ManagementEvent, self).__init__(Events.management, datetime)
@@ -10,6 +10,8 @@ class MarketEvent(Event):
     ----------
     datetime: Refer to base class documentation.
     """
+    __slots__ = ()
+
     def __init__(self, datetime):
         """Initialize parameters of the market event object."""
         super(MarketEvent, self).__init__(Events.market, datetime)
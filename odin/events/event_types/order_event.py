@@ -9,6 +9,8 @@ class OrderEvent(PortfolioEvent):
     contains a symbol (e.g. 'GOOG'), a type ('BUY', 'SELL', or 'EXIT'),
     quantity, and a direction (long or short).
     """
+    __slots__ = ("quantity", )
+
     def __init__(
             self, symbol, quantity, trade_type, direction, datetime,
             portfolio_id
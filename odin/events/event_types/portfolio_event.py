@@ -19,6 +19,8 @@ class PortfolioEvent(Event):
     portfolio_id: String.
         A unique identifier assigned to the portfolio.
     """
+    __slots__ = ("symbol", "trade_type", "direction", "portfolio_id")
+
     def __init__(
             self, symbol, trade_type, direction, event_type, datetime,
             portfolio_id
@@ -10,6 +10,8 @@ class RebalanceEvent(FundEvent):
     For many cases, this will be full dollar-neutrality, corresponding to an
     equal split of equity. This event triggers rebalancing.
     """
+    __slots__ = ()
+
     def __init__(self, datetime):
         """Initialize parameters of the rebalance event object."""
         super(RebalanceEvent, self).__init__(Events.rebalance, datetime)
@@ -8,6 +8,8 @@ class SignalEvent(PortfolioEvent):
     Handles the event of sending a Signal from a Strategy object. This is
     received by a Portfolio object and acted upon.
     """
+    __slots__ = ("suggested_proportion", )
+
     def __init__(
             self,
             symbol,
@@ -11,11 +11,19 @@ class EventsQueue(PriorityQueue):
     second means of prioritization is used to enforce the idea that, for
     example, signal events placed into the queue before other signal events are
     inherently more desirable than signal events placed into the queue later.
+
+    The events queue is thread-safe and is therefore appropriate for live
+    trading, where events may be placed into the queue by other threads. For
+    single-threaded backtests, the backtest events queue offers the same
+    ordering without the overhead of locking.
     """
     def __init__(self):
         """Initialize parameters of the events queue."""
         super(EventsQueue, self).__init__()
         self.count = 0
+        # Each queue owns its priorities so that custom event types registered
+        # with one queue do not affect the others.
+        self.priority_table = dict(params.priority_table)
 
     def put(self, event):
         """Place an event into the events queue. An item is placed into the
@@ -31,13 +39,28 @@ class EventsQueue(PriorityQueue):
         """
         # Extract the priority for the event. We also differentiate between buy
         # and sell event types in the case of a signal event.
-        p = params.priority_dict[event.event_type]
-        if event.event_type == params.Events.signal:
-            p = p[event.trade_type]
-
+        p = self.priority_table[
+            event.event_type, getattr(event, "trade_type", None)
+        ]
         super(EventsQueue, self).put((p, self.count, event))
         self.count += 1
 
+    def register(self, event_type, priority):
+        """Set the priority of events of a custom type in this queue. The
+        priorities of the built-in event types cannot be changed, so that the
+        ordering of signal events by their trade type is preserved.
+
+        Parameters
+        ----------
+        event_type: Object.
+            The custom event type whose events are prioritized.
+        priority: Integer.
+            The priority of events of the custom type.
+        """
+        self.priority_table.update(
+            params.custom_priorities(event_type, priority)
+        )
+
     def get(self, *args, **kwargs):
         """Retrieve an object from the events queue. An object is retrieved from
         the events queue and the count of objects of that type in the events
@@ -48,6 +71,7 @@ class EventsQueue(PriorityQueue):
 
     def clear(self):
         """Remove all events from the events queue."""
-        while not self.empty():
-            self.get(False)
+        with self.mutex:
+            self.queue = []
+            self.not_full.notify_all()
 
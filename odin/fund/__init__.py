@@ -1,2 +1,4 @@
 from .fund import Fund
 from .simulated_fund import SimulatedFund
+from .vectorized_simulated_fund import VectorizedSimulatedFund
+from .fund_profiler import FundProfiler
@@ -15,6 +15,13 @@ class Fund(object):
     The fund object is also responsible for rebalancing portfolios according to
     a specified timeline.
 
+    Events are dispatched through a table that maps each event type to the
+    function that handles it. Handlers for the built-in event types are
+    registered when the fund is constructed, and handlers for custom event types
+    can be registered with the `register` method. Whether or not an event is
+    printed is likewise decided when its handler is registered rather than when
+    each event is processed.
+
     Parameters
     ----------
     data_handler: Object inheriting from the abstract data handler class.
@@ -32,10 +39,16 @@ class Fund(object):
     verbosity_level: Integer (Optional)
         Determines the amount of I/O generated for logging and debugging
         purposes.
+    profiler: Fund profiler object (Optional)
+        When provided, the time spent handling each event type and in each of
+        the components of the fund is recorded by the profiler.
+    journal: Event journal object (Optional)
+        When provided, every event handled by the fund is appended to the
+        journal together with the market data of each trading session.
     """
     def __init__(
             self, data_handler, execution_handler, fund_handler, delay,
-            verbosity_level=0
+            verbosity_level=0, profiler=None, journal=None
     ):
         """Initialize parameters of the fund object."""
         self.data_handler = data_handler
@@ -45,6 +58,103 @@ class Fund(object):
         # Set the verbosity parameter that will control the amount of output to
         # the standard out.
         self.verbosity_level = verbosity_level
+        self.print_portfolios = Verbosities.portfolio.value <= verbosity_level
+        # Time the components of the fund if it is being profiled. This must be
+        # done before the handlers are registered so that they are timed too.
+        self.profiler = profiler
+        if profiler is not None:
+            profiler.attach(self)
+        self.journal = journal
+        if journal is not None:
+            journal.attach(self)
+        # Register the handlers of each of the built-in event types.
+        self.handlers = {}
+        self.register(Events.market, self.__process_market_event)
+        self.register(Events.signal, self.__process_signal_event)
+        self.register(Events.order, self.__process_order_event)
+        self.register(Events.fill, self.__process_fill_event)
+        self.register(Events.rebalance, self.__process_rebalance_event)
+        self.register(Events.management, self.__process_management_event)
+
+    def register(self, event_type, handler, priority=None, verbosity=None):
+        """Register the function that handles events of the provided type,
+        replacing any existing handler for that type.
+
+        Parameters
+        ----------
+        event_type: Object.
+            The event type of the events that will be handled.
+        handler: Function.
+            A function that accepts an event of the provided type as its only
+            argument.
+        priority (Optional): Integer.
+            The priority of events of this type in the events queue of the data
+            handler. This must be provided for custom event types and cannot be
+            provided for the built-in event types, whose priorities are fixed.
+        verbosity (Optional): Integer.
+            The minimum verbosity level at which events of this type are
+            printed. By default this is the verbosity of the event type, and
+            events of custom types are not printed.
+        """
+        if self.journal is not None:
+            handler = self.journal.wrap_handler(event_type, handler)
+        if self.profiler is not None:
+            handler = self.profiler.wrap_handler(event_type, handler)
+        if priority is not None:
+            self.data_handler.events.register(event_type, priority)
+        if verbosity is None:
+            verbosity = verbosity_dict.get(event_type, float("inf"))
+
+        if verbosity <= self.verbosity_level:
+            def verbose_handler(event):
+                handler(event)
+                print(event)
+
+            self.handlers[event_type] = verbose_handler
+        else:
+            self.handlers[event_type] = handler
+
+    def __process_market_event(self, market_event):
+        """Because the strategy object will sometimes make use of holdings
+        information, the portfolio is updated before signals are generated.
+        """
+        fh = self.fund_handler
+        for s, p in zip(fh.strategies, fh.portfolios):
+            p.process_market_event(market_event)
+            s.generate_signals()
+
+        # Check for a rebalance or management event.
+        fh.process_market_event(market_event)
+
+    def __process_signal_event(self, signal_event):
+        """Pass a signal event to the portfolio that generated it."""
+        self.port_dict[signal_event.portfolio_id].process_signal_event(
+            signal_event
+        )
+
+    def __process_order_event(self, order_event):
+        """Pass an order event to the execution handler."""
+        self.execution_handler.execute_order(order_event)
+
+    def __process_fill_event(self, fill_event):
+        """Pass a fill event to the portfolio that placed the order."""
+        self.port_dict[fill_event.portfolio_id].process_fill_event(fill_event)
+
+    def __process_rebalance_event(self, rebalance_event):
+        """Rebalance the portfolios of the fund."""
+        self.fund_handler.rebalance()
+
+    def __process_management_event(self, management_event):
+        """Perform management of the fund."""
+        self.fund_handler.manage()
+
+    def stop_trading(self):
+        """Determine whether or not trading should be stopped before the data
+        handler has exhausted its bar data. This is evaluated after the
+        portfolios have processed their post events on each trading session. By
+        default, trading is never stopped early.
+        """
+        return False
 
     def trade(self):
         """Trade using the strategy in either a backtest or live-trading
@@ -55,15 +165,19 @@ class Fund(object):
         """
         # Create shortened variable names for convenience.
         dh = self.data_handler
-        eh = self.execution_handler
-        fh = self.fund_handler
         events = dh.events
-        ports, strats = fh.portfolios, fh.strategies
-        port_dict = {p.portfolio_handler.portfolio_id: p for p in ports}
+        handlers = self.handlers
+        profiler, journal = self.profiler, self.journal
+        ports = self.fund_handler.portfolios
+        self.port_dict = {p.portfolio_handler.portfolio_id: p for p in ports}
+        if journal is not None:
+            journal.begin()
 
         # Sit in a while loop and await new market data or a cease-and-desist
         # indicator is recognized.
         while True:
+            if profiler is not None:
+                profiler.begin_session()
             # Request pricing data.
             dh.request_prices()
             # Perform trading until the data handler signals that bar data has
@@ -71,52 +185,45 @@ class Fund(object):
             if not dh.continue_trading:
                 break
 
-            # Process events generated by the latest market data. We also check
-            # event type to ensure that events are properly handled by functions
-            # meant to process that kind of event.
+            # Process events generated by the latest market data. Each event is
+            # passed to the handler registered for its event type.
             while not events.empty():
                 e = events.get(False)
-                e_type = e.event_type
-
-                if e_type == Events.market:
-                    # Because the strategy object will sometimes make use of
-                    # holdings information, we should first update the
-                    # portfolio before generating signals.
-                    for s, p in zip(strats, ports):
-                        p.process_market_event(e)
-                        s.generate_signals()
-
-                    # Check for a rebalance or management event.
-                    self.fund_handler.process_market_event(e)
-                elif e_type == Events.signal:
-                    port_dict[e.portfolio_id].process_signal_event(e)
-                elif e_type == Events.order:
-                    eh.execute_order(e)
-                elif e_type == Events.fill:
-                    port_dict[e.portfolio_id].process_fill_event(e)
-                elif e_type == Events.rebalance:
-                    self.fund_handler.rebalance()
-                elif e_type == Events.management:
-                    self.fund_handler.manage()
-                else:
-                    raise ValueError("Invalid event type: {}".format(e_type))
-
-                # Control I/O.
-                if verbosity_dict[e_type] <= self.verbosity_level:
-                    print(e)
+                try:
+                    handler = handlers[e.event_type]
+                except KeyError:
+                    raise ValueError(
+                        "Invalid event type: {}".format(e.event_type)
+                    )
+                handler(e)
 
             else:
                 # Perform processing after all of the time periods events have
                 # been processed.
                 for p in ports:
                     p.process_post_events()
-                    if Verbosities.portfolio.value <= self.verbosity_level:
+                    if self.print_portfolios:
                         print(p.portfolio_handler.state)
 
+                # End the trading session early if the fund should stop trading.
+                if self.stop_trading():
+                    dh.continue_trading = False
+                    if profiler is not None:
+                        profiler.end_session(dh.current_date)
+                    break
+
                 # Update the historical price record.
                 dh.update()
 
+            if profiler is not None:
+                profiler.end_session(dh.current_date)
+            if journal is not None:
+                journal.flush()
+
             # Delay the acquisition of new market data.
             if self.delay > 0:
                 sleep(self.delay)
 
+        # Ensure that the records of a session ended early are written.
+        if journal is not None:
+            journal.flush()
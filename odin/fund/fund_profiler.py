@@ -0,0 +1,252 @@
+import json
+import numpy as np
+import pandas as pd
+from time import perf_counter
+from functools import wraps
+
+
+class FundProfiler(object):
+    """Fund Profiler Class
+
+    The fund profiler measures where the time of a backtest (or of a session of
+    live trading) is spent. When a fund is given a profiler, the function that
+    handles each event type is timed, as are the methods of the components of
+    the fund that do the work of each trading session: requesting prices and
+    updating the bars in the data handler, processing market, signal, fill and
+    post events in the portfolios, generating signals in the strategies and
+    executing orders in the execution handler. The profiler also records the
+    duration of each trading session and the number of events waiting in the
+    events queue whenever an event is handled.
+
+    Every timed call is recorded as a span with a name, a category, a start
+    time and a duration. The spans may be summarized in a pandas data frame
+    with the number of calls and the total, mean, percentile and maximum wall
+    time of each name, or exported as trace events in the JSON format of the
+    Chrome trace viewer (chrome://tracing), where the nesting of the calls
+    within each trading session can be inspected.
+
+    A fund without a profiler neither wraps its handlers nor its components, so
+    profiling costs nothing when it is disabled.
+
+    Parameters
+    ----------
+    clock (Optional): Function.
+        A function returning the current time in seconds. By default, this is
+        the performance counter.
+    """
+    def __init__(self, clock=perf_counter):
+        """Initialize parameters of the fund profiler object."""
+        self.clock = clock
+        self.origin = clock()
+        self.events = None
+        self.spans = []
+        self.sessions = []
+        self.depths = []
+        self.session_start = None
+
+    def wrap(self, name, category, function):
+        """Create a function that records a span every time that the provided
+        function is called.
+
+        Parameters
+        ----------
+        name: String.
+            The name of the spans.
+        category: String.
+            The category of the spans.
+        function: Function.
+            The function to time.
+        """
+        clock, spans = self.clock, self.spans
+
+        @wraps(function)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                spans.append((name, category, start, clock() - start))
+
+        return timed
+
+    def wrap_handler(self, event_type, handler):
+        """Create a function that records a span every time that an event of the
+        provided type is handled, together with the number of events that remain
+        in the events queue.
+
+        Parameters
+        ----------
+        event_type: Object.
+            The event type of the events that will be handled.
+        handler: Function.
+            The function that handles events of the provided type.
+        """
+        name = getattr(event_type, "value", str(event_type))
+        timed = self.wrap(name, "event", handler)
+        clock, depths = self.clock, self.depths
+
+        def profiled(event):
+            if self.events is not None:
+                depths.append((clock(), self.events.qsize()))
+            return timed(event)
+
+        return profiled
+
+    def instrument(self, obj, method, category, name=None):
+        """Replace a method of an object with a timed version of it.
+
+        Parameters
+        ----------
+        obj: Object.
+            The object whose method is timed.
+        method: String.
+            The name of the method.
+        category: String.
+            The category of the spans.
+        name (Optional): String.
+            The name of the spans. By default, this is the name of the method.
+        """
+        function = getattr(obj, method, None)
+        if function is not None:
+            setattr(obj, method, self.wrap(name or method, category, function))
+
+    def attach(self, fund):
+        """Time the methods of the components of a fund that are invoked during
+        each trading session, and record the depth of its events queue.
+
+        Parameters
+        ----------
+        fund: Fund object.
+            The fund whose trading is profiled.
+        """
+        dh = fund.data_handler
+        self.events = dh.events
+        self.instrument(dh, "request_prices", "data")
+        self.instrument(dh, "update", "data")
+        self.instrument(
+            getattr(dh, "price_handler", None), "request_prices", "data",
+            "price_handler.request_prices"
+        )
+        self.instrument(fund.execution_handler, "execute_order", "execution")
+        for s in fund.fund_handler.strategies:
+            self.instrument(s, "generate_signals", "strategy")
+        for p in fund.fund_handler.portfolios:
+            for method in (
+                    "process_market_event", "process_signal_event",
+                    "process_fill_event", "process_post_events"
+            ):
+                self.instrument(p, method, "portfolio")
+
+    def begin_session(self):
+        """Record the start of a trading session."""
+        self.session_start = self.clock()
+
+    def end_session(self, date):
+        """Record the end of the trading session on the provided date.
+
+        Parameters
+        ----------
+        date: Datetime object.
+            The date of the trading session.
+        """
+        start = self.session_start
+        self.sessions.append((date, start, self.clock() - start))
+
+    def summary(self):
+        """Summarize the spans of each name by the number of calls and the
+        total, mean, median, 90th and 99th percentile and maximum wall time, in
+        seconds. The rows are sorted by total wall time. The wall time of a span
+        includes the wall time of any spans nested within it.
+        """
+        columns = [
+            "category", "count", "total", "mean", "p50", "p90", "p99", "max"
+        ]
+        if not self.spans:
+            return pd.DataFrame(columns=columns)
+
+        spans = pd.DataFrame(
+            self.spans, columns=["name", "category", "start", "duration"]
+        )
+        rows = []
+        for (name, category), d in spans.groupby(["name", "category"]):
+            d = d["duration"].values
+            p50, p90, p99 = np.percentile(d, [50, 90, 99])
+            rows.append((
+                name, category, len(d), d.sum(), d.mean(), p50, p90, p99,
+                d.max()
+            ))
+
+        m = pd.DataFrame(rows, columns=["name"] + columns).set_index("name")
+        return m.sort_values("total", ascending=False)
+
+    def session_summary(self):
+        """Report the wall time of each trading session, in seconds, together
+        with the number of events handled and the largest number of events
+        waiting in the events queue during the session.
+        """
+        columns = ["duration", "events", "max depth"]
+        if not self.sessions:
+            return pd.DataFrame(columns=columns)
+
+        dates, starts, durations = zip(*self.sessions)
+        starts, ends = np.array(starts), np.array(starts) + np.array(durations)
+        if self.depths:
+            times, depths = map(np.array, zip(*self.depths))
+        else:
+            times, depths = np.empty(0), np.empty(0, dtype=int)
+        # Assign each depth of the events queue to the session during which it
+        # was recorded.
+        i = np.searchsorted(times, starts)
+        j = np.searchsorted(times, ends, side="right")
+        max_depths = [depths[a:b].max() if b > a else 0 for a, b in zip(i, j)]
+
+        return pd.DataFrame({
+            "duration": durations, "events": j - i, "max depth": max_depths
+        }, index=pd.Index(dates, name="date"), columns=columns)
+
+    def queue_depth(self):
+        """The number of events waiting in the events queue each time that an
+        event was handled, indexed by the number of seconds since the profiler
+        was created.
+        """
+        if not self.depths:
+            return pd.Series([], dtype=int)
+
+        times, depths = zip(*self.depths)
+        return pd.Series(
+            depths, index=np.array(times) - self.origin, name="depth"
+        )
+
+    def chrome_trace(self, path=None):
+        """Export the spans, the trading sessions and the depth of the events
+        queue as trace events in the JSON format of the Chrome trace viewer.
+        Timestamps are measured in microseconds since the profiler was created.
+
+        Parameters
+        ----------
+        path (Optional): String.
+            The path of the file to which the trace is written. If not provided,
+            then the trace is only returned.
+        """
+        def us(t):
+            return (t - self.origin) * 1e6
+
+        trace = [{
+            "name": str(date), "cat": "session", "ph": "X", "ts": us(start),
+            "dur": duration * 1e6, "pid": 0, "tid": 0
+        } for date, start, duration in self.sessions]
+        trace.extend({
+            "name": name, "cat": category, "ph": "X", "ts": us(start),
+            "dur": duration * 1e6, "pid": 0, "tid": 0
+        } for name, category, start, duration in self.spans)
+        trace.extend({
+            "name": "queue depth", "ph": "C", "ts": us(t), "pid": 0,
+            "args": {"depth": depth}
+        } for t, depth in self.depths)
+        trace = {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+        if path is not None:
+            with open(path, "w") as f:
+                json.dump(trace, f)
+
+        return trace
@@ -1,6 +1,7 @@
 import pandas as pd
 from .fund import Fund
 from .. import metrics
+from ..utilities.params import StopReasons
 
 
 class SimulatedFund(Fund):
@@ -10,15 +11,65 @@ class SimulatedFund(Fund):
     metrics for a collection of backtested portfolios. In particular, all of the
     metrics across the individual portfolios, as well as for the fund as a
     whole, are placed into a single pandas data frame.
+
+    A simulated fund may be given stop conditions that are evaluated at the
+    conclusion of every trading session. When any of them is met the backtest
+    ends early; the performance summary then covers the trading sessions up to
+    that point and the reason for stopping is recorded.
+
+    Parameters
+    ----------
+    data_handler, execution_handler, fund_handler, verbosity_level, profiler,
+        journal: Refer to base class documentation.
+    stop_conditions (Optional): List of stop condition objects.
+        Conditions under which the backtest should be ended early.
     """
     def __init__(
             self, data_handler, execution_handler, fund_handler,
-            verbosity_level=0
+            verbosity_level=0, stop_conditions=None, profiler=None,
+            journal=None
     ):
         """Initialize parameters of the simulated fund object."""
         super(SimulatedFund, self).__init__(
-            data_handler, execution_handler, fund_handler, 0, verbosity_level
+            data_handler, execution_handler, fund_handler, 0, verbosity_level,
+            profiler, journal
         )
+        self.stop_conditions = list(stop_conditions) if stop_conditions else []
+        self.stop_reason, self.stop_date = None, None
+
+    def add_stop_condition(self, stop_condition):
+        """Add a condition under which the backtest should be ended early.
+
+        Parameters
+        ----------
+        stop_condition: Object inheriting from the abstract stop condition
+            class.
+            The condition to evaluate at the conclusion of each trading session.
+        """
+        self.stop_conditions.append(stop_condition)
+
+    def stop_trading(self):
+        """Extension of the fund method. Trading is stopped when any of the stop
+        conditions of the fund is met, in which case the reason for stopping
+        and the date of the final trading session are recorded.
+        """
+        for condition in self.stop_conditions:
+            reason = condition.check(self)
+            if reason is not None:
+                self.stop_reason = reason
+                self.stop_date = self.data_handler.current_date
+                return True
+
+        return False
+
+    def trade(self):
+        """Extension of the fund method. Once trading has concluded, the reason
+        for concluding is recorded.
+        """
+        self.stop_reason, self.stop_date = None, None
+        super(SimulatedFund, self).trade()
+        if self.stop_reason is None:
+            self.stop_reason = StopReasons.completed
 
     def performance_summary(self):
         """Construct performance summaries for each of the strategies utilized
@@ -31,7 +82,7 @@ class SimulatedFund(Fund):
         # and the equity and number of positions on a day-by-day basis.
         m = pd.DataFrame()
         self.history = pd.DataFrame(
-            index=self.fund_handler.portfolios[0].history.states.keys(),
+            index=self.fund_handler.portfolios[0].history.dates,
             columns=["equity", "n_positions"]
         ).fillna(0.0)
 
@@ -0,0 +1,3 @@
+from .abstract_stop_condition import AbstractStopCondition
+from .max_drawdown_stop_condition import MaxDrawdownStopCondition
+from .rolling_sharpe_stop_condition import RollingSharpeStopCondition
@@ -0,0 +1,45 @@
+from abc import ABCMeta, abstractmethod
+
+
+class AbstractStopCondition(object):
+    """Abstract Stop Condition Class
+
+    Stop conditions allow a simulated fund to terminate a backtest early, for
+    instance because the portfolios have performed so poorly that the remainder
+    of the backtest is not worth computing. The stop conditions of a fund are
+    evaluated at the conclusion of every trading session, after the portfolios
+    have processed their post events, and therefore have access to the metrics
+    that the portfolios accumulate online.
+
+    Parameters
+    ----------
+    portfolio_ids (Optional): List of strings.
+        The identifiers of the portfolios to which the condition applies. By
+        default, the condition applies to every portfolio of the fund.
+    """
+    __metaclass__ = ABCMeta
+
+    def __init__(self, portfolio_ids=None):
+        """Initialize parameters of the abstract stop condition object."""
+        self.portfolio_ids = portfolio_ids
+
+    def portfolios(self, fund):
+        """The portfolios of the fund to which the condition applies."""
+        return [
+            p for p in fund.fund_handler.portfolios
+            if self.portfolio_ids is None or
+            p.portfolio_handler.portfolio_id in self.portfolio_ids
+        ]
+
+    @abstractmethod
+    def check(self, fund):
+        """Determine whether or not the backtest of the fund should be stopped.
+        If so, the reason for stopping the backtest is returned; otherwise the
+        function returns None.
+
+        Parameters
+        ----------
+        fund: Simulated fund object.
+            The fund whose backtest may be stopped.
+        """
+        raise NotImplementedError()
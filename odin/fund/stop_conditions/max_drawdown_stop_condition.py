@@ -0,0 +1,29 @@
+from .abstract_stop_condition import AbstractStopCondition
+from ...utilities.params import StopReasons
+
+
+class MaxDrawdownStopCondition(AbstractStopCondition):
+    """Maximum Drawdown Stop Condition Class
+
+    Stops the backtest as soon as the drawdown of any of the portfolios exceeds
+    a maximum percentage of the high water mark of its equity.
+
+    Parameters
+    ----------
+    max_drawdown: Float.
+        The largest drawdown, as a fraction of the high water mark, that is
+        tolerated before the backtest is stopped.
+    portfolio_ids (Optional): Refer to base class documentation.
+    """
+    def __init__(self, max_drawdown, portfolio_ids=None):
+        """Initialize parameters of the maximum drawdown stop condition
+        object.
+        """
+        super(MaxDrawdownStopCondition, self).__init__(portfolio_ids)
+        self.max_drawdown = max_drawdown
+
+    def check(self, fund):
+        """Implementation of abstract base class method."""
+        for p in self.portfolios(fund):
+            if p.online_metrics.drawdown > self.max_drawdown:
+                return StopReasons.max_drawdown
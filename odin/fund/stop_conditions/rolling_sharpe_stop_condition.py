@@ -0,0 +1,77 @@
+import numpy as np
+from collections import deque
+from .abstract_stop_condition import AbstractStopCondition
+from ...utilities.params import StopReasons
+
+
+class RollingSharpeStopCondition(AbstractStopCondition):
+    """Rolling Sharpe Ratio Stop Condition Class
+
+    Stops the backtest when the annualized Sharpe ratio of the returns of any
+    of the portfolios over a rolling window of trading sessions falls below a
+    threshold. The returns within the window, as well as their sum and sum of
+    squares, are maintained as the backtest progresses so that the rolling
+    Sharpe ratio is updated in constant time.
+
+    Parameters
+    ----------
+    min_sharpe: Float.
+        The smallest rolling Sharpe ratio that is tolerated before the backtest
+        is stopped.
+    window: Integer.
+        The number of trading sessions over which the Sharpe ratio is computed.
+        The condition is not evaluated until the window is full.
+    periods (Optional): Float.
+        The annualization constant for computing the Sharpe ratio.
+    portfolio_ids (Optional): Refer to base class documentation.
+    """
+    def __init__(self, min_sharpe, window, periods=252.0, portfolio_ids=None):
+        """Initialize parameters of the rolling Sharpe ratio stop condition
+        object.
+        """
+        super(RollingSharpeStopCondition, self).__init__(portfolio_ids)
+        self.min_sharpe = min_sharpe
+        self.window = window
+        self.periods = periods
+        self.__windows = {}
+
+    def rolling_sharpe(self, portfolio):
+        """Update the rolling window of returns of the portfolio with the most
+        recently recorded equity and compute the rolling Sharpe ratio. If the
+        window is not yet full, then the Sharpe ratio is not defined.
+        """
+        metrics = portfolio.online_metrics
+        w = self.__windows.setdefault(portfolio, {
+            "returns": deque(), "sum": 0.0, "sum_sq": 0.0, "equity": None,
+            "n_states": 0
+        })
+        # Only a newly recorded equity produces a new return.
+        if w["n_states"] != metrics.n_states:
+            if w["equity"] is not None:
+                returns = metrics.equity / w["equity"] - 1.
+                w["returns"].append(returns)
+                w["sum"] += returns
+                w["sum_sq"] += returns ** 2
+                if len(w["returns"]) > self.window:
+                    old = w["returns"].popleft()
+                    w["sum"] -= old
+                    w["sum_sq"] -= old ** 2
+
+            w["equity"], w["n_states"] = metrics.equity, metrics.n_states
+
+        n = len(w["returns"])
+        if n < self.window or n < 2:
+            return np.nan
+
+        mean = w["sum"] / n
+        var = max(w["sum_sq"] - n * mean ** 2, 0.0) / (n - 1)
+        if var == 0.0:
+            return np.nan
+
+        return np.sqrt(self.periods) * mean / np.sqrt(var)
+
+    def check(self, fund):
+        """Implementation of abstract base class method."""
+        for p in self.portfolios(fund):
+            if self.rolling_sharpe(p) < self.min_sharpe:
+                return StopReasons.min_sharpe
@@ -0,0 +1,270 @@
+import datetime as dt
+import numpy as np
+import pandas as pd
+from .simulated_fund import SimulatedFund
+from ..events import OrderEvent, FillEvent
+from ..utilities import period_dict, mark_to_market
+from ..utilities.params import (
+    Actions, Directions, TradeTypes, IOFiles, StopReasons, action_dict,
+    ib_commission
+)
+
+
+class VectorizedSimulatedFund(SimulatedFund):
+    """Vectorized Simulated Fund Class
+
+    The vectorized simulated fund backtests strategies that are composed of the
+    strategy mixins without streaming events. Rather than generating a signal,
+    order and fill event for every symbol on every trading session, the buy,
+    sell and exit indicators of each strategy are evaluated once as boolean
+    matrices whose rows are dates and whose columns are symbols. On each trading
+    session only the trades that are actually executed are applied to the
+    portfolios, with fill prices, transaction costs and commissions computed for
+    all of the session's liquidations at once.
+
+    The trades are executed in the same order, at the same prices and with the
+    same book-keeping as when the fund is traded with events, so that the
+    portfolio histories and performance summaries are identical. Orders are
+    sized using the suggested proportions of the strategy, as they are by the
+    suggested proportion position handler. Funds that are periodically
+    rebalanced or managed are not supported.
+
+    Parameters
+    ----------
+    data_handler: Database data handler object.
+        The data handler that determines the trading sessions of the backtest,
+        the source of the price data and the symbol handler that selects the
+        symbols to trade.
+    execution_handler: Simulated execution handler object.
+        The execution handler whose transaction cost is applied to every fill.
+    fund_handler: Fund handler object.
+        The fund handler containing the strategies and portfolios to backtest.
+    verbosity_level: Integer (Optional)
+        Determines the amount of I/O generated for logging and debugging
+        purposes.
+    stop_conditions (Optional): List of stop condition objects.
+        Conditions under which the backtest should be ended early.
+    """
+    def __init__(
+            self, data_handler, execution_handler, fund_handler,
+            verbosity_level=0, stop_conditions=None
+    ):
+        """Initialize parameters of the vectorized simulated fund object."""
+        super(VectorizedSimulatedFund, self).__init__(
+            data_handler, execution_handler, fund_handler, verbosity_level,
+            stop_conditions
+        )
+        rebalance = period_dict.get(fund_handler.rebalance_period, 1)
+        manage = period_dict.get(fund_handler.manage_period, 1)
+        if rebalance > 1 or manage > 1:
+            raise ValueError(
+                "The vectorized simulated fund does not support rebalancing or "
+                "management events."
+            )
+
+    def __matrix(self, values, dtype):
+        """Broadcast the output of a vectorized strategy method to an array
+        whose rows are the dates and whose columns are the symbols of the bars.
+        """
+        shape = (len(self.dates), len(self.symbols))
+        if isinstance(values, pd.DataFrame):
+            values = values.reindex(index=self.dates, columns=self.symbols)
+            return values.values.astype(dtype)
+        else:
+            return np.full(shape, values, dtype=dtype)
+
+    def __fill(self, portfolio, date, symbols, quantities, trade_types,
+               directions, t):
+        """Execute orders for the provided symbols and quantities at the
+        simulated fill price of the trading session. The fill costs and
+        commissions of all of the orders are computed at once before the fills
+        are processed in order by the portfolio.
+        """
+        cols = np.array([self.columns[s] for s in symbols], dtype=int)
+        low, high = self.low[t, cols], self.high[t, cols]
+        # The fill price is the average of the day's high and low, ignoring
+        # either when it is missing.
+        fill_price = np.where(
+            np.isnan(low), high, np.where(np.isnan(high), low, (low + high) / 2.)
+        )
+        fill_cost = fill_price * quantities
+        sell = np.array([
+            action_dict[(d, tt)] == Actions.sell
+            for d, tt in zip(directions, trade_types)
+        ], dtype=bool)
+        tc = self.execution_handler.transaction_cost
+        fill_cost *= np.where(sell, 1. - tc, 1. + tc)
+        commission = ib_commission(quantities, fill_price)
+
+        pid = portfolio.portfolio_handler.portfolio_id
+        for i, s in enumerate(symbols):
+            order_event = OrderEvent(
+                s, int(quantities[i]), trade_types[i], directions[i], date, pid
+            )
+            if trade_types[i] == TradeTypes.buy_trade:
+                portfolio.portfolio_handler.add_pending_position(order_event)
+            portfolio.process_fill_event(FillEvent.from_order_event(
+                order_event, fill_cost[i], commission[i], False
+            ))
+
+    def __trade_session(self, portfolio, date, t, r, selected):
+        """Trade a single portfolio on a trading session. The trading session
+        is the t-th date of the bars, and signals are generated from the bars
+        of the r-th date, which is the preceding date.
+        """
+        ph = portfolio.portfolio_handler
+        ind = self.indicators[portfolio]
+        # Value the positions using the opening price of the trading session.
+        positions = list(ph.filled_positions.values())
+        cols = np.array([self.columns[p.symbol] for p in positions], dtype=int)
+        missing = [
+            p.symbol for p, c in zip(positions, cols)
+            if np.isnan(self.prices[:, t, c]).all()
+        ]
+        if missing:
+            raise ValueError(
+                "Positions {} in portfolio {} do not have associated price "
+                "data on {}.".format(
+                    ", ".join(missing), ph.portfolio_id,
+                    date.strftime(IOFiles.date_format.value)
+                )
+            )
+        mark_to_market(ph.filled_positions, self.open[t, cols])
+
+        if r < 0:
+            return
+
+        # Determine the order in which the available symbols are considered.
+        priority = ind["priority"][r]
+        idx = selected[~np.isnan(priority[selected])]
+        idx = idx[np.argsort(priority[idx], kind="mergesort")]
+        held = np.zeros(len(self.symbols), dtype=bool)
+        held[[self.columns[s] for s in ph.filled_positions]] = True
+
+        # Positions that are held may be sold or exited; a sell indicator takes
+        # precedence over an exit indicator. Exits are executed before sells.
+        h = idx[held[idx]]
+        sell, leave = ind["sell"][r, h], ind["exit"][r, h]
+        for trade_type, cols in (
+                (TradeTypes.exit_trade, h[leave & ~sell]),
+                (TradeTypes.sell_trade, h[sell])
+        ):
+            if len(cols) == 0:
+                continue
+            symbols = [self.symbols[c] for c in cols]
+            quantities = np.array(
+                [ph.filled_positions[s].quantity for s in symbols], dtype=float
+            )
+            if trade_type == TradeTypes.sell_trade:
+                quantities = np.trunc(ind["sell_prop"][r, cols] * quantities)
+            keep = quantities > 0
+            symbols = [s for s, k in zip(symbols, keep) if k]
+            if symbols:
+                self.__fill(
+                    portfolio, date, symbols, quantities[keep],
+                    [trade_type] * len(symbols),
+                    [ph.filled_positions[s].direction for s in symbols], t
+                )
+
+        # Symbols that are not held may be bought while there is capacity. The
+        # number of shares of each candidate depends on the capital remaining
+        # after the previous purchases, so the first candidate that can be
+        # afforded is bought before the remaining candidates are sized again.
+        cands = idx[~held[idx] & ind["buy"][r, idx]]
+        while len(cands) > 0 and ph.available_capacity > 0:
+            spend = np.minimum(ph.equity * ind["buy_prop"][r, cands], ph.capital)
+            with np.errstate(invalid="ignore"):
+                quantities = np.trunc(spend / self.open[t, cands])
+                hits = np.flatnonzero(quantities > 0)
+            if len(hits) == 0:
+                break
+
+            k = hits[0]
+            c = cands[k]
+            direction = ind["direction"]
+            if not isinstance(direction, Directions):
+                direction = direction[r, c]
+            self.__fill(
+                portfolio, date, [self.symbols[c]], quantities[k:k + 1],
+                [TradeTypes.buy_trade], [direction], t
+            )
+            cands = cands[k + 1:]
+
+    def trade(self):
+        """Extension of the fund method. Every trading session of the data
+        handler is traded without streaming events.
+        """
+        dh = self.data_handler
+        fh = self.fund_handler
+        self.stop_reason, self.stop_date = None, None
+        # Download every bar required by the backtest, including the bars that
+        # precede the first trading session.
+        bars = dh.source.prices(
+            dh.start_date - dt.timedelta(days=dh.n_init + 1), dh.end_date
+        )
+        self.dates, self.symbols = bars.major_axis, list(bars.minor_axis)
+        index = bars.minor_axis
+        self.columns = {s: i for i, s in enumerate(self.symbols)}
+        self.prices = bars.values[bars.items.get_indexer([
+            "adj_price_open", "adj_price_high", "adj_price_low"
+        ])]
+        self.open, self.high, self.low = self.prices
+
+        # Evaluate the vectorized indicators of each strategy. Proportions and
+        # directions are only required if the corresponding trades can occur.
+        self.indicators = {}
+        for s, p in zip(fh.strategies, fh.portfolios):
+            ind = {
+                "priority": self.__matrix(s.generate_priorities(bars), float),
+                "buy": self.__matrix(s.buy_indicators(bars), bool),
+                "sell": self.__matrix(s.sell_indicators(bars), bool),
+                "exit": self.__matrix(s.exit_indicators(bars), bool),
+            }
+            if ind["buy"].any():
+                ind["buy_prop"] = self.__matrix(
+                    s.compute_buy_proportions(bars), float
+                )
+                direction = s.compute_directions(bars)
+                if not isinstance(direction, Directions):
+                    direction = self.__matrix(direction, object)
+                ind["direction"] = direction
+            if ind["sell"].any():
+                ind["sell_prop"] = self.__matrix(
+                    s.compute_sell_proportions(bars), float
+                )
+            self.indicators[p] = ind
+
+        for date in dh.sessions:
+            t = self.dates.searchsorted(date)
+            r = t - 1
+            if t == len(self.dates) or self.dates[t] != date:
+                raise ValueError(
+                    "No price data is available on {}.".format(
+                        date.strftime(IOFiles.date_format.value)
+                    )
+                )
+
+            # The symbols are selected on the preceding date, before any trades
+            # are made in the trading session.
+            selected = np.array([], dtype=int)
+            if r >= 0:
+                cols = index.get_indexer(
+                    dh.symbol_handler.selection(self.dates[r])
+                )
+                selected = np.unique(cols[cols >= 0])
+
+            dh.current_date = date
+            for p in fh.portfolios:
+                self.__trade_session(p, date, t, r, selected)
+
+            for p in fh.portfolios:
+                p.process_post_events()
+                if self.print_portfolios:
+                    print(p.portfolio_handler.state)
+
+            if self.stop_trading():
+                break
+
+        dh.continue_trading = False
+        if self.stop_reason is None:
+            self.stop_reason = StopReasons.completed
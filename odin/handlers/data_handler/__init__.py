@@ -1 +1,3 @@
 from .database import DatabaseDataHandler, InteractiveBrokersDataHandler
+from .bars import Bars
+from .replay_data_handler import ReplayDataHandler
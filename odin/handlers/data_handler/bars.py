@@ -0,0 +1,312 @@
+import numpy as np
+import pandas as pd
+
+
+class Bars(object):
+    """Bars Class
+
+    The bars object stores a rolling window of historical bar data for a
+    collection of assets. Rather than constructing a new panel of prices every
+    trading session, the bars are kept in a preallocated three-dimensional array
+    whose axes correspond to the price fields, the time periods, and the
+    symbols. The time axis is a ring buffer in which every bar is written twice,
+    once into each half of the buffer, so that the most recent bars always
+    occupy a contiguous block of memory and can be exposed as views without
+    copying.
+
+    Each symbol is assigned a slot along the final axis of the buffer. Only the
+    symbols that have been selected for trading are considered active; these
+    are the symbols that are exposed when the bars are accessed by field. The
+    number of time periods in the window in which each slot has a bar is
+    maintained as bars are appended, written and evicted, so that the symbols
+    with data in the window are known without scanning the window.
+
+    Parameters
+    ----------
+    items: List of strings.
+        The price fields (e.g. 'adj_price_close') recorded for each bar.
+    capacity: Integer.
+        The maximum number of bars that can be held in the window.
+    symbols (Optional): List of strings.
+        Symbols for which slots should be allocated (and activated) up front.
+    """
+    def __init__(self, items, capacity, symbols=None):
+        """Initialize parameters of the bars object."""
+        self.items = pd.Index(items)
+        self.capacity = capacity
+        self.__buffer = np.full((len(self.items), 2 * capacity, 1), np.nan)
+        self.__dates = np.empty(2 * capacity, dtype="datetime64[ns]")
+        self.__reset()
+        if symbols is not None:
+            self.select(symbols)
+
+    def __reset(self):
+        """Empty the bars of all time periods and symbols."""
+        self.__buffer.fill(np.nan)
+        self.__counts = np.zeros(self.__buffer.shape[2], dtype=int)
+        self.__start, self.__length = 0, 0
+        self.__slots, self.__symbols = {}, []
+        self.select([])
+
+    def __len__(self):
+        """The number of time periods currently held in the window."""
+        return self.__length
+
+    def __contains__(self, symbol):
+        """Whether or not a slot has been allocated to the provided symbol."""
+        return symbol in self.__slots
+
+    def __getitem__(self, item):
+        """Retrieve a data frame of the specified price field for every time
+        period in the window and every active symbol.
+        """
+        return self.frame(item)
+
+    @classmethod
+    def from_panel(cls, panel, capacity):
+        """Create an instance of a bars object populated with the bar data
+        contained in a pandas panel object.
+        """
+        bars = cls(panel.items, capacity)
+        bars.load(panel)
+        return bars
+
+    @property
+    def major_axis(self):
+        """The dates of the time periods currently held in the window."""
+        i = self.__start
+        return pd.DatetimeIndex(self.__dates[i:i + self.__length])
+
+    @property
+    def minor_axis(self):
+        """The active symbols, sorted alphabetically."""
+        return self.__minor_axis
+
+    @property
+    def symbols(self):
+        """Every symbol that has been allocated a slot, whether or not it is
+        active, in the order in which the slots were allocated.
+        """
+        return list(self.__symbols)
+
+    def locate(self, symbols):
+        """Determine the slots of the provided symbols along the symbol axis of
+        the buffer. Symbols which have not been encountered before are assigned
+        new slots whose history is missing. When the buffer runs out of slots,
+        its capacity for symbols is doubled.
+
+        Parameters
+        ----------
+        symbols: List of strings.
+            The symbols whose slots should be returned.
+        """
+        for s in symbols:
+            if s not in self.__slots:
+                self.__slots[s] = len(self.__symbols)
+                self.__symbols.append(s)
+
+        n_slots, width = len(self.__symbols), self.__buffer.shape[2]
+        if n_slots > width:
+            buffer = np.full(
+                self.__buffer.shape[:2] + (max(n_slots, 2 * width), ), np.nan
+            )
+            buffer[:, :, :width] = self.__buffer
+            self.__buffer = buffer
+            counts = np.zeros(buffer.shape[2], dtype=int)
+            counts[:width] = self.__counts
+            self.__counts = counts
+
+        return np.array([self.__slots[s] for s in symbols], dtype=int)
+
+    def available(self, symbols):
+        """Filter the provided symbols to those which have at least one bar in
+        the window. Symbols without a slot, or whose bars in the window are all
+        missing, are excluded.
+
+        Parameters
+        ----------
+        symbols: List of strings.
+            The symbols to filter.
+        """
+        slots, counts = self.__slots, self.__counts
+        return [s for s in symbols if s in slots and counts[slots[s]] > 0]
+
+    def __present(self, rows, slots=None):
+        """Count the rows of the buffer in which each slot has a bar, that is a
+        value for at least one price field.
+        """
+        values = self.__buffer[:, rows]
+        if slots is not None:
+            values = values[:, :, slots]
+        return (~np.isnan(values)).any(axis=0).sum(axis=0)
+
+    def select(self, symbols):
+        """Set the active symbols of the bars. Symbols that do not yet have a
+        slot in the buffer are allocated one.
+
+        Parameters
+        ----------
+        symbols: List of strings.
+            The symbols that will be exposed when the bars are accessed.
+        """
+        slots = np.unique(self.locate(symbols))
+        labels = np.array(self.__symbols, dtype=object)[slots]
+        order = np.argsort(labels, kind="mergesort")
+        self.__order = slots[order]
+        self.__minor_axis = pd.Index(labels[order])
+        self.__contiguous = (
+            len(slots) == len(self.__symbols) and
+            (self.__order == np.arange(len(slots))).all()
+        )
+
+    def load(self, panel):
+        """Replace the contents of the bars with the bar data contained in a
+        pandas panel object. The buffer is reused rather than reallocated and
+        only the most recent bars that fit into the window are retained.
+
+        Parameters
+        ----------
+        panel: Pandas panel object.
+            Bar data whose items are price fields, whose major axis is a
+            sequence of dates, and whose minor axis is a set of symbols.
+        """
+        self.__reset()
+        slots = self.locate(panel.minor_axis)
+        n = min(len(panel.major_axis), self.capacity)
+        values = panel.values[panel.items.get_indexer(self.items), -n:]
+        for i in (0, self.capacity):
+            self.__buffer[:, i:i + n, slots] = values
+            self.__dates[i:i + n] = panel.major_axis[-n:].values
+
+        self.__length = n
+        self.__counts += self.__present(slice(0, n))
+        self.select(panel.minor_axis)
+
+    def append(self, date, values, slots=None):
+        """Append the bar for a new time period to the window. If the window is
+        already at capacity, then the oldest bar is dropped. Only the new time
+        period is written so that the cost is linear in the number of symbols.
+
+        Parameters
+        ----------
+        date: Datetime object.
+            The date of the new bar.
+        values: Numpy array.
+            An array of prices whose rows correspond to price fields and whose
+            columns correspond to symbols.
+        slots (Optional): Numpy array.
+            The slots of the symbols corresponding to the columns of the values,
+            as returned by the locate method. If not provided, then the columns
+            must correspond to every slot in order.
+        """
+        if self.__length == self.capacity:
+            # The oldest bar occupies the row into which the new bar is written.
+            self.__counts -= self.__present(slice(
+                self.__start, self.__start + 1
+            ))
+            self.__start = (self.__start + 1) % self.capacity
+            self.__length -= 1
+
+        p = (self.__start + self.__length) % self.capacity
+        for r in (p, p + self.capacity):
+            if slots is None:
+                self.__buffer[:, r, :values.shape[1]] = values
+            else:
+                self.__buffer[:, r, :] = np.nan
+                self.__buffer[:, r, slots] = values
+            self.__dates[r] = np.datetime64(date, "ns")
+
+        self.__length += 1
+        self.__counts += self.__present(slice(p, p + 1))
+
+    def write(self, panel):
+        """Overwrite the bars of the symbols in a pandas panel object for those
+        time periods of the panel that are already held in the window. Time
+        periods of the panel that are not in the window are ignored.
+
+        Parameters
+        ----------
+        panel: Pandas panel object.
+            Bar data whose items are price fields, whose major axis is a
+            sequence of dates, and whose minor axis is a set of symbols.
+        """
+        slots = self.locate(panel.minor_axis)
+        rows = self.major_axis.get_indexer(panel.major_axis)
+        keep = rows >= 0
+        values = panel.values[panel.items.get_indexer(self.items)][:, keep]
+        p = ((self.__start + rows[keep]) % self.capacity)[:, np.newaxis]
+        self.__counts[slots] -= self.__present(p[:, 0], slots)
+        for r in (p, p + self.capacity):
+            self.__buffer[:, r, slots] = values
+        self.__counts[slots] += self.__present(p[:, 0], slots)
+
+    def evict(self, date):
+        """Drop every bar in the window that is strictly older than the provided
+        date.
+        """
+        i = self.__start
+        n = self.__dates[i:i + self.__length].searchsorted(
+            np.datetime64(date, "ns")
+        )
+        self.__counts -= self.__present(slice(i, i + n))
+        self.__start = (self.__start + n) % self.capacity
+        self.__length -= n
+
+    def view(self, n=None):
+        """Retrieve a view of the most recent bars without copying. The view is
+        an array whose axes correspond to price fields, time periods, and every
+        allocated slot (active or not).
+
+        Parameters
+        ----------
+        n (Optional): Integer.
+            The number of recent time periods to include. By default all of the
+            time periods in the window are included.
+        """
+        n = self.__length if n is None else min(n, self.__length)
+        j = self.__start + self.__length
+        return self.__buffer[:, j - n:j, :len(self.__symbols)]
+
+    def frame(self, item, n=None):
+        """Retrieve a data frame of a price field for the most recent time
+        periods and the active symbols. When every allocated symbol is active,
+        the data frame shares memory with the bars.
+
+        Parameters
+        ----------
+        item: String.
+            The price field to retrieve.
+        n (Optional): Integer.
+            The number of recent time periods to include.
+        """
+        values = self.view(n)[self.items.get_loc(item)]
+        if not self.__contiguous:
+            values = values[:, self.__order]
+
+        dates = self.major_axis[len(self) - len(values):]
+        return pd.DataFrame(values, index=dates, columns=self.__minor_axis)
+
+    def last(self, item):
+        """Retrieve the most recent value of a price field for each of the
+        active symbols as a pandas series. An index error is raised if the
+        window is empty.
+        """
+        if self.__length == 0:
+            raise IndexError("There are no bars in the window.")
+
+        j = self.__start + self.__length - 1
+        return pd.Series(
+            self.__buffer[self.items.get_loc(item), j, self.__order],
+            index=self.__minor_axis
+        )
+
+    def equals(self, other):
+        """Determine whether or not two bars objects contain identical data for
+        their active symbols.
+        """
+        return (
+            self.items.equals(other.items) and
+            self.major_axis.equals(other.major_axis) and
+            self.minor_axis.equals(other.minor_axis) and
+            all(self[i].equals(other[i]) for i in self.items)
+        )
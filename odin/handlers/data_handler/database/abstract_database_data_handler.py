@@ -4,6 +4,7 @@ from abc import ABCMeta
 from odin_securities.queries import gets
 from ....events import MarketEvent
 from ..abstract_data_handler import AbstractDataHandler
+from ..bars import Bars
 
 
 class AbstractDatabaseDataHandler(AbstractDataHandler):
@@ -12,12 +13,20 @@ class AbstractDatabaseDataHandler(AbstractDataHandler):
     This abstract class integrates the data handler objects with Odin's
     securities database, allowing them to query price data. In particular it
     supports obtaining the initial set of bars and then subsequently updating
-    those bars for assets specified by the symbol handler.
+    those bars for assets specified by the symbol handler. The bars are held in
+    a rolling window whose length is the number of days of initial data.
+
+    Parameters
+    ----------
+    source (Optional): Object implementing a `prices` query.
+        The source from which bar data is obtained. By default this is the query
+        module of the Odin Securities master database.
     """
     __metaclass__ = ABCMeta
 
     def __init__(
-            self, events, symbol_handler, price_handler, n_init, current_date
+            self, events, symbol_handler, price_handler, n_init, current_date,
+            source=gets
     ):
         """Initialize parameters of the abstract database data handler object.
         """
@@ -26,6 +35,7 @@ class AbstractDatabaseDataHandler(AbstractDataHandler):
         )
         self.n_init = n_init
         self.current_date = current_date
+        self.source = source
         # Download initial bar data for the database data handler. This is
         # necessary to allow trading on the first day of sessions; otherwise,
         # we would not have data in time.
@@ -39,20 +49,20 @@ class AbstractDatabaseDataHandler(AbstractDataHandler):
         """
         end_date = self.current_date - dt.timedelta(days=1)
         start_date = end_date - dt.timedelta(days=self.n_init)
-        self.bars = gets.prices(start_date, end_date)
-        selected = self.symbol_handler.select_symbols(self.bars.major_axis[-1])
-        self.bars.drop(
-            [s for s in self.bars.minor_axis if s not in selected],
-            axis=2, inplace=True
+        # The window of bars can contain at most one bar for each day.
+        self.bars = Bars.from_panel(
+            self.source.prices(start_date, end_date), self.n_init + 1
         )
+        selected = self.symbol_handler.selection(self.bars.major_axis[-1])
+        self.bars.select(self.bars.available(selected))
 
     def update(self):
         """Implementation of abstract base class method."""
         # N.B.: When update is called after all of the time period's events have
         #       been processed, the bars are changed!
-        selected = self.symbol_handler.select_symbols(self.current_date)
-        self.bars = gets.prices(
+        selected = self.symbol_handler.selection(self.current_date)
+        self.bars.load(self.source.prices(
             self.current_date - dt.timedelta(days=self.n_init),
             self.current_date, selected
-        )
+        ))
 
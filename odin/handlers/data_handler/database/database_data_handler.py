@@ -4,15 +4,38 @@ from odin_securities.queries import gets
 from ....events import MarketEvent
 from .abstract_database_data_handler import AbstractDatabaseDataHandler
 from ..price_handler import DatabasePriceHandler
+from ..sources import PreloadedPrices, PrefetchedPrices
 
 class DatabaseDataHandler(AbstractDatabaseDataHandler):
     """Database Data Handler Class
+
+    Parameters
+    ----------
+    preload (Optional): Boolean.
+        Whether or not all of the price data required by the backtest should be
+        downloaded with a single query when the data handler is constructed.
+        When enabled, the bars and prices of each trading session are served as
+        slices of the in-memory data rather than queried from the database, and
+        the bars are advanced by a single time period after each session. If
+        the source is a shared prices object, then the prices are served
+        directly from its shared memory rather than being downloaded again.
+    prefetch (Optional): Integer.
+        The number of upcoming trading sessions whose prices may be downloaded
+        ahead of time by a background thread while the events of the current
+        session are processed. The bars are then advanced using the prefetched
+        prices rather than queried again. By default prefetching is disabled;
+        it has no effect when the prices have been preloaded. Prefetching stops
+        as soon as the data handler stops trading.
+    source (Optional): Object implementing a `prices` query.
+        The source from which price data is obtained, such as a price cube
+        cache. By default this is the query module of the Odin Securities master
+        database.
     """
     def __init__(
-            self, events, symbol_handler, start_date, end_date, n_init
+            self, events, symbol_handler, start_date, end_date, n_init,
+            preload=False, prefetch=0, source=gets
     ):
         """Initialize parameters of the database data handler object."""
-        price_handler = DatabasePriceHandler()
         # Determine which are valid trading days and set the start and end
         # period of the backtest.
         self.sessions = gets.standard_sessions(
@@ -21,11 +44,43 @@ class DatabaseDataHandler(AbstractDatabaseDataHandler):
         self.start_date = self.sessions.iloc[0]
         self.end_date = self.sessions.iloc[-1]
         self.yield_dates = self.__yield_dates()
+        # If requested, download the prices for the entire backtest at once.
+        # The window must also include the initial bars, which end on the day
+        # before the first trading session.
+        # Otherwise, if requested, download the prices of upcoming trading
+        # sessions in the background. Shared prices are already preloaded and
+        # are used as they are, so that they are not copied.
+        self.preload = preload
+        self.prefetch = prefetch > 0 and not preload
+        if preload and getattr(source, "shm", None) is None:
+            source = PreloadedPrices(
+                self.start_date - dt.timedelta(days=n_init + 1), self.end_date,
+                source
+            )
+        elif self.prefetch:
+            source = PrefetchedPrices(list(self.sessions), prefetch, source)
+        price_handler = DatabasePriceHandler(source)
+        self.slots = None
         # Call the super method to initialize the remaining parameters.
         super(DatabaseDataHandler, self).__init__(
-            events, symbol_handler, price_handler, n_init, self.start_date
+            events, symbol_handler, price_handler, n_init, self.start_date,
+            source
         )
 
+    @property
+    def continue_trading(self):
+        """Whether or not there remain trading sessions to process."""
+        return self.__continue_trading
+
+    @continue_trading.setter
+    def continue_trading(self, value):
+        """Stop prefetching prices when trading ends, whether the trading
+        sessions have been exhausted or the fund has stopped trading early.
+        """
+        self.__continue_trading = value
+        if not value and self.prefetch:
+            self.source.close()
+
     def __yield_dates(self):
         """Create an iterator over the dates contained in the historical
         download.
@@ -36,10 +91,12 @@ class DatabaseDataHandler(AbstractDatabaseDataHandler):
     def request_prices(self):
         """Implementation of abstract base class method."""
         try:
-            # TODO: Check if it is possible to reuse the old selected variable
-            #       from the update method.
-            selected = self.symbol_handler.select_symbols(self.current_date)
+            # The symbols selected for the current date were already selected
+            # when the bars were updated, so this selection is memoized.
+            selected = self.symbol_handler.selection(self.current_date)
             self.current_date = next(self.yield_dates)
+            if self.prefetch:
+                self.source.advance(self.current_date)
             self.prices = self.price_handler.request_prices(
                 self.current_date, selected
             )
@@ -47,3 +104,33 @@ class DatabaseDataHandler(AbstractDatabaseDataHandler):
             self.continue_trading = False
         else:
             self.events.put(MarketEvent(self.current_date))
+
+    def update(self):
+        """Extension of abstract base class method. When the prices have been
+        preloaded or prefetched, the bars are advanced by appending the prices
+        of the current trading session for every available symbol and evicting
+        the bars that have fallen out of the window.
+        """
+        if not (self.preload or self.prefetch):
+            super(DatabaseDataHandler, self).update()
+            return
+
+        selected = self.symbol_handler.selection(self.current_date)
+        src = self.source
+        if self.prefetch:
+            panel = src.panel
+            if len(panel.major_axis) > 0:
+                slots = self.bars.locate(panel.minor_axis)
+                self.bars.append(self.current_date, panel.values[:, 0], slots)
+        else:
+            if self.slots is None:
+                self.slots = self.bars.locate(src.symbols)
+
+            i = src.dates.searchsorted(self.current_date)
+            if i < len(src.dates) and src.dates[i] == self.current_date:
+                self.bars.append(
+                    self.current_date, src.values[:, i], self.slots
+                )
+
+        self.bars.evict(self.current_date - dt.timedelta(days=self.n_init))
+        self.bars.select(self.bars.available(selected))
@@ -1,5 +1,6 @@
 import datetime as dt
 import numpy as np
+from odin_securities.queries import gets
 from ....events import MarketEvent
 from .abstract_database_data_handler import AbstractDatabaseDataHandler
 from ..price_handler import InteractiveBrokersPriceHandler
@@ -7,20 +8,82 @@ from ..price_handler import InteractiveBrokersPriceHandler
 
 class InteractiveBrokersDataHandler(AbstractDatabaseDataHandler):
     """Interactive Brokers Data Handler Class
+
+    The bars are updated incrementally: after each trading session only the new
+    bars of the symbols whose history is already up to date are downloaded, and
+    the oldest bars are evicted from the window. The full window of history is
+    only downloaded for symbols that have newly entered the selected universe.
+
+    Parameters
+    ----------
+    source (Optional): Object implementing a `prices` query.
+        The source from which historical bar data is obtained, such as a price
+        cube cache. By default this is the query module of the Odin Securities
+        master database.
     """
-    def __init__(self, events, symbol_handler, n_init):
+    def __init__(self, events, symbol_handler, n_init, source=gets):
         """Initialize parameters of the Interactive Brokers data handler object.
         """
         price_handler = InteractiveBrokersPriceHandler()
         super(InteractiveBrokersDataHandler, self).__init__(
-            events, symbol_handler, price_handler, n_init, dt.datetime.today()
+            events, symbol_handler, price_handler, n_init, dt.datetime.today(),
+            source
         )
+        # Every symbol in the initial bars has an up to date history.
+        self.current = set(self.bars.symbols)
 
     def request_prices(self):
         """Implementation of abstract base class method."""
-        selected = self.symbol_handler.select_symbols(self.current_date)
+        selected = self.symbol_handler.selection(self.current_date)
         self.current_date = dt.datetime.today()
         self.prices = self.price_handler.request_prices(
             self.current_date, selected
         )
         self.events.put(MarketEvent(self.current_date))
+
+    def update(self):
+        """Extension of abstract base class method. Rather than downloading the
+        entire window of bars for every selected symbol, only the bars that
+        have arrived since the most recent bar in the window are downloaded.
+        """
+        selected = self.symbol_handler.selection(self.current_date)
+        start_date = self.current_date - dt.timedelta(days=self.n_init)
+        if len(self.bars) > 0:
+            last_date, current = self.bars.major_axis[-1], self.current
+        else:
+            last_date, current = None, set()
+        fresh = [s for s in selected if s in current]
+        stale = [s for s in selected if s not in current]
+
+        # Download the new bars of symbols with an up to date history and the
+        # entire window for all other symbols.
+        panels = []
+        if fresh:
+            panels.append(self.source.prices(
+                last_date + dt.timedelta(days=1), self.current_date, fresh
+            ))
+        if stale:
+            panels.append(self.source.prices(
+                start_date, self.current_date, stale
+            ))
+
+        # Append a time period for each new date, evict the time periods which
+        # have fallen out of the window, and then fill in the downloaded bars.
+        dates = sorted(set(d for p in panels for d in p.major_axis))
+        empty = np.empty((len(self.bars.items), 0))
+        for date in dates:
+            if last_date is None or date > last_date:
+                self.bars.append(date, empty, np.empty(0, dtype=int))
+        self.bars.evict(start_date)
+        for p in panels:
+            self.bars.write(p)
+        # A newly selected symbol may have bars on dates that are not in the
+        # window because none of the symbols already held traded on them. Those
+        # bars cannot be written into the window, so it is rebuilt instead.
+        if stale and not panels[-1].major_axis.isin(self.bars.major_axis).all():
+            self.bars.load(self.source.prices(
+                start_date, self.current_date, selected
+            ))
+
+        self.current = set(selected)
+        self.bars.select(self.bars.available(selected))
@@ -9,10 +9,22 @@ class DatabasePriceHandler(AbstractPriceHandler):
 
     The database price handler extracts the corresponding price data from the
     requested symbols stored in the Odin Securities master database.
+
+    Parameters
+    ----------
+    source (Optional): Object implementing a `prices` query.
+        The source from which price data is obtained. By default this is the
+        query module of the Odin Securities master database, but it may also be
+        an in-memory store of preloaded prices.
     """
+    def __init__(self, source=gets):
+        """Initialize parameters of the database price handler object."""
+        super(DatabasePriceHandler, self).__init__()
+        self.source = source
+
     def request_prices(self, current_date, symbols):
         """Implementation of abstract base class method."""
-        prices = gets.prices(current_date, symbols=symbols)
+        prices = self.source.prices(current_date, symbols=symbols)
         prices.drop(["adj_price_close", "adj_volume"], inplace=True)
         prices.items = [
             PriceFields.current_price.value,
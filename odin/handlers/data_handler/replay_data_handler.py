@@ -0,0 +1,86 @@
+import numpy as np
+from ...events import MarketEvent, EventJournal
+from .abstract_data_handler import AbstractDataHandler
+from .bars import Bars
+
+
+class ReplayDataHandler(AbstractDataHandler):
+    """Replay Data Handler Class
+
+    The replay data handler feeds the market data recorded in an event journal
+    back through a fund. Each trading session of a recorded run is reproduced:
+    the prices of the session are served exactly as they were recorded, and the
+    bars are reconstructed from the changes recorded with each market event.
+    Neither the Odin Securities master database nor Interactive Brokers is
+    queried, so the run is replayed as fast as the fund can process its events.
+
+    Only the market data is replayed. The signal, order and fill events are
+    generated afresh by the strategies, portfolios and execution handler of the
+    fund, which therefore need not be the ones with which the run was recorded;
+    for instance, a recorded backtest may be traded again with a different
+    portfolio handler. The symbols that are selected on each trading session
+    are those that were recorded.
+
+    Parameters
+    ----------
+    events: Events queue object.
+        The events queue into which market events are placed.
+    path: String.
+        The path of the event journal.
+    run (Optional): Integer.
+        The index of the run in the event journal that is replayed.
+    """
+    def __init__(self, events, path, run=0):
+        """Initialize parameters of the replay data handler object."""
+        super(ReplayDataHandler, self).__init__(events, None, None)
+        self.path = path
+        self.run = run
+        self.sessions = (
+            m for r, e, m in EventJournal.read(path)
+            if r == run and m is not None
+        )
+        self.market = next(self.sessions, None)
+        if self.market is None:
+            raise ValueError(
+                "The event journal {} contains no market data for run {}."
+                .format(path, run)
+            )
+
+        # Reconstruct the bars that were available on the first trading
+        # session.
+        self.bars = Bars(self.market["rows"].items, self.market["capacity"])
+        self.__replay_bars(self.market)
+        self.current_date = self.market["date"]
+
+    def __replay_bars(self, market):
+        """Apply the changes to the bars that were recorded with a market
+        event.
+        """
+        bars, rows, columns = self.bars, market["rows"], market["columns"]
+        empty = np.empty((len(bars.items), 0))
+        for date in rows.major_axis:
+            bars.append(date, empty, np.empty(0, dtype=int))
+        if market["start_date"] is not None:
+            bars.evict(market["start_date"])
+        for panel in (rows, columns):
+            if len(panel.major_axis) > 0 and len(panel.minor_axis) > 0:
+                bars.write(panel)
+        bars.select(market["symbols"])
+
+    def request_prices(self):
+        """Implementation of abstract base class method."""
+        if self.market is None:
+            self.continue_trading = False
+            return
+
+        self.current_date = self.market["date"]
+        self.prices = self.market["prices"]
+        self.events.put(MarketEvent(self.current_date))
+
+    def update(self):
+        """Implementation of abstract base class method. The bars are advanced
+        to those that were recorded with the next market event.
+        """
+        self.market = next(self.sessions, None)
+        if self.market is not None:
+            self.__replay_bars(self.market)
@@ -0,0 +1,3 @@
+from .preloaded_prices import PreloadedPrices
+from .price_cube_cache import PriceCubeCache
+from .prefetched_prices import PrefetchedPrices
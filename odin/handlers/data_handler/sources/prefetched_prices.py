@@ -0,0 +1,132 @@
+import queue
+import threading
+from odin_securities.queries import gets
+
+
+class PrefetchedPrices(object):
+    """Prefetched Prices Class
+
+    The prefetched prices object downloads the prices of upcoming trading
+    sessions on a background thread, so that the time spent waiting on the Odin
+    Securities master database overlaps with the time spent processing the
+    events of the current trading session. The prices of every symbol in each
+    session are placed on a bounded queue, which limits how far the worker may
+    run ahead of the backtest and therefore how much memory is consumed.
+
+    Requests for the prices of the current trading session are served from the
+    prefetched data; any other request is passed through to the underlying
+    source.
+
+    The background thread runs until every trading session has been prefetched
+    or the prefetched prices are closed, which should be done whenever trading
+    ends before the last session has been consumed.
+
+    Parameters
+    ----------
+    dates: List of datetime objects.
+        The trading sessions, in order, whose prices will be prefetched.
+    lookahead: Integer.
+        The maximum number of trading sessions whose prices may be held in the
+        queue before they are consumed.
+    source (Optional): Object implementing a `prices` query.
+        The underlying source of price data. By default this is the query module
+        of the Odin Securities master database.
+    """
+    def __init__(self, dates, lookahead, source=gets):
+        """Initialize parameters of the prefetched prices object."""
+        self.source = source
+        self.date, self.panel = None, None
+        self.queue = queue.Queue(maxsize=lookahead)
+        self.stopped = threading.Event()
+        # The background thread does not refer to the prefetched prices object,
+        # so that the object can be garbage collected, stopping the thread, if
+        # trading is abandoned without closing it (for instance, because an
+        # exception was raised).
+        self.thread = threading.Thread(target=self.__prefetch, args=(
+            dates, source, self.queue, self.stopped
+        ))
+        self.thread.daemon = True
+        self.thread.start()
+
+    @staticmethod
+    def __prefetch(dates, source, prefetched, stopped):
+        """Download the prices of each trading session in turn, blocking whenever
+        the queue of prefetched sessions is full. If a query fails, then the
+        exception is forwarded to the consumer and prefetching stops.
+        """
+        for date in dates:
+            if stopped.is_set():
+                return
+            try:
+                panel = source.prices(date)
+            except Exception as e:
+                prefetched.put((date, None, e))
+                return
+            else:
+                prefetched.put((date, panel, None))
+
+    def __drain(self):
+        """Discard every trading session waiting in the queue."""
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                return
+
+    def close(self):
+        """Stop prefetching and discard the prices that have been prefetched
+        but not consumed. Draining the queue unblocks the background thread if
+        it is waiting to place a trading session into the queue, after which it
+        stops before downloading the prices of another session.
+        """
+        self.stopped.set()
+        self.__drain()
+        self.thread.join()
+        self.__drain()
+
+    def __del__(self):
+        """Stop prefetching when the prefetched prices are garbage collected."""
+        self.stopped.set()
+        self.__drain()
+
+    def advance(self, date):
+        """Wait for the prices of the next trading session to become available
+        and make them the current prices.
+
+        Parameters
+        ----------
+        date: Datetime object.
+            The date of the next trading session. This must agree with the order
+            of the dates that are being prefetched.
+        """
+        if self.stopped.is_set():
+            raise ValueError("The prefetched prices have been closed.")
+
+        prefetched, panel, error = self.queue.get()
+        if error is not None:
+            raise error
+        if prefetched != date:
+            raise ValueError(
+                "Prefetched prices for {} but prices for {} were requested."
+                .format(prefetched, date)
+            )
+
+        self.date, self.panel = date, panel
+        return panel
+
+    def prices(self, start_date, end_date=None, symbols=None):
+        """Retrieve price data for the requested symbols between the start and
+        end dates (inclusive). Only the prices of the current trading session
+        are served from the prefetched data.
+        """
+        end_date = start_date if end_date is None else end_date
+        if start_date != self.date or end_date != self.date:
+            return self.source.prices(start_date, end_date, symbols)
+
+        # A new panel is always returned so that the prefetched prices cannot be
+        # modified by the caller.
+        panel = self.panel
+        symbols = set(panel.minor_axis if symbols is None else symbols)
+        return panel.reindex(minor_axis=[
+            s for s in panel.minor_axis if s in symbols
+        ])
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+from odin_securities.queries import gets
+
+
+class PreloadedPrices(object):
+    """Preloaded Prices Class
+
+    The preloaded prices object downloads every bar in a fixed historical window
+    from the Odin Securities master database with a single query. Subsequent
+    requests for prices are then served as slices of the in-memory data rather
+    than as new round trips to the database. The object exposes the same
+    `prices` signature as the securities master so that it may be substituted
+    wherever price data is queried.
+
+    Parameters
+    ----------
+    start_date: Datetime object.
+        The earliest date for which price data will be requested.
+    end_date: Datetime object.
+        The latest date for which price data will be requested.
+    source (Optional): Object implementing a `prices` query.
+        The underlying source of price data. By default this is the query module
+        of the Odin Securities master database.
+    """
+    def __init__(self, start_date, end_date, source=gets):
+        """Initialize parameters of the preloaded prices object."""
+        self.start_date = start_date
+        self.end_date = end_date
+        bars = source.prices(start_date, end_date)
+        self.items = bars.items
+        self.dates = bars.major_axis
+        self.symbols = bars.minor_axis
+        self.values = bars.values
+
+    def prices(self, start_date, end_date=None, symbols=None):
+        """Retrieve price data for the requested symbols between the start and
+        end dates (inclusive). When the end date is not provided, only the
+        prices on the start date are returned. Dates and symbols for which no
+        data is available are omitted, just as they would be by a query to the
+        database.
+
+        Parameters
+        ----------
+        start_date: Datetime object.
+            The first date of the requested prices.
+        end_date (Optional): Datetime object.
+            The last date of the requested prices.
+        symbols (Optional): List of strings.
+            The ticker symbols for which prices are requested. If not provided,
+            then prices for every preloaded symbol are returned.
+        """
+        end_date = start_date if end_date is None else end_date
+        if start_date < self.start_date or end_date > self.end_date:
+            raise ValueError(
+                "Requested prices between {} and {} are outside of the "
+                "preloaded window.".format(start_date, end_date)
+            )
+
+        # Extract the time-slice of the preloaded prices, as well as the
+        # requested subset of symbols.
+        i = self.dates.searchsorted(start_date)
+        j = self.dates.searchsorted(end_date, side="right")
+        if symbols is None:
+            cols = np.arange(len(self.symbols))
+        else:
+            cols = np.flatnonzero(self.symbols.isin(symbols))
+        values = self.take(i, j, cols)
+        # Remove dates and symbols that have no data whatsoever.
+        missing = np.isnan(values)
+        rows = ~missing.all(axis=(0, 2))
+        keep = ~missing.all(axis=(0, 1))
+
+        return pd.Panel(
+            values[:, rows][:, :, keep],
+            items=self.items,
+            major_axis=self.dates[i:j][rows],
+            minor_axis=self.symbols[cols][keep]
+        )
+
+    def take(self, i, j, cols):
+        """Extract the values of every price field for the time periods indexed
+        from i up to (but excluding) j and for the symbols in the provided
+        columns.
+        """
+        return self.values[:, i:j][:, :, cols]
@@ -0,0 +1,204 @@
+import os
+import json
+import datetime as dt
+import numpy as np
+import pandas as pd
+from odin_securities.queries import gets
+from .preloaded_prices import PreloadedPrices
+
+
+class PriceCubeCache(PreloadedPrices):
+    """Price Cube Cache Class
+
+    The price cube cache keeps a local copy of the price data in the Odin
+    Securities master database so that repeated backtests (and restarts of live
+    trading) do not download the same history again. Each price field is stored
+    on disk as a memory-mapped Numpy array whose rows correspond to dates and
+    whose columns correspond to symbols, alongside a date index and a symbol
+    index. A manifest records the range of dates covered by the cache as well
+    as the symbols that were requested when it was filled.
+
+    Requests for prices outside of the cached dates or for symbols that have not
+    been cached trigger an incremental fill from the underlying source, after
+    which the request is served from the cache.
+
+    Parameters
+    ----------
+    directory: String.
+        The directory in which the cache files are stored. It is created if it
+        does not already exist.
+    source (Optional): Object implementing a `prices` query.
+        The underlying source of price data. By default this is the query module
+        of the Odin Securities master database.
+    """
+    manifest_file = "manifest.json"
+    dates_file = "dates.npy"
+    symbols_file = "symbols.npy"
+
+    def __init__(self, directory, source=gets):
+        """Initialize parameters of the price cube cache object."""
+        self.directory = directory
+        self.source = source
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+        self.__open()
+
+    def __path(self, name):
+        """Path to a file in the cache directory."""
+        return os.path.join(self.directory, name)
+
+    def __open(self):
+        """Memory-map the cached price fields and read the manifest, date index
+        and symbol index. If no manifest exists, then the cache is empty.
+        """
+        if not os.path.isfile(self.__path(self.manifest_file)):
+            self.start_date = self.end_date = self.universe = None
+            return
+
+        with open(self.__path(self.manifest_file)) as f:
+            manifest = json.load(f)
+
+        self.start_date = pd.Timestamp(manifest["start_date"])
+        self.end_date = pd.Timestamp(manifest["end_date"])
+        self.universe = manifest["symbols"]
+        self.items = pd.Index(manifest["items"])
+        self.dates = pd.DatetimeIndex(np.load(self.__path(self.dates_file)))
+        self.symbols = pd.Index(np.load(self.__path(self.symbols_file)))
+        self.values = [
+            np.load(self.__path(i + ".npy"), mmap_mode="r")
+            for i in self.items
+        ]
+
+    def __merge(self, panel, start_date, end_date, universe):
+        """Combine newly downloaded prices with the contents of the cache and
+        write the result to disk. Where the new prices and the cache overlap,
+        the new prices take precedence.
+
+        Parameters
+        ----------
+        panel: Pandas panel object.
+            The newly downloaded prices.
+        start_date, end_date: Datetime objects.
+            The range of dates covered by the cache after the merge.
+        universe: List of strings or None.
+            The symbols covered by the cache after the merge. If None, then the
+            cache covers every symbol in the database.
+        """
+        if self.start_date is None:
+            self.items = panel.items
+            old_dates = np.array([], dtype="datetime64[ns]")
+            old_symbols = np.array([], dtype=str)
+        else:
+            old_dates = self.dates.values
+            old_symbols = np.array(self.symbols, dtype=str)
+
+        # The new index is the union of the dates and symbols that are cached
+        # and those that were downloaded.
+        new_dates = panel.major_axis.values.astype("datetime64[ns]")
+        new_symbols = np.array(panel.minor_axis, dtype=str)
+        dates = np.union1d(old_dates, new_dates)
+        symbols = np.union1d(old_symbols, new_symbols)
+        rows, cols = dates.searchsorted(old_dates), symbols.searchsorted(
+            old_symbols
+        )
+        new_rows = dates.searchsorted(new_dates)
+        new_cols = symbols.searchsorted(new_symbols)
+        items = panel.items.get_indexer(self.items)
+
+        # Write every price field to a temporary file before atomically
+        # replacing the existing field.
+        for k, item in enumerate(self.items):
+            path = self.__path(item + ".npy")
+            tmp = path + ".tmp"
+            cube = np.lib.format.open_memmap(
+                tmp, mode="w+", dtype=np.float64,
+                shape=(len(dates), len(symbols))
+            )
+            cube.fill(np.nan)
+            if len(old_dates) > 0:
+                cube[np.ix_(rows, cols)] = self.values[k]
+            if len(new_dates) > 0 and items[k] >= 0:
+                cube[np.ix_(new_rows, new_cols)] = panel.values[items[k]]
+            cube.flush()
+            del cube
+            os.replace(tmp, path)
+
+        np.save(self.__path(self.dates_file), dates)
+        np.save(self.__path(self.symbols_file), symbols)
+        with open(self.__path(self.manifest_file), "w") as f:
+            json.dump({
+                "start_date": pd.Timestamp(start_date).isoformat(),
+                "end_date": pd.Timestamp(end_date).isoformat(),
+                "symbols": None if universe is None else sorted(universe),
+                "items": list(self.items),
+            }, f)
+
+        self.__open()
+
+    def fill(self, start_date, end_date, symbols=None):
+        """Ensure that the cache covers the provided range of dates and the
+        requested symbols, downloading only the missing data from the source.
+
+        Parameters
+        ----------
+        start_date, end_date: Datetime objects.
+            The range of dates that the cache should cover.
+        symbols (Optional): List of strings.
+            The symbols that the cache should cover. If not provided, then the
+            cache should cover every symbol in the database.
+        """
+        src = self.source
+        if self.start_date is None:
+            self.__merge(
+                src.prices(start_date, end_date, symbols), start_date, end_date,
+                symbols
+            )
+            return
+
+        # Download the entire covered period for symbols that are not cached.
+        # If the cache is restricted to a subset of symbols and every symbol is
+        # requested, then the whole market must be downloaded.
+        if self.universe is not None:
+            if symbols is None:
+                self.__merge(
+                    src.prices(self.start_date, self.end_date), self.start_date,
+                    self.end_date, None
+                )
+            else:
+                covered = set(self.universe)
+                missing = [s for s in symbols if s not in covered]
+                if missing:
+                    self.__merge(
+                        src.prices(self.start_date, self.end_date, missing),
+                        self.start_date, self.end_date, self.universe + missing
+                    )
+
+        # Download the dates on either side of the covered period.
+        day = dt.timedelta(days=1)
+        if start_date < self.start_date:
+            self.__merge(
+                src.prices(start_date, self.start_date - day, self.universe),
+                start_date, self.end_date, self.universe
+            )
+        if end_date > self.end_date:
+            self.__merge(
+                src.prices(self.end_date + day, end_date, self.universe),
+                self.start_date, end_date, self.universe
+            )
+
+    def prices(self, start_date, end_date=None, symbols=None):
+        """Extension of the preloaded prices method. Missing data is first
+        filled from the source before the request is served from the cache.
+        """
+        end_date = start_date if end_date is None else end_date
+        self.fill(start_date, end_date, symbols)
+        return super(PriceCubeCache, self).prices(start_date, end_date, symbols)
+
+    def take(self, i, j, cols):
+        """Extension of the preloaded prices method. The values of each price
+        field are read from its memory-mapped array.
+        """
+        return np.array([v[i:j][:, cols] for v in self.values]).reshape(
+            (len(self.items), max(j - i, 0), len(cols))
+        )
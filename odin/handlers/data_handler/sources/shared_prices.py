@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+from multiprocessing import shared_memory
+from odin_securities.queries import gets
+from .preloaded_prices import PreloadedPrices
+
+
+class SharedPrices(PreloadedPrices):
+    """Shared Prices Class
+
+    The shared prices object preloads every bar in a fixed historical window, as
+    the preloaded prices object does, but stores the values of the price cube
+    in a block of shared memory rather than in the memory of the process that
+    downloaded them. Other processes may then attach to the block and serve
+    prices from the very same memory, so that many backtests can be run in
+    parallel against a single copy of the price history, without downloading
+    or copying it again.
+
+    The process that creates the shared prices owns the block of shared memory
+    and is responsible for releasing it by calling `unlink` once every process
+    has finished with it. Processes that attach to the block receive a
+    read-only view of the prices.
+
+    Parameters
+    ----------
+    start_date, end_date, source: Refer to base class documentation.
+    """
+    def __init__(self, start_date, end_date, source=gets):
+        """Initialize parameters of the shared prices object."""
+        self.start_date = start_date
+        self.end_date = end_date
+        bars = source.prices(start_date, end_date)
+        self.items = bars.items
+        self.dates = bars.major_axis
+        self.symbols = bars.minor_axis
+        # Copy the price cube into a newly created block of shared memory.
+        values = np.asarray(bars.values, dtype=np.float64)
+        self.shm = shared_memory.SharedMemory(
+            create=True, size=max(values.nbytes, 1)
+        )
+        self.values = np.ndarray(
+            values.shape, dtype=np.float64, buffer=self.shm.buf
+        )
+        self.values[:] = values
+
+    @classmethod
+    def attach(cls, spec):
+        """Attach to the block of shared memory of shared prices that were
+        created by another process.
+
+        Parameters
+        ----------
+        spec: Dictionary.
+            The specification of the shared prices, as provided by the `spec`
+            attribute of the shared prices in the process that created them.
+        """
+        prices = cls.__new__(cls)
+        prices.start_date = spec["start_date"]
+        prices.end_date = spec["end_date"]
+        prices.items = pd.Index(spec["items"])
+        prices.dates = pd.DatetimeIndex(spec["dates"])
+        prices.symbols = pd.Index(spec["symbols"])
+        prices.shm = shared_memory.SharedMemory(name=spec["name"])
+        prices.values = np.ndarray(
+            (len(prices.items), len(prices.dates), len(prices.symbols)),
+            dtype=np.float64, buffer=prices.shm.buf
+        )
+        prices.values.flags.writeable = False
+
+        return prices
+
+    @property
+    def spec(self):
+        """A picklable description of the shared prices from which another
+        process may attach to them.
+        """
+        return {
+            "name": self.shm.name,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "items": list(self.items),
+            "dates": self.dates.values,
+            "symbols": list(self.symbols),
+        }
+
+    def close(self):
+        """Release the view of the block of shared memory held by this process.
+        The prices can no longer be served afterwards.
+        """
+        self.values = None
+        self.shm.close()
+
+    def unlink(self):
+        """Close the shared prices and destroy the underlying block of shared
+        memory. This should only be called by the process that created them.
+        """
+        self.close()
+        self.shm.unlink()
@@ -2,7 +2,9 @@ import pandas as pd
 import datetime as dt
 from odin_securities import conn
 from odin_securities.queries import gets, exists, updates, inserts, deletes
-from ..position_handler.position import PendingPosition, FilledPosition
+from ..position_handler.position import (
+    PendingPosition, FilledPosition, PositionLedger, PositionBook
+)
 from ...portfolio.components import PortfolioState
 from ...utilities.mixins import EquityMixin
 from ...utilities.params import TradeTypes, action_dict, Directions
@@ -27,10 +29,14 @@ class PortfolioHandler(EquityMixin):
         The amount of capital (measured in USD) presently held by the portfolio.
     filled_positions (Optional): Dictionary.
         A dictionary of filled position objects mapping symbols to the
-        corresponding fill representation.
+        corresponding fill representation. The positions are held in a
+        position ledger so that the equity can be computed efficiently.
     filled_positions (Optional): Dictionary.
         A dictionary of closed positions mapping datetimes to positions closed
         at those times.
+    position_book (Optional): Boolean.
+        If true, the filled positions are stored in the arrays of a position
+        book rather than in a position ledger.
     """
     def __init__(
             self,
@@ -39,14 +45,18 @@ class PortfolioHandler(EquityMixin):
             capital,
             fund_id,
             filled_positions=None,
-            closed_positions=None
+            closed_positions=None,
+            position_book=False
     ):
         """Initialize parameters of the portfolio handler object."""
         self.maximum_capacity = maximum_capacity
         self.portfolio_id = portfolio_id
         self.fund_id = fund_id
         self.capital = capital
-        self.filled_positions = filled_positions if filled_positions else {}
+        if position_book:
+            self.filled_positions = PositionBook(filled_positions)
+        else:
+            self.filled_positions = PositionLedger(filled_positions)
         self.closed_positions = closed_positions if closed_positions else {}
         self.pending_positions = {}
         self.state = PortfolioState(
@@ -1,2 +1,5 @@
 from .filled_position import FilledPosition
 from .pending_position import PendingPosition
+from .position_ledger import PositionLedger
+from .position_book import PositionBook
+from .position_view import PositionView
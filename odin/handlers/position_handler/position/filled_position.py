@@ -5,7 +5,7 @@ from odin_securities import conn
 # from odin_securities.utilities import get_id_for_symbol, get_id_for_portfolio
 from odin_securities.queries import gets, inserts, updates, exists
 from .pending_position import PendingPosition
-from ....utilities import compute_days_elapsed
+from ....utilities import compute_days_elapsed, compute_relative_value
 from ....utilities.params import (
     Directions, Actions, IB, TradeTypes, ib_commission
 )
@@ -19,6 +19,14 @@ class FilledPosition(PendingPosition):
     long or short, the profit-and-loss on the position at the current time
     period, and the ticker symbol associated with the underlying asset.
     """
+    __slots__ = (
+        "date_entered", "unrealized_pnl", "realized_pnl", "market_value",
+        "buys", "sells", "net", "quantity", "avg_price", "cost_basis",
+        "avg_buys_price", "avg_sells_price", "tot_buys_price",
+        "tot_sells_price", "tot_commission", "net_tot", "net_tot_incl_comm",
+        "ledger", "ledger_value"
+    )
+
     def __init__(
             self,
             symbol,
@@ -58,6 +66,34 @@ class FilledPosition(PendingPosition):
         self.tot_commission = tot_commission
         self.net_tot = self.tot_sells_price - self.tot_buys_price
         self.net_tot_incl_comm = self.net_tot - self.tot_commission
+        # The position ledger holding the position is notified whenever the
+        # relative value of the position changes.
+        self.ledger = None
+        self.ledger_value = 0.0
+        self.__revalue()
+
+    def __getstate__(self):
+        """Copies of the position, whether shallow, deep or pickled, are
+        detached from the position ledger that holds the position so that
+        revaluing a copy does not change the running total of the ledger.
+        """
+        slots = {}
+        for c in type(self).__mro__:
+            for k in c.__dict__.get("__slots__", ()):
+                if hasattr(self, k):
+                    slots[k] = getattr(self, k)
+        slots["ledger"] = None
+        return getattr(self, "__dict__", None), slots
+
+    def __setstate__(self, state):
+        """Restore a copy of the position and recompute its relative value."""
+        attributes, slots = state
+        if attributes:
+            self.__dict__.update(attributes)
+        for k, v in slots.items():
+            setattr(self, k, v)
+        self.ledger_value = 0.0
+        self.__revalue()
 
     def __str__(self):
         """String representation of the filled position object."""
@@ -147,6 +183,21 @@ class FilledPosition(PendingPosition):
         self.market_value = self.net * price
         self.unrealized_pnl = self.market_value - self.cost_basis
         self.realized_pnl = self.market_value + self.net_tot_incl_comm
+        self.__revalue()
+
+    def __revalue(self):
+        """Recompute the relative value of the position and report the change
+        to the position ledger that holds the position, if any. Positions with
+        no holdings have no value.
+        """
+        value = 0.0
+        if self.net != 0:
+            value = compute_relative_value(
+                self.net, self.cost_basis, self.unrealized_pnl
+            )
+        if self.ledger is not None:
+            self.ledger.revalue(value - self.ledger_value)
+        self.ledger_value = value
 
     def compute_holding_period(self, current_date):
         """Compute the time period over which the position has been held. This
@@ -9,7 +9,12 @@ class PendingPosition(object):
     been completed. The pending position represents simply the ticker, the
     quantity of shares in the position, whether or not the strategy is long or
     short the stock, and an identifier for the portfolio.
+
+    The attributes of positions are stored in slots rather than in a dictionary
+    in order to reduce the memory occupied by each position.
     """
+    __slots__ = ("symbol", "direction", "portfolio_id", "trade_type", "action")
+
     def __init__(
             self, symbol, direction, trade_type, portfolio_id
     ):
@@ -0,0 +1,190 @@
+import copy
+import numpy as np
+from .position_view import PositionView
+from ....utilities import compute_relative_value
+from ....utilities.params import Directions
+
+
+class PositionBook(dict):
+    """Position Book Class
+
+    The position book is an alternative to a dictionary of filled position
+    objects in which the numerical attributes of the positions (the number of
+    shares bought and sold, the average prices, the commissions, the market
+    value and so on) and their directions are stored in parallel Numpy arrays.
+    Each position is assigned a slot in the arrays; when a position is closed
+    its slot is freed and reused by the next position that is opened. When the
+    arrays run out of slots their size is doubled.
+
+    The book maps symbols to position views, which behave as filled positions
+    but read and write their attributes from the arrays of the book. As a
+    consequence, portfolio-wide aggregates such as the relative value of the
+    positions or the long and short exposure of the portfolio are computed as
+    single vector reductions.
+
+    Parameters
+    ----------
+    positions (Optional): Dictionary.
+        A dictionary of filled position objects with which to populate the
+        book.
+    capacity (Optional): Integer.
+        The number of slots that are initially allocated.
+    """
+    def __init__(self, positions=None, capacity=16):
+        """Initialize parameters of the position book object."""
+        super(PositionBook, self).__init__()
+        self.columns = {
+            name: np.zeros(capacity, dtype=cast)
+            for name, cast in PositionView.columns
+        }
+        self.direction = np.zeros(capacity, dtype=np.int8)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.free = list(range(capacity - 1, -1, -1))
+        if positions:
+            self.update(positions)
+
+    def __reduce__(self):
+        """Copy or pickle the book by adding detached copies of its positions to
+        an empty book, so that the columns are rebuilt from the positions
+        rather than restored and then written a second time.
+        """
+        positions = []
+        for symbol, view in self.items():
+            position = copy.copy(view)
+            position.detach()
+            positions.append((symbol, position))
+
+        return (self.__class__, (), None, None, iter(positions))
+
+    def __allocate(self):
+        """Retrieve a free slot, doubling the number of slots if none are
+        available.
+        """
+        if not self.free:
+            size = len(self.active)
+            for name, values in self.columns.items():
+                self.columns[name] = np.zeros(2 * size, dtype=values.dtype)
+                self.columns[name][:size] = values
+            for name in ("direction", "active"):
+                values = getattr(self, name)
+                setattr(self, name, np.zeros(2 * size, dtype=values.dtype))
+                getattr(self, name)[:size] = values
+            self.free = list(range(2 * size - 1, size - 1, -1))
+
+        return self.free.pop()
+
+    def __setitem__(self, symbol, position):
+        """Add a position to the book, replacing any position that is already
+        held for the same symbol. The attributes of the position are copied into
+        a slot of the book and a view of the slot is stored.
+        """
+        if symbol in self:
+            del self[symbol]
+
+        slot = self.__allocate()
+        view = PositionView.from_filled_position(position, self, slot)
+        self.direction[slot] = (
+            1 if position.direction == Directions.long_dir else -1
+        )
+        self.active[slot] = True
+        super(PositionBook, self).__setitem__(symbol, view)
+
+    def __delitem__(self, symbol):
+        """Remove a position from the book. The view of the position is detached
+        from the book and its slot is freed for reuse.
+        """
+        view = self[symbol]
+        super(PositionBook, self).__delitem__(symbol)
+        self.active[view.slot] = False
+        self.free.append(view.slot)
+        view.detach()
+
+    def pop(self, symbol, *default):
+        """Remove a position from the book and return its detached view."""
+        if symbol not in self and default:
+            return default[0]
+
+        view = self[symbol]
+        del self[symbol]
+        return view
+
+    def popitem(self):
+        """Remove an arbitrary position from the book and return it along with
+        its symbol.
+        """
+        symbol = next(iter(self))
+        return symbol, self.pop(symbol)
+
+    def clear(self):
+        """Remove every position from the book."""
+        for symbol in list(self):
+            del self[symbol]
+
+    def update(self, *args, **kwargs):
+        """Add every position in a dictionary to the book."""
+        for symbol, position in dict(*args, **kwargs).items():
+            self[symbol] = position
+
+    def setdefault(self, symbol, position=None):
+        """Add a position to the book if no position is held for the symbol and
+        return the position held for the symbol.
+        """
+        if symbol not in self:
+            self[symbol] = position
+
+        return self[symbol]
+
+    def mark_to_market(self, prices):
+        """Update the market value of every position in the book by writing the
+        market values and profits and losses directly into the columns of the
+        book.
+
+        Parameters
+        ----------
+        prices: Numpy array.
+            The current price of the underlying asset of each position, in the
+            order in which the positions are iterated.
+        """
+        slots = np.fromiter(
+            (view.slot for view in self.values()), dtype=int, count=len(self)
+        )
+        c = self.columns
+        market_value = c["net"][slots] * prices
+        c["market_value"][slots] = market_value
+        c["unrealized_pnl"][slots] = market_value - c["cost_basis"][slots]
+        c["realized_pnl"][slots] = market_value + c["net_tot_incl_comm"][slots]
+
+    @property
+    def relative_values(self):
+        """Compute the relative value of the position in every slot of the book.
+        Slots that are free, or whose positions have no holdings, have no value.
+        """
+        net = self.columns["net"].astype(float)
+        cost_basis = self.columns["cost_basis"]
+        unrealized_pnl = self.columns["unrealized_pnl"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            value = compute_relative_value(net, cost_basis, unrealized_pnl)
+
+        return np.where(self.active & (net != 0), value, 0.0)
+
+    @property
+    def relative_value(self):
+        """The total relative value of the positions in the book."""
+        return float(self.relative_values.sum())
+
+    @property
+    def market_value(self):
+        """The total market value of the positions in the book."""
+        return float(self.columns["market_value"][self.active].sum())
+
+    def exposure(self, direction):
+        """Compute the total relative value of the positions in the book that
+        are in the provided direction.
+
+        Parameters
+        ----------
+        direction: Directions enumeration.
+            Whether to compute the long or short exposure of the positions.
+        """
+        sign = 1 if direction == Directions.long_dir else -1
+        return float(self.relative_values[self.direction == sign].sum())
@@ -0,0 +1,131 @@
+import numpy as np
+from ....utilities import compute_relative_value
+
+
+class PositionLedger(dict):
+    """Position Ledger Class
+
+    The position ledger is a dictionary of filled position objects mapping
+    symbols to the corresponding fill representation. In addition, it keeps a
+    running total of the relative value of the positions that it holds, so that
+    the equity of a portfolio can be computed without revaluing every position.
+
+    Positions that are held in the ledger report the change in their relative
+    value to the ledger whenever they are revalued, either because their market
+    value was updated or because shares were transacted.
+
+    Parameters
+    ----------
+    positions (Optional): Dictionary.
+        A dictionary of filled position objects with which to populate the
+        ledger.
+    """
+    def __init__(self, positions=None):
+        """Initialize parameters of the position ledger object."""
+        super(PositionLedger, self).__init__()
+        self.relative_value = 0.0
+        if positions:
+            self.update(positions)
+
+    def __reduce__(self):
+        """Copy or pickle the ledger by adding each of its positions to an empty
+        ledger, so that the running total is recomputed from the positions
+        rather than restored and then accumulated a second time.
+        """
+        return (self.__class__, (), None, None, iter(self.items()))
+
+    def __setitem__(self, symbol, position):
+        """Add a position to the ledger, replacing any position that is already
+        held for the same symbol.
+        """
+        if symbol in self:
+            del self[symbol]
+
+        super(PositionLedger, self).__setitem__(symbol, position)
+        position.ledger = self
+        self.relative_value += position.ledger_value
+
+    def __delitem__(self, symbol):
+        """Remove a position from the ledger. When the ledger is emptied the
+        running total is reset so that rounding errors do not accumulate.
+        """
+        position = self[symbol]
+        super(PositionLedger, self).__delitem__(symbol)
+        position.ledger = None
+        self.relative_value -= position.ledger_value
+        if not self:
+            self.relative_value = 0.0
+
+    def pop(self, symbol, *default):
+        """Remove a position from the ledger and return it."""
+        if symbol not in self and default:
+            return default[0]
+
+        position = self[symbol]
+        del self[symbol]
+        return position
+
+    def popitem(self):
+        """Remove an arbitrary position from the ledger and return it along
+        with its symbol.
+        """
+        symbol = next(iter(self))
+        return symbol, self.pop(symbol)
+
+    def clear(self):
+        """Remove every position from the ledger."""
+        for symbol in list(self):
+            del self[symbol]
+
+    def update(self, *args, **kwargs):
+        """Add every position in a dictionary to the ledger."""
+        for symbol, position in dict(*args, **kwargs).items():
+            self[symbol] = position
+
+    def setdefault(self, symbol, position=None):
+        """Add a position to the ledger if no position is held for the symbol
+        and return the position held for the symbol.
+        """
+        if symbol not in self:
+            self[symbol] = position
+
+        return self[symbol]
+
+    def revalue(self, delta):
+        """Adjust the running total of relative value by the change in the
+        relative value of one of the positions held in the ledger.
+        """
+        self.relative_value += delta
+
+    def mark_to_market(self, prices):
+        """Update the market value of every position in the ledger. The market
+        values, profits and losses and relative values are computed for all of
+        the positions at once, and the running total is adjusted once by the
+        total change in relative value.
+
+        Parameters
+        ----------
+        prices: Numpy array.
+            The current price of the underlying asset of each position, in the
+            order in which the positions are iterated.
+        """
+        positions = list(self.values())
+        net = np.array([p.net for p in positions], dtype=float)
+        cost_basis = np.array([p.cost_basis for p in positions])
+        net_tot_incl_comm = np.array([p.net_tot_incl_comm for p in positions])
+        ledger_value = np.array([p.ledger_value for p in positions])
+        market_value = net * prices
+        unrealized_pnl = market_value - cost_basis
+        realized_pnl = market_value + net_tot_incl_comm
+        with np.errstate(divide="ignore", invalid="ignore"):
+            value = np.where(net != 0, compute_relative_value(
+                net, cost_basis, unrealized_pnl
+            ), 0.0)
+
+        for p, mv, upnl, rpnl, v in zip(
+                positions, market_value.tolist(), unrealized_pnl.tolist(),
+                realized_pnl.tolist(), value.tolist()
+        ):
+            p.market_value, p.unrealized_pnl, p.realized_pnl = mv, upnl, rpnl
+            p.ledger_value = v
+        self.revalue(float((value - ledger_value).sum()))
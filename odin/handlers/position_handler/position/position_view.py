@@ -0,0 +1,79 @@
+from .filled_position import FilledPosition
+
+
+def column_property(name, cast):
+    """Create a property that reads and writes an attribute of a position view
+    from the corresponding column of its position book. Once a view has been
+    detached from its book, the attribute is stored on the view itself.
+    """
+    def fget(self):
+        if self.book is None:
+            return self.__dict__[name]
+        return cast(self.book.columns[name][self.slot])
+
+    def fset(self, value):
+        if self.book is None:
+            self.__dict__[name] = value
+        else:
+            self.book.columns[name][self.slot] = value
+
+    return property(fget, fset)
+
+
+class PositionView(FilledPosition):
+    """Position View Class
+
+    The position view is a thin representation of a position that is stored in
+    a slot of a position book. It behaves exactly as a filled position, except
+    that the numerical attributes of the position are read from and written to
+    the columns of the position book rather than being stored on the object.
+    This allows the portfolio-wide aggregates of the position book to be
+    computed as vector reductions while existing code continues to interact
+    with individual positions.
+
+    When the position is removed from the book, the view is detached: the
+    values of its attributes are copied onto the view so that it remains valid
+    after its slot has been reused by another position.
+    """
+    # The numerical attributes of a filled position and their types. These
+    # attributes are stored in the columns of a position book.
+    columns = (
+        ("buys", int), ("sells", int), ("net", int), ("quantity", int),
+        ("avg_price", float), ("cost_basis", float),
+        ("avg_buys_price", float), ("avg_sells_price", float),
+        ("tot_buys_price", float), ("tot_sells_price", float),
+        ("tot_commission", float), ("net_tot", float),
+        ("net_tot_incl_comm", float), ("market_value", float),
+        ("unrealized_pnl", float), ("realized_pnl", float),
+    )
+
+    @classmethod
+    def from_filled_position(cls, position, book, slot):
+        """Create a view of a filled position in the provided slot of a position
+        book, writing the numerical attributes of the position into the
+        columns of the book.
+        """
+        view = cls.__new__(cls)
+        view.book, view.slot = book, slot
+        names = set(name for name, _ in cls.columns)
+        for c in type(position).__mro__:
+            for k in c.__dict__.get("__slots__", ()):
+                if k not in names and hasattr(position, k):
+                    setattr(view, k, getattr(position, k))
+        view.ledger = None
+        for name, _ in cls.columns:
+            book.columns[name][slot] = getattr(position, name)
+
+        return view
+
+    def detach(self):
+        """Copy the values of the numerical attributes of the position from its
+        position book onto the view and detach the view from the book.
+        """
+        values = {name: getattr(self, name) for name, _ in self.columns}
+        self.book, self.slot = None, None
+        self.__dict__.update(values)
+
+
+for name, cast in PositionView.columns:
+    setattr(PositionView, name, column_property(name, cast))
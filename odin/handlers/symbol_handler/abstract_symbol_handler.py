@@ -7,12 +7,20 @@ class AbstractSymbolHandler(object):
     The symbol handler class is responsible for determining which stocks should
     have their prices retrieved for processing and potential trading during the
     next trading period.
+
+    Because the selection of symbols can be expensive (for instance, requiring
+    a query to the database and a ranking of the entire market), selections are
+    memoized by the date and by the positions held by the portfolios at the time
+    of selection. Data handlers should retrieve symbols with the `selection`
+    method so that repeated requests for the same trading period are served
+    from the cache.
     """
     __metaclass__ = ABCMeta
 
     def __init__(self, portfolio_handlers):
         """Initialize parameters of the abstract symbol handler object."""
         self.portfolio_handlers = portfolio_handlers
+        self.__selections = {}
 
     @abstractmethod
     def select_symbols(self, date):
@@ -22,6 +30,43 @@ class AbstractSymbolHandler(object):
         """
         raise NotImplementedError()
 
+    @property
+    def held_positions(self):
+        """The symbols of the positions currently held by the portfolios."""
+        return frozenset(
+            pos for p in self.portfolio_handlers for pos in p.filled_positions
+        )
+
+    def selection(self, date):
+        """Retrieve the symbols selected for the provided date. The symbols are
+        only selected afresh if no selection has been made for the date given
+        the positions that are currently held; otherwise the previous selection
+        is reused. Selections for earlier dates are discarded when a new date is
+        requested.
+
+        Parameters
+        ----------
+        date: Datetime object.
+            The date for which symbols should be selected.
+        """
+        key = (date, self.held_positions)
+        if key not in self.__selections:
+            self.__selections = {
+                k: v for k, v in self.__selections.items() if k[0] == date
+            }
+            self.__selections[key] = self.select_symbols(date)
+
+        return list(self.__selections[key])
+
+    def invalidate(self):
+        """Discard every memoized selection of symbols. This should be called
+        whenever the inputs to the selection change in a way that is not
+        captured by the date and the held positions; for instance, when the
+        positions of a portfolio are modified outside of its portfolio handler
+        or when the universe of symbols is changed.
+        """
+        self.__selections = {}
+
     def append_positions(self, selected):
         """If a fund (which consists of portfolios) holds positions, then it is
         critical that price and volume data be available for those positions.
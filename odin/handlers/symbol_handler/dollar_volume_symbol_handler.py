@@ -1,3 +1,4 @@
+import numpy as np
 from odin_securities.queries import gets
 from .abstract_symbol_handler import AbstractSymbolHandler
 from ...utilities.finance import Indices, untradeable_assets
@@ -10,8 +11,17 @@ class DollarVolumeSymbolHandler(AbstractSymbolHandler):
     to the total dollar volume transacted during the previous trading session.
     The symbol handler ignores the S&P 100 and S&P 500 indices which have huge
     volume.
+
+    When a range of dates is provided, the closing prices and volumes for the
+    entire range are downloaded once and the top stocks on every date are
+    computed in a single vectorized pass. The selections are stored as a
+    boolean membership matrix whose rows correspond to dates and whose columns
+    correspond to symbols, so that selecting symbols on a date is a lookup.
     """
-    def __init__(self, n, portfolio_handlers, symbols=None):
+    def __init__(
+            self, n, portfolio_handlers, symbols=None, source=gets,
+            start_date=None, end_date=None
+    ):
         """Initialize parameters of the dollar volume symbol handler object.
 
         Parameters
@@ -23,14 +33,54 @@ class DollarVolumeSymbolHandler(AbstractSymbolHandler):
         symbols (optional): List of strings.
             An input specifying a particular list of tickers to which the dollar
             volume ordering should be restricted.
+        source (Optional): Object implementing a `prices` query.
+            The source from which price and volume data is obtained, such as a
+            price cube cache. By default this is the query module of the Odin
+            Securities master database.
+        start_date, end_date (Optional): Datetime objects.
+            The range of dates for which the selections should be precomputed.
+            This should include the trading session preceding the first session
+            of the backtest. Selections for dates outside of this range are
+            computed by querying the source.
         """
         super(DollarVolumeSymbolHandler, self).__init__(portfolio_handlers)
         self.n = n
         self.symbols = symbols
+        self.source = source
+        self.membership = None
+        if start_date is not None and end_date is not None:
+            self.__precompute(start_date, end_date)
+
+    def __precompute(self, start_date, end_date):
+        """Compute the membership of the top stocks according to dollar volume
+        on every date in the provided range.
+        """
+        bars = self.source.prices(start_date, end_date, self.symbols)
+        self.dates, self.universe = bars.major_axis, bars.minor_axis
+        dv = bars["adj_price_close"].values * bars["adj_volume"].values
+        # Missing and untradeable assets can never be selected.
+        valid = ~np.isnan(dv)
+        valid[:, self.universe.isin(untradeable_assets)] = False
+        dv = np.where(valid, dv, -np.inf)
+        # Partition each row so that the largest dollar volumes come first.
+        if self.n < dv.shape[1]:
+            top = np.argpartition(-dv, self.n, axis=1)[:, :self.n]
+            self.membership = np.zeros(dv.shape, dtype=bool)
+            self.membership[np.arange(len(dv))[:, np.newaxis], top] = True
+            self.membership &= valid
+        else:
+            self.membership = valid
 
     def select_symbols(self, date):
         """Implementation of abstract base class method."""
-        bars = gets.prices(date, symbols=self.symbols)
+        if self.membership is not None:
+            i = self.dates.searchsorted(date)
+            if i < len(self.dates) and self.dates[i] == date:
+                return self.append_positions(
+                    list(self.universe[self.membership[i]])
+                )
+
+        bars = self.source.prices(date, symbols=self.symbols)
         dv = bars.ix["adj_price_close", -1, :] * bars.ix["adj_volume", -1, :]
         rank = dv.sort_values(ascending=False).dropna()
         return self.append_positions(
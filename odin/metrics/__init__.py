@@ -1,4 +1,7 @@
 from .compute_drawdowns import compute_drawdowns
 from .compute_sharpe_ratio import compute_sharpe_ratio
 from .performance_summary import performance_summary
+from .online_metrics import OnlineMetrics
 from .visualizer import Visualizer
+from .compute_trade_returns import compute_trade_returns
+from .bootstrap_performance import bootstrap_performance
@@ -0,0 +1,130 @@
+"""Bootstrap Performance Module
+
+Estimate the sampling distribution of the performance metrics of a strategy by
+resampling its returns. The performance summary reports a single estimate of
+the Sharpe ratio, the maximum drawdown and the annualized returns, which may be
+misleading when the backtest is short or the returns are dominated by a handful
+of trading sessions. Instead, many alternative equity paths are generated with
+a circular block bootstrap: each path is assembled from blocks of consecutive
+returns whose starting points are drawn uniformly at random, wrapping around the
+end of the series, which preserves the serial dependence of the returns within
+each block. The performance metrics of every path are then computed.
+
+The paths are generated in chunks as two-dimensional arrays whose rows are the
+paths, and the metrics of every path in a chunk are computed with vectorized
+operations. The chunks may be distributed across a pool of processes; each
+chunk is given its own random seed, spawned deterministically from the seed
+provided by the caller, so the results do not depend on the number of processes
+that generated them.
+"""
+import multiprocessing
+import numpy as np
+import pandas as pd
+from .compute_drawdowns import compute_drawdowns
+
+
+def bootstrap_chunk(args):
+    """Generate a chunk of block-bootstrapped equity paths and compute the
+    Sharpe ratio, maximum drawdown and its duration, and annualized returns of
+    each path.
+
+    Parameters
+    ----------
+    args: Tuple.
+        The returns to resample, the number of paths, the number of returns in
+        each block, the annualization constant and the seed of the chunk.
+    """
+    returns, n_paths, block_size, periods, seed = args
+    rng = np.random.default_rng(seed)
+    n = len(returns)
+    n_blocks = -(-n // block_size)
+    # Draw the starting point of each block and expand the blocks into the
+    # indices of the resampled returns.
+    starts = rng.integers(0, n, size=(n_paths, n_blocks, 1))
+    index = (starts + np.arange(block_size)).reshape(n_paths, -1)[:, :n] % n
+    paths = returns[index]
+
+    # The equity curve of each path begins with unit equity. The curves are
+    # placed in the columns of the array of equity.
+    equity = np.ones((n + 1, n_paths))
+    np.cumprod(1. + paths.T, axis=0, out=equity[1:])
+    drawdown, duration = compute_drawdowns(equity)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = (
+            np.sqrt(periods) * paths.mean(axis=1) / paths.std(axis=1, ddof=1)
+        )
+    annualized = equity[-1] ** (periods / (n + 1))
+
+    return np.column_stack((sharpe, drawdown, duration, annualized))
+
+
+def bootstrap_performance(
+        returns, n_paths=10000, block_size=20, periods=252.0, seed=0,
+        n_jobs=1, chunk_size=1000
+):
+    """Computes the distribution of the performance metrics of a strategy over
+    equity paths generated by a circular block bootstrap of its returns. The
+    metrics agree in their definitions with those of the performance summary.
+
+    Parameters
+    ----------
+    returns: Portfolio history object or Pandas series.
+        Either the history of a portfolio, whose returns in each time period are
+        resampled, or a series of returns. For instance, the returns of each of
+        the trades in the blotter of a portfolio may be resampled, in which case
+        the annualization constant should be the number of trades per year and
+        the equity paths assume that the proceeds of each trade are reinvested
+        in the next.
+    n_paths (Optional): Integer.
+        The number of equity paths to generate.
+    block_size (Optional): Integer.
+        The number of consecutive returns in each block. A block size of one
+        corresponds to resampling the returns independently.
+    periods (Optional): Float.
+        The annualization constant for the Sharpe ratio and returns. By default,
+        this corresponds to daily returns.
+    seed (Optional): Integer.
+        The seed from which the random seed of each chunk of paths is spawned.
+    n_jobs (Optional): Integer.
+        The number of processes across which the chunks of paths are generated.
+        By default, the paths are generated in the calling process.
+    chunk_size (Optional): Integer.
+        The number of paths generated in each chunk, which bounds the memory
+        required to hold the resampled returns.
+
+    Returns
+    -------
+    distribution: Pandas data frame object.
+        The Sharpe ratio, maximum drawdown, maximum drawdown duration and
+        annualized returns of each equity path.
+    """
+    # Extract the returns of each time period of a portfolio history.
+    if hasattr(returns, "compute_attributes"):
+        returns.compute_attributes()
+        returns = returns.returns
+    returns = np.asarray(returns, dtype=float)
+    returns = returns[~np.isnan(returns)]
+    if len(returns) < 2:
+        raise ValueError("At least two returns are required to bootstrap.")
+
+    # Divide the paths into chunks, each with its own seed.
+    sizes = [chunk_size] * (n_paths // chunk_size)
+    if n_paths % chunk_size:
+        sizes.append(n_paths % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [
+        (returns, size, block_size, periods, s) for size, s in zip(sizes, seeds)
+    ]
+    if n_jobs == 1:
+        chunks = [bootstrap_chunk(t) for t in tasks]
+    else:
+        pool = multiprocessing.Pool(n_jobs)
+        try:
+            chunks = pool.map(bootstrap_chunk, tasks, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+
+    return pd.DataFrame(np.vstack(chunks), columns=[
+        "sharpe ratio", "max drawdown", "max duration", "annualized returns"
+    ])
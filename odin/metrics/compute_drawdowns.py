@@ -1,13 +1,16 @@
 """Drawdowns Module
 
 Calculate the largest peak-to-trough drawdown of the profit-and-loss curve as
-well as the duration of the drawdown. This function requires that the equity
-curve is represented by a pandas series object. Drawdowns measure simultaneously
-the maximum amount of capital that has been lost in the course of a strategy in
-addition to the amount of time elapsed since the strategy was able to recover
-from losses. As a rule of thumb, strategies with large (more than ten percent)
-or lengthy (more than four months) drawdowns will not have large Sharpe ratios.
+well as the duration of the drawdown. The equity curve may be represented by a
+pandas series object or, in order to compute the drawdowns of many equity
+curves at once, by a pandas data frame or a Numpy array whose columns are the
+individual equity curves. Drawdowns measure simultaneously the maximum amount
+of capital that has been lost in the course of a strategy in addition to the
+amount of time elapsed since the strategy was able to recover from losses. As a
+rule of thumb, strategies with large (more than ten percent) or lengthy (more
+than four months) drawdowns will not have large Sharpe ratios.
 """
+import numpy as np
 import pandas as pd
 
 
@@ -15,28 +18,48 @@ def compute_drawdowns(equity_curve, return_max=True):
     """Computes the drawdown time-series for a provided equity curve. Returns
     both the drawdowns and their durations (or the maximums thereof).
 
+    The duration of a drawdown is the number of consecutive time periods that
+    the equity has spent below its high water mark. It is computed without a
+    loop by counting the time periods spent below the high water mark and
+    subtracting the count at the most recent time period that was not.
+
     Parameters
     ----------
-    equity_curve: Pandas data frame.
-        A Pandas data frame whose index is a time series of dates corresponding
-        to trading days over the course of a historical time period.
+    equity_curve: Pandas series, Pandas data frame or Numpy array.
+        Either a single equity curve whose index is a time series of dates
+        corresponding to trading days over the course of a historical time
+        period, or a collection of equity curves whose rows correspond to the
+        time periods and whose columns correspond to the curves.
     return_max (Optional): Boolean.
         A boolean indicator for whether or not the time series of the drawdown
         is returned or if only the maximums for the series should be returned.
+        When there are multiple equity curves, the maximums of each curve are
+        returned.
     """
     # Calculate the cumulative returns curve and set up the high water mark.
     # Then create the drawdown and duration series.
-    hwm = equity_curve.cummax()
-    drawdown = (hwm - equity_curve) / hwm
-    eq_idx = equity_curve.index
-    duration = pd.Series(index=eq_idx)
-
-    # Loop over the index range.
-    for date_ind in range(len(eq_idx)):
-        duration.ix[date_ind] = (
-            0 if drawdown.ix[date_ind] == 0
-            else duration.ix[date_ind - 1] + 1
-        )
+    values = np.asarray(equity_curve, dtype=float)
+    hwm = np.fmax.accumulate(values, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown = (hwm - values) / hwm
+
+    # The duration resets to zero whenever the equity is at its high water mark.
+    underwater = drawdown != 0
+    count = np.cumsum(underwater, axis=0)
+    reset = np.maximum.accumulate(np.where(underwater, 0, count), axis=0)
+    duration = (count - reset).astype(float)
+
+    if isinstance(equity_curve, pd.Series):
+        drawdown = pd.Series(drawdown, index=equity_curve.index)
+        duration = pd.Series(duration, index=equity_curve.index)
+    elif isinstance(equity_curve, pd.DataFrame):
+        index, columns = equity_curve.index, equity_curve.columns
+        drawdown = pd.DataFrame(drawdown, index=index, columns=columns)
+        duration = pd.DataFrame(duration, index=index, columns=columns)
+    elif return_max:
+        return np.nanmax(drawdown, axis=0), np.nanmax(duration, axis=0)
+    else:
+        return drawdown, duration
 
     if return_max:
         return drawdown.max(), duration.max()
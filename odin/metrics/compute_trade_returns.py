@@ -0,0 +1,36 @@
+"""Trade Returns Module
+
+Compute the return of each completed trade in the blotter of closed positions of
+a portfolio. The return of a trade is the profit or loss that was realized when
+the position was closed, net of commissions, relative to the capital committed
+to the position: the total cost of the shares purchased for a long position, or
+the total proceeds of the shares sold short for a short position.
+"""
+import numpy as np
+import pandas as pd
+from ..utilities.params import Directions
+
+
+def compute_trade_returns(closed_positions):
+    """Computes the returns of the closed positions of a portfolio, ordered by
+    the date on which each position was closed.
+
+    Parameters
+    ----------
+    closed_positions: Dictionary.
+        A dictionary mapping dates to the lists of filled positions that were
+        closed on those dates, as maintained by a portfolio handler.
+    """
+    dates, returns = [], []
+    for date in sorted(closed_positions):
+        for pos in closed_positions[date]:
+            if pos.direction == Directions.long_dir:
+                committed = pos.tot_buys_price
+            else:
+                committed = pos.tot_sells_price
+            dates.append(date)
+            returns.append(
+                pos.realized_pnl / committed if committed else np.nan
+            )
+
+    return pd.Series(returns, index=pd.DatetimeIndex(dates))
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+
+
+class OnlineMetrics(object):
+    """Online Metrics Class
+
+    The online metrics object accumulates the performance metrics of a
+    portfolio while it is being traded, rather than computing them from the
+    full history of the portfolio once trading has concluded. Each time the
+    equity of the portfolio is recorded the metrics are updated in constant
+    time:
+        1. The mean and variance of the returns are updated using Welford's
+           algorithm, from which the Sharpe ratio is computed.
+        2. A running high water mark is maintained together with the current
+           drawdown and its duration, as well as their maximums.
+        3. A running product of the gross returns is maintained, from which the
+           annualized returns are computed.
+        4. The mean number of positions held by the portfolio is maintained.
+
+    This makes the performance of a portfolio available during a backtest, for
+    instance for monitoring or to terminate unpromising backtests early. The
+    metrics agree with those reported by the performance summary.
+
+    Parameters
+    ----------
+    periods (Optional): Float.
+        The annualization constant for the Sharpe ratio and returns. By default,
+        this corresponds to daily trading sessions.
+    """
+    def __init__(self, periods=252.0):
+        """Initialize parameters of the online metrics object."""
+        self.periods = periods
+        self.n_states, self.n_returns = 0, 0
+        self.equity, self.max_equity = np.nan, np.nan
+        self.mean_returns, self.m2_returns = 0.0, 0.0
+        self.gross_returns = 1.0
+        self.drawdown, self.duration = 0.0, 0
+        self.max_drawdown, self.max_duration = 0.0, 0
+        self.avg_positions = 0.0
+
+    def update(self, equity, n_positions):
+        """Update the metrics with the equity of the portfolio and the number
+        of positions that it holds at the conclusion of a trading session.
+
+        Parameters
+        ----------
+        equity: Float.
+            The equity of the portfolio.
+        n_positions: Integer.
+            The number of positions held by the portfolio.
+        """
+        # Update the mean and variance of the returns and the product of the
+        # gross returns.
+        if self.n_states > 0:
+            returns = equity / self.equity - 1.
+            self.n_returns += 1
+            delta = returns - self.mean_returns
+            self.mean_returns += delta / self.n_returns
+            self.m2_returns += delta * (returns - self.mean_returns)
+            self.gross_returns *= 1. + returns
+
+        # Update the high water mark and the drawdown. The duration of the
+        # drawdown is the number of sessions spent below the high water mark.
+        self.equity = equity
+        self.max_equity = np.fmax(self.max_equity, equity)
+        self.drawdown = (self.max_equity - equity) / self.max_equity
+        self.duration = self.duration + 1 if self.drawdown != 0 else 0
+        self.max_drawdown = max(self.max_drawdown, self.drawdown)
+        self.max_duration = max(self.max_duration, self.duration)
+
+        # Update the mean number of positions.
+        self.n_states += 1
+        self.avg_positions += (n_positions - self.avg_positions) / self.n_states
+
+    @property
+    def sharpe_ratio(self):
+        """The annualized Sharpe ratio of the returns so far."""
+        if self.n_returns < 2:
+            return np.nan
+
+        std = np.sqrt(self.m2_returns / (self.n_returns - 1))
+        return np.sqrt(self.periods) * self.mean_returns / std
+
+    @property
+    def annualized_returns(self):
+        """The annualized gross returns of the portfolio so far."""
+        if self.n_states == 0:
+            return np.nan
+
+        return self.gross_returns ** (self.periods / self.n_states)
+
+    def summary(self, portfolio_id):
+        """Report the current metrics in the same format as the performance
+        summary.
+
+        Parameters
+        ----------
+        portfolio_id: String.
+            A unique identifier assigned to the portfolio.
+        """
+        columns = [
+            "total equity", "max equity", "max drawdown", "max duration",
+            "sharpe ratio", "avg positions", "annualized returns"
+        ]
+        values = [
+            self.equity, self.max_equity, self.max_drawdown,
+            float(self.max_duration), self.sharpe_ratio, self.avg_positions,
+            self.annualized_returns
+        ]
+        return pd.DataFrame([values], index=[portfolio_id], columns=columns)
@@ -6,7 +6,6 @@ import matplotlib.gridspec as gridspec
 import matplotlib.dates as mdates
 from matplotlib.ticker import FuncFormatter
 from matplotlib import cm
-from ..utilities.params import Directions
 from .compute_drawdowns import compute_drawdowns
 from .compute_sharpe_ratio import compute_sharpe_ratio
 
@@ -26,21 +25,20 @@ class Visualizer(object):
             ax = plt.gca()
 
         for i, p in enumerate(fund.fund_handler.portfolios):
-            states = p.history.states
-            dates = list(states.keys())
+            # Aggregate the relative value of the long and short positions in
+            # each recorded state directly from the columns of the history.
+            history = p.history
+            states = history.position_states()
+            value = history.position_column("relative_value")
+            direction = history.position_column("direction")
             columns = ("long", "short", "ratio")
-            equity = pd.DataFrame(index=dates, columns=columns)
-            for d in dates:
-                filled = states[d].filled_positions
-                equity.ix[d, "long"] = np.sum([
-                    f.relative_value for f in filled.values()
-                    if f.direction == Directions.long_dir
-                ])
-                equity.ix[d, "short"] = np.sum([
-                    f.relative_value for f in filled.values()
-                    if f.direction == Directions.short_dir
-                ])
-                equity["ratio"] = equity["long"] / (equity["long"] + equity["short"])
+            equity = pd.DataFrame(index=history.dates, columns=columns)
+            for v, sign in (("long", 1), ("short", -1)):
+                equity[v] = np.bincount(
+                    states, np.where(direction == sign, value, 0.),
+                    minlength=len(history)
+                )
+            equity["ratio"] = equity["long"] / (equity["long"] + equity["short"])
 
             for v in ("long", "short"):
                 ax.plot(
@@ -112,16 +110,25 @@ class Visualizer(object):
 
         return ax
 
+    def __drawdowns(self, fund):
+        """Compute the drawdowns and their durations for the equity curves of
+        all of the portfolios in the fund at once.
+        """
+        equity = pd.concat([
+            p.history.equity for p in fund.fund_handler.portfolios
+        ], axis=1, keys=[
+            p.portfolio_handler.portfolio_id
+            for p in fund.fund_handler.portfolios
+        ])
+        return compute_drawdowns(equity, False)
+
     def drawdown_percentage(self, fund, ax=None):
         if ax is None:
             ax = plt.gca()
 
-        for i, p in enumerate(fund.fund_handler.portfolios):
-            dd, dur = compute_drawdowns(p.history.equity, False)
-            ax.plot(
-                dd.index, dd, lw=2.,
-                label=p.portfolio_handler.portfolio_id.title()
-            )
+        dd, dur = self.__drawdowns(fund)
+        for pid in dd:
+            ax.plot(dd.index, dd[pid], lw=2., label=pid.title())
             ax.grid()
 
         ax.set_xlabel("Date", fontsize=15.)
@@ -135,12 +142,9 @@ class Visualizer(object):
         if ax is None:
             ax = plt.gca()
 
-        for i, p in enumerate(fund.fund_handler.portfolios):
-            dd, dur = compute_drawdowns(p.history.equity, False)
-            ax.plot(
-                dur.index, dur, lw=2.,
-                label=p.portfolio_handler.portfolio_id.title()
-            )
+        dd, dur = self.__drawdowns(fund)
+        for pid in dur:
+            ax.plot(dur.index, dur[pid], lw=2., label=pid.title())
             ax.grid()
 
         ax.set_xlabel("Date", fontsize=15.)
@@ -0,0 +1,3 @@
+from ..handlers.data_handler.sources.shared_prices import SharedPrices
+from .parameter_sweep import ParameterSweep
+from .walk_forward_optimization import WalkForwardOptimization
@@ -0,0 +1,236 @@
+import datetime as dt
+import itertools
+import multiprocessing
+import pandas as pd
+from odin_securities.queries import gets
+from ..handlers.data_handler.sources.shared_prices import SharedPrices
+
+
+# The shared prices to which a worker process of a parameter sweep is attached
+# and any features that were precomputed from them.
+worker_prices, worker_features = None, None
+
+
+def initialize_worker(spec, features=None):
+    """Attach a worker process of a parameter sweep to the shared prices and
+    precompute any features from them.
+
+    Parameters
+    ----------
+    spec: Dictionary.
+        The specification of the shared prices.
+    features (Optional): Function.
+        A function that precomputes features from the shared prices.
+    """
+    global worker_prices, worker_features
+    worker_prices = SharedPrices.attach(spec)
+    if features is not None:
+        worker_features = features(worker_prices)
+
+
+def build_worker_fund(build_fund, kwargs):
+    """Construct a simulated fund in a worker process of a parameter sweep from
+    the shared prices, passing the precomputed features if there are any.
+    """
+    if worker_features is not None:
+        kwargs = dict(kwargs, features=worker_features)
+    return build_fund(worker_prices, **kwargs)
+
+
+def evaluate_parameters(args):
+    """Construct and trade a simulated fund for a combination of parameters in a
+    worker process of a parameter sweep and return its performance summary.
+
+    Parameters
+    ----------
+    args: Tuple.
+        The function that constructs the simulated fund and the dictionary of
+        keyword arguments with which it is called.
+    """
+    fund = build_worker_fund(*args)
+    fund.trade()
+    return fund.performance_summary()
+
+
+def trade_parameters(args):
+    """Construct and trade a simulated fund for a combination of parameters in a
+    worker process of a parameter sweep. The performance summary of the fund is
+    returned, together with the identifier, initial equity and history of each
+    of its portfolios.
+
+    Parameters
+    ----------
+    args: Tuple.
+        The function that constructs the simulated fund and the dictionary of
+        keyword arguments with which it is called.
+    """
+    fund = build_worker_fund(*args)
+    portfolios = fund.fund_handler.portfolios
+    initial = [p.portfolio_handler.state.equity for p in portfolios]
+    fund.trade()
+    histories = [
+        (p.portfolio_handler.portfolio_id, e, p.history)
+        for p, e in zip(portfolios, initial)
+    ]
+    return fund.performance_summary(), histories
+
+
+class ParameterSweep(object):
+    """Parameter Sweep Class
+
+    The parameter sweep backtests a fund for every combination of a grid of
+    parameters in parallel across a pool of processes. The price history of the
+    backtest is downloaded exactly once and placed in shared memory; each
+    worker process attaches to it and serves the prices of its backtests from
+    that single copy. The performance summaries of the backtests are collected
+    into a single data frame that is indexed by the parameters and by the
+    portfolio (or fund) to which each row of metrics belongs.
+
+    The fund is constructed by a function that accepts the shared prices as its
+    first argument and the parameters as keyword arguments. The function should
+    create a database data handler whose source is the shared prices and with
+    preloading enabled, so that the prices are not copied:
+
+        def build_fund(source, short_window, long_window):
+            ...
+            dh = DatabaseDataHandler(
+                events, sh, start_date, end_date, n_init, preload=True,
+                source=source
+            )
+            ...
+            return SimulatedFund(dh, eh, fh)
+
+    The function is sent to the worker processes and must therefore be defined
+    at the top level of a module. Features that do not depend on the parameters,
+    such as indicators computed over the entire price history, may be computed
+    once in each worker process by providing a function that accepts the shared
+    prices; its result is then passed to the function that constructs the fund
+    as the `features` keyword argument.
+
+    Parameters
+    ----------
+    build_fund: Function.
+        The function that constructs a simulated fund for a combination of
+        parameters.
+    grid: Dictionary.
+        A mapping from the name of each parameter to the list of values that it
+        should take.
+    start_date: Datetime object.
+        The date on which the backtests begin.
+    end_date: Datetime object.
+        The date on which the backtests end.
+    n_init: Integer.
+        The largest number of days of initial data that is required by any of
+        the data handlers of the backtests.
+    n_jobs (Optional): Integer.
+        The number of worker processes. By default, one process is used for
+        each processor.
+    source (Optional): Object implementing a `prices` query.
+        The source from which the price history is downloaded. By default this
+        is the query module of the Odin Securities master database.
+    features (Optional): Function.
+        A function that precomputes features from the shared prices.
+    """
+    def __init__(
+            self, build_fund, grid, start_date, end_date, n_init, n_jobs=None,
+            source=gets, features=None
+    ):
+        """Initialize parameters of the parameter sweep object."""
+        self.build_fund = build_fund
+        self.grid = grid
+        self.start_date = start_date
+        self.end_date = end_date
+        self.n_init = n_init
+        self.n_jobs = n_jobs
+        self.source = source
+        self.features = features
+
+    @property
+    def names(self):
+        """The names of the parameters of the sweep."""
+        return list(self.grid)
+
+    @property
+    def combinations(self):
+        """A list of dictionaries containing every combination of the values of
+        the parameters.
+        """
+        return [
+            dict(zip(self.names, values)) for values in
+            itertools.product(*[self.grid[n] for n in self.names])
+        ]
+
+    def share_prices(self):
+        """Download the price history required by the backtests into shared
+        memory. The window of prices matches the window that is preloaded by a
+        database data handler, so that it includes the initial bars.
+        """
+        sessions = gets.standard_sessions(self.start_date, self.end_date)
+        start_date = sessions["datetime"].iloc[0]
+        return SharedPrices(
+            start_date - dt.timedelta(days=self.n_init + 1),
+            sessions["datetime"].iloc[-1], self.source
+        )
+
+    def map(self, prices, function, tasks):
+        """Apply a function to each of a list of tasks in a pool of worker
+        processes that are attached to the shared prices.
+
+        Parameters
+        ----------
+        prices: Shared prices object.
+            The shared prices from which the backtests are served.
+        function: Function.
+            The function that is applied to each task in a worker process. It
+            must be defined at the top level of a module.
+        tasks: List.
+            The arguments of each application of the function.
+        """
+        pool = multiprocessing.Pool(
+            self.n_jobs, initializer=initialize_worker,
+            initargs=(prices.spec, self.features)
+        )
+        try:
+            return pool.map(function, tasks, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+
+    def run(self):
+        """Backtest the fund for every combination of parameters and return the
+        performance summaries of the backtests.
+        """
+        combinations = self.combinations
+        prices = self.share_prices()
+        try:
+            summaries = self.map(prices, evaluate_parameters, [
+                (self.build_fund, params) for params in combinations
+            ])
+        finally:
+            prices.unlink()
+
+        return self.aggregate(combinations, summaries)
+
+    def aggregate(self, combinations, summaries):
+        """Combine the performance summaries of the backtests into a single data
+        frame indexed by the parameters of each backtest and the identifier of
+        each portfolio.
+
+        Parameters
+        ----------
+        combinations: List of dictionaries.
+            The parameters of each backtest.
+        summaries: List of pandas data frames.
+            The performance summaries of each backtest.
+        """
+        frames = []
+        for params, summary in zip(combinations, summaries):
+            summary = summary.copy()
+            summary.index.name = "portfolio"
+            for n in reversed(self.names):
+                summary.insert(0, n, params[n])
+            frames.append(summary.reset_index())
+
+        return pd.concat(frames, ignore_index=True).set_index(
+            self.names + ["portfolio"]
+        )
@@ -0,0 +1,182 @@
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from odin_securities.queries import gets
+from .parameter_sweep import (
+    ParameterSweep, evaluate_parameters, trade_parameters
+)
+from .. import metrics
+from ..portfolio.components import PortfolioHistory
+
+
+class WalkForwardOptimization(ParameterSweep):
+    """Walk-Forward Optimization Class
+
+    The walk-forward optimization validates the parameters of a fund out of
+    sample. The trading sessions between the start and end dates are split into
+    consecutive folds, each consisting of a training window immediately
+    followed by a testing window. On every training window the fund is
+    backtested for each combination of a grid of parameters, and the
+    combination which maximizes an objective metric of the performance summary
+    is selected. The fund is then backtested with the selected parameters on
+    the testing window. The testing windows do not overlap, and the histories
+    of each portfolio over the testing windows are chained into a single
+    portfolio history.
+
+    The backtests of all of the training windows are run in parallel, followed
+    by the backtests of all of the testing windows. Every backtest is served
+    from a single copy of the price history that is held in shared memory, and
+    any features that are precomputed from the prices are computed only once in
+    each worker process rather than once for each window.
+
+    The fund is constructed by a function that accepts the shared prices as its
+    first argument and, as keyword arguments, the start and end dates of the
+    window on which it is backtested and the parameters:
+
+        def build_fund(source, start_date, end_date, short_window, long_window):
+            ...
+
+    Parameters
+    ----------
+    build_fund, grid, start_date, end_date, n_init, n_jobs, source, features:
+        Refer to base class documentation.
+    train_sessions: Integer.
+        The number of trading sessions in each training window.
+    test_sessions: Integer.
+        The number of trading sessions in each testing window.
+    anchored (Optional): Boolean.
+        Whether or not every training window begins with the first trading
+        session, so that the training windows expand rather than roll forward.
+    objective (Optional): String.
+        The column of the performance summary that is maximized on each training
+        window.
+    portfolio_id (Optional): String.
+        The portfolio whose performance is maximized. By default, the
+        performance of the fund as a whole is maximized.
+    """
+    def __init__(
+            self, build_fund, grid, start_date, end_date, n_init,
+            train_sessions, test_sessions, anchored=False,
+            objective="sharpe ratio", portfolio_id=None, n_jobs=None,
+            source=gets, features=None
+    ):
+        """Initialize parameters of the walk-forward optimization object."""
+        super(WalkForwardOptimization, self).__init__(
+            build_fund, grid, start_date, end_date, n_init, n_jobs, source,
+            features
+        )
+        self.train_sessions = train_sessions
+        self.test_sessions = test_sessions
+        self.anchored = anchored
+        self.objective = objective
+        self.portfolio_id = portfolio_id
+        self.folds, self.histories = None, None
+
+    def split(self):
+        """Split the trading sessions between the start and end dates into
+        folds. Each fold is described by the first and last trading sessions of
+        its training and testing windows. The final testing window may contain
+        fewer trading sessions than the others.
+        """
+        sessions = gets.standard_sessions(self.start_date, self.end_date)
+        sessions = list(sessions["datetime"])
+        folds = []
+        for i in range(
+                self.train_sessions, len(sessions), self.test_sessions
+        ):
+            train = sessions[0 if self.anchored else i - self.train_sessions:i]
+            test = sessions[i:i + self.test_sessions]
+            folds.append((train[0], train[-1], test[0], test[-1]))
+
+        return pd.DataFrame(folds, columns=[
+            "train start", "train end", "test start", "test end"
+        ])
+
+    def score(self, summary):
+        """Extract the value of the objective from a performance summary. Values
+        that could not be computed are scored below every other value.
+        """
+        if self.portfolio_id is None:
+            value = summary[self.objective].iloc[-1]
+        else:
+            value = summary.loc[self.portfolio_id, self.objective]
+        return -np.inf if np.isnan(value) else value
+
+    def run(self):
+        """Select the parameters of the fund on each training window, backtest
+        the fund with those parameters on the subsequent testing window and
+        chain the histories of each portfolio over the testing windows.
+        """
+        folds = self.split()
+        combinations = self.combinations
+        prices = self.share_prices()
+        try:
+            # Backtest every combination of parameters on every training window.
+            summaries = self.map(prices, evaluate_parameters, [
+                (self.build_fund, dict(
+                    params, start_date=f["train start"],
+                    end_date=f["train end"]
+                )) for _, f in folds.iterrows() for params in combinations
+            ])
+            scores = np.reshape(
+                [self.score(s) for s in summaries],
+                (len(folds), len(combinations))
+            )
+            selected = [combinations[k] for k in np.argmax(scores, axis=1)]
+            # Backtest the selected parameters on every testing window.
+            results = self.map(prices, trade_parameters, [
+                (self.build_fund, dict(
+                    params, start_date=f["test start"], end_date=f["test end"]
+                )) for (_, f), params in zip(folds.iterrows(), selected)
+            ])
+        finally:
+            prices.unlink()
+
+        # Record the parameters selected for each fold and their performance in
+        # the training window.
+        for n in self.names:
+            folds[n] = [params[n] for params in selected]
+        folds["train " + self.objective] = scores.max(axis=1)
+        self.folds = folds
+        self.histories = self.stitch([h for _, h in results])
+
+        return self.histories
+
+    def stitch(self, fold_histories):
+        """Chain the histories of each portfolio over consecutive testing
+        windows. The history of each testing window is scaled so that it begins
+        with the equity at the end of the previous testing window rather than
+        with the initial equity of the portfolio, as though the equity had been
+        carried over from one window to the next.
+
+        Parameters
+        ----------
+        fold_histories: List of lists.
+            For each testing window, the identifier, initial equity and history
+            of each portfolio.
+        """
+        histories = OrderedDict()
+        for fold in fold_histories:
+            for portfolio_id, equity, history in fold:
+                if portfolio_id not in histories:
+                    histories[portfolio_id] = PortfolioHistory(portfolio_id)
+                stitched = histories[portfolio_id]
+                if len(stitched) > 0:
+                    scale = stitched.column("equity")[-1] / equity
+                else:
+                    scale = 1.0
+                stitched.extend(history, scale)
+
+        for history in histories.values():
+            history.compute_attributes()
+
+        return histories
+
+    def performance_summary(self):
+        """Compute the performance summary of each portfolio over the chained
+        testing windows.
+        """
+        return pd.concat([
+            metrics.performance_summary(h, portfolio_id)
+            for portfolio_id, h in self.histories.items()
+        ])
@@ -2,6 +2,7 @@ import numpy as np
 from abc import ABCMeta, abstractmethod
 from ..utilities.params import TradeTypes, PriceFields, IOFiles
 from ..events import OrderEvent, SignalEvent
+from ..utilities import mark_to_market
 
 
 class AbstractPortfolio(object):
@@ -55,29 +56,33 @@ class AbstractPortfolio(object):
         market_event: Market event object.
             The market event that the portfolio will process.
         """
-        # Iterate over each position currently held in the portfolio.
-        for pos in self.portfolio_handler.filled_positions.values():
-            # When we value the position, we'll value it using the close price
-            # of the time period.
-            s = pos.symbol
-            if s in self.data_handler.prices.minor_axis:
-                price = self.data_handler.prices.ix[
-                    PriceFields.current_price.value, 0, s
-                ]
-                # Update the value of the position using the new market data.
-                pos.update_market_value(price)
-            else:
-                # If the position is held in the portfolio, but we do not have
-                # data for it, then raise an error.
-                raise ValueError(
-                    "Position {} in portfolio {} does not have associated price"
-                    " data on {}.".format(
-                        s, self.portfolio_handler.portfolio_id,
-                        market_event.datetime.strftime(
-                            IOFiles.date_format.value
-                        )
-                    )
+        positions = list(self.portfolio_handler.filled_positions.values())
+        if not positions:
+            return
+
+        # When we value the positions, we'll value them using the current price
+        # of the time period. The prices of every position are gathered at once.
+        prices = self.data_handler.prices
+        symbols = [pos.symbol for pos in positions]
+        cols = prices.minor_axis.get_indexer(symbols)
+        missing = [s for s, c in zip(symbols, cols) if c < 0]
+        if missing:
+            # If positions are held in the portfolio, but we do not have data
+            # for them, then raise an error.
+            raise ValueError(
+                "Positions {} in portfolio {} do not have associated price "
+                "data on {}.".format(
+                    ", ".join(missing), self.portfolio_handler.portfolio_id,
+                    market_event.datetime.strftime(IOFiles.date_format.value)
                 )
+            )
+
+        # Update the value of the positions using the new market data.
+        item = prices.items.get_loc(PriceFields.current_price.value)
+        mark_to_market(
+            self.portfolio_handler.filled_positions,
+            prices.values[item, 0, cols]
+        )
 
     def process_signal_event(self, signal_event):
         """This function interprets a signal event received from the portfolio
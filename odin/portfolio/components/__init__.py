@@ -1,2 +1,3 @@
 from .portfolio_history import PortfolioHistory
 from .portfolio_state import PortfolioState
+from .position_snapshot import PositionSnapshot
@@ -1,32 +1,115 @@
+import numpy as np
 import pandas as pd
-from copy import deepcopy
 from collections import OrderedDict
+from .portfolio_state import PortfolioState
+from .position_snapshot import PositionSnapshot
+from ...utilities.params import Directions
 
 
 class PortfolioHistory(object):
     """Portfolio History Class
 
     The portfolio history class keeps track of historical portfolio states as in
-    a time-series. This is achieved by copying the state of the portfolio on a
-    known date into a dictionary where the keys are dates that have been ordered
-    temporally.
+    a time-series. Rather than copying the state of the portfolio (and every
+    position that it holds) on each date, the history is recorded in columns:
+    the capital, equity and number of positions of each state are appended to
+    growable Numpy arrays, as are the symbol, quantity, market value, relative
+    value and direction of every position held in each state. When the arrays
+    run out of room their size is doubled, so that recording a state takes time
+    proportional only to the number of positions in that state.
 
-    This allows us to iterate over the dates in a logical order as we track
-    changes in portfolio equity, positions, and capital.
+    The states are ordered temporally, which allows us to iterate over the dates
+    in a logical order as we track changes in portfolio equity, positions, and
+    capital. Snapshots of the portfolio state on any recorded date can be
+    reconstructed on demand from the columns.
 
     Parameters
     ----------
     portfolio_id: String.
         A unique identifier assigned to the portfolio.
+    capacity (Optional): Integer.
+        The number of states for which room is initially allocated.
     """
-    def __init__(self, portfolio_id):
+    def __init__(self, portfolio_id, capacity=256):
         """Initialize parameters of the portfolio history object."""
         self.portfolio_id = portfolio_id
-        self.states = OrderedDict()
+        self.maximum_capacity = None
+        self.n_states, self.n_records = 0, 0
+        self.symbols, self.__symbol_ids = [], {}
+        self.__dates = []
+        self.__stale = True
+        self.__state_columns = {
+            "capital": np.empty(capacity),
+            "equity": np.empty(capacity),
+            "n_positions": np.empty(capacity, dtype=int),
+            "offset": np.empty(capacity, dtype=int),
+        }
+        self.__position_columns = {
+            "symbol_id": np.empty(capacity, dtype=int),
+            "quantity": np.empty(capacity, dtype=int),
+            "market_value": np.empty(capacity),
+            "relative_value": np.empty(capacity),
+            "direction": np.empty(capacity, dtype=np.int8),
+        }
+
+    def __len__(self):
+        """The number of portfolio states that have been recorded."""
+        return self.n_states
+
+    def __grow(self, columns, n):
+        """Ensure that each of the provided columns has room for at least the
+        specified number of entries, doubling their size when they are full.
+        """
+        size = len(next(iter(columns.values())))
+        if n <= size:
+            return
+
+        size = max(n, 2 * size)
+        for k, v in columns.items():
+            columns[k] = np.empty(size, dtype=v.dtype)
+            columns[k][:len(v)] = v
+
+    def __symbol_id(self, symbol):
+        """Retrieve the integer identifier assigned to a symbol within the
+        history, assigning a new identifier if the symbol has not been seen.
+        """
+        if symbol not in self.__symbol_ids:
+            self.__symbol_ids[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+
+        return self.__symbol_ids[symbol]
+
+    @property
+    def dates(self):
+        """The dates on which the portfolio states were recorded."""
+        return pd.DatetimeIndex(self.__dates)
+
+    def column(self, name):
+        """Retrieve a view of one of the columns recorded for each state; these
+        are 'capital', 'equity', 'n_positions' and 'offset'. The offset of a
+        state is the index of its first position in the position columns.
+        """
+        return self.__state_columns[name][:self.n_states]
+
+    def position_column(self, name):
+        """Retrieve a view of one of the columns recorded for each position of
+        each state; these are 'symbol_id', 'quantity', 'market_value',
+        'relative_value' and 'direction'. Directions are recorded as one for
+        long positions and minus one for short positions.
+        """
+        return self.__position_columns[name][:self.n_records]
+
+    def position_states(self):
+        """Compute the index of the state to which each recorded position
+        belongs.
+        """
+        return np.repeat(
+            np.arange(self.n_states), self.column("n_positions")
+        )
 
     def add_state(self, date, portfolio_state):
-        """Update the dictionary of portfolio states ordered by dates by
-        appending the latest entry.
+        """Update the columns of portfolio states ordered by dates by appending
+        the latest entry.
 
         Parameters
         ----------
@@ -34,10 +117,131 @@ class PortfolioHistory(object):
             The date at which to record the current state of the portfolio.
         portfolio_state: Portfolio state object.
             A portfolio state object which will be archived as the state of the
-            portfolio on the provided date. In order to avoid memory problems, a
-            copy of the state is made.
+            portfolio on the provided date. Only the values of the state are
+            recorded, so that the state may continue to change afterwards.
+        """
+        positions = list(portfolio_state.filled_positions.values())
+        n, m, k = self.n_states, self.n_records, len(positions)
+        self.__grow(self.__state_columns, n + 1)
+        self.__grow(self.__position_columns, m + k)
+
+        s = self.__state_columns
+        s["capital"][n] = portfolio_state.capital
+        s["equity"][n] = portfolio_state.equity
+        s["n_positions"][n] = k
+        s["offset"][n] = m
+        if k > 0:
+            p = self.__position_columns
+            p["symbol_id"][m:m + k] = [
+                self.__symbol_id(pos.symbol) for pos in positions
+            ]
+            p["quantity"][m:m + k] = [pos.quantity for pos in positions]
+            p["market_value"][m:m + k] = [pos.market_value for pos in positions]
+            p["relative_value"][m:m + k] = [
+                pos.relative_value for pos in positions
+            ]
+            p["direction"][m:m + k] = [
+                1 if pos.direction == Directions.long_dir else -1
+                for pos in positions
+            ]
+
+        self.__dates.append(date)
+        self.maximum_capacity = portfolio_state.maximum_capacity
+        self.n_states += 1
+        self.n_records += k
+        self.__stale = True
+
+    def extend(self, history, scale=1.0):
+        """Append every state recorded by another portfolio history, for
+        instance to chain together the histories of consecutive backtests. The
+        states of the other history must have been recorded after the states of
+        this history.
+
+        Parameters
+        ----------
+        history: Portfolio history object.
+            The portfolio history whose states are appended.
+        scale (Optional): Float.
+            A factor by which the capital, equity, market values and relative
+            values of the appended states are multiplied. This allows the
+            equity curve of the other history to continue from the equity of
+            this one. The quantities of the positions are not scaled.
+        """
+        n, m = history.n_states, history.n_records
+        i, j = self.n_states, self.n_records
+        self.__grow(self.__state_columns, i + n)
+        self.__grow(self.__position_columns, j + m)
+
+        s = self.__state_columns
+        s["capital"][i:i + n] = scale * history.column("capital")
+        s["equity"][i:i + n] = scale * history.column("equity")
+        s["n_positions"][i:i + n] = history.column("n_positions")
+        s["offset"][i:i + n] = history.column("offset") + j
+        # The symbols of the other history are assigned identifiers within this
+        # history.
+        ids = np.array(
+            [self.__symbol_id(symbol) for symbol in history.symbols], dtype=int
+        )
+        p = self.__position_columns
+        p["symbol_id"][j:j + m] = ids[history.position_column("symbol_id")]
+        p["quantity"][j:j + m] = history.position_column("quantity")
+        p["market_value"][j:j + m] = (
+            scale * history.position_column("market_value")
+        )
+        p["relative_value"][j:j + m] = (
+            scale * history.position_column("relative_value")
+        )
+        p["direction"][j:j + m] = history.position_column("direction")
+
+        self.__dates.extend(history.dates)
+        if history.maximum_capacity is not None:
+            self.maximum_capacity = history.maximum_capacity
+        self.n_states += n
+        self.n_records += m
+        self.__stale = True
+
+    def snapshot(self, date):
+        """Reconstruct the state of the portfolio on a recorded date from the
+        columns of the history. The filled positions of the snapshot are
+        position snapshot objects.
+
+        Parameters
+        ----------
+        date: A datetime object.
+            The date on which the portfolio state was recorded.
         """
-        self.states[date] = deepcopy(portfolio_state)
+        return self.__snapshot(self.dates.get_loc(date))
+
+    def __snapshot(self, i):
+        """Reconstruct the i-th recorded state of the portfolio."""
+        j = self.column("offset")[i]
+        filled_positions = OrderedDict()
+        for r in range(j, j + self.column("n_positions")[i]):
+            symbol = self.symbols[self.position_column("symbol_id")[r]]
+            filled_positions[symbol] = PositionSnapshot(
+                symbol,
+                int(self.position_column("quantity")[r]),
+                float(self.position_column("market_value")[r]),
+                float(self.position_column("relative_value")[r]),
+                Directions.long_dir if self.position_column("direction")[r] > 0
+                else Directions.short_dir
+            )
+
+        return PortfolioState(
+            float(self.column("capital")[i]), filled_positions,
+            self.maximum_capacity, self.portfolio_id
+        )
+
+    @property
+    def states(self):
+        """An ordered dictionary mapping each recorded date to a snapshot of the
+        portfolio state on that date. The snapshots are reconstructed every time
+        this property is accessed; the columns should be preferred wherever
+        possible.
+        """
+        return OrderedDict(
+            (d, self.__snapshot(i)) for i, d in enumerate(self.__dates)
+        )
 
     def compute_attributes(self):
         """Compute the historical time-series attribute curves for the
@@ -47,18 +251,24 @@ class PortfolioHistory(object):
             2. A historical record of how many positions there were in each time
                period.
             3. The historical returns for each time period.
+
+        The curves are cached and are only recomputed after new portfolio states
+        have been recorded.
         """
-        # Create pandas series objects for the historical equity and number of
-        # positions. The series for the returns will be computed later.
-        self.equity = pd.Series()
-        self.n_positions = pd.Series()
-        # Iterate over each time period in the ordered dictionary of portfolio
-        # states.
-        for date in self.states:
-            state = self.states[date]
-            self.n_positions.ix[date] = len(state.filled_positions)
-            self.equity.ix[date] = state.equity
+        if not self.__stale:
+            return
 
+        # Create pandas series objects for the historical equity and number of
+        # positions directly from the recorded columns.
+        dates = self.dates
+        equity = self.column("equity").copy()
+        self.equity = pd.Series(equity, index=dates)
+        self.n_positions = pd.Series(
+            self.column("n_positions").copy(), index=dates
+        )
         # Compute the returns in each time period directly from the change in
         # portfolio equity.
-        self.returns = self.equity.pct_change()
+        returns = np.full(len(equity), np.nan)
+        returns[1:] = equity[1:] / equity[:-1] - 1.
+        self.returns = pd.Series(returns, index=dates)
+        self.__stale = False
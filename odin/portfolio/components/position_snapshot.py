@@ -0,0 +1,42 @@
+class PositionSnapshot(object):
+    """Position Snapshot Class
+
+    The position snapshot is a lightweight record of a filled position as it was
+    held by a portfolio at the end of a particular trading session. It is
+    reconstructed from the columns of a portfolio history and exposes the
+    attributes of a filled position that are required to value the portfolio.
+
+    Parameters
+    ----------
+    symbol: String.
+        The ticker symbol of the underlying asset.
+    quantity: Integer.
+        The number of shares held in the position.
+    market_value: Float.
+        The market value of the position (negative for short positions).
+    relative_value: Float.
+        The relative value of the position, which contributes to the equity of
+        the portfolio.
+    direction: Directions enumeration.
+        Whether the position is long or short the asset.
+    """
+    __slots__ = (
+        "symbol", "quantity", "market_value", "relative_value", "direction"
+    )
+
+    def __init__(
+            self, symbol, quantity, market_value, relative_value, direction
+    ):
+        """Initialize parameters of the position snapshot object."""
+        self.symbol = symbol
+        self.quantity = quantity
+        self.market_value = market_value
+        self.relative_value = relative_value
+        self.direction = direction
+
+    def __str__(self):
+        """String representation of the position snapshot object."""
+        return "{}\t{}\t{}\t{:0.2f}".format(
+            self.symbol, self.direction.value, self.quantity,
+            self.relative_value
+        )
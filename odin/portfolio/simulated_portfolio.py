@@ -14,6 +14,8 @@ class SimulatedPortfolio(AbstractPortfolio):
 
     The simulated portfolio also records the historical equity states of the
     portfolio for the purposes of computing performance metrics of a backtest.
+    The metrics are also accumulated online as the backtest progresses, so that
+    the performance of the portfolio is available at any time.
 
     Parameters
     ----------
@@ -35,12 +37,16 @@ class SimulatedPortfolio(AbstractPortfolio):
             data_handler, position_handler, portfolio_handler
         )
         self.history = PortfolioHistory(self.portfolio_handler.portfolio_id)
+        self.online_metrics = metrics.OnlineMetrics()
 
     def process_post_events(self):
         """Implementation of abstract base class method."""
         # Update the portfolio history of positions, capital, and equity.
         date = self.data_handler.current_date
-        self.history.add_state(date, self.portfolio_handler.state)
+        state = self.portfolio_handler.state
+        self.history.add_state(date, state)
+        # Update the performance metrics accumulated during the backtest.
+        self.online_metrics.update(state.equity, len(state.filled_positions))
 
     def performance_summary(self):
         """Compute the performance summary for the portfolio over the period of
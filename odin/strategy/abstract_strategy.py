@@ -145,3 +145,50 @@ class AbstractStrategy(object):
         be prioritized.
         """
         raise NotImplementedError()
+
+    # The following methods are the vectorized counterparts of the methods
+    # above. They are only required by strategies that are backtested with the
+    # vectorized simulated fund. Each method receives a pandas panel containing
+    # every bar of the backtest and returns, for each date and symbol, the value
+    # that would be computed from the bars up to and including that date. The
+    # values may be returned as a data frame whose index is the dates and whose
+    # columns are the symbols, or as a single value shared by every date and
+    # symbol.
+
+    def compute_directions(self, bars):
+        """Vectorized indicator of which direction (long or short) the strategy
+        would trade each asset.
+        """
+        raise NotImplementedError()
+
+    def compute_buy_proportions(self, bars):
+        """Vectorized recommendation of the proportion of equity to allocate
+        toward each position.
+        """
+        raise NotImplementedError()
+
+    def compute_sell_proportions(self, bars):
+        """Vectorized recommendation of the proportion of each existing position
+        to liquidate.
+        """
+        raise NotImplementedError()
+
+    def buy_indicators(self, bars):
+        """Vectorized indicator that the strategy should buy into a position."""
+        raise NotImplementedError()
+
+    def sell_indicators(self, bars):
+        """Vectorized indicator that the strategy should sell from a position.
+        """
+        raise NotImplementedError()
+
+    def exit_indicators(self, bars):
+        """Vectorized indicator that the strategy should exit a position."""
+        raise NotImplementedError()
+
+    def generate_priorities(self, bars):
+        """Vectorized order in which to consider stocks. Stocks with a smaller
+        priority are considered first, and stocks whose priority is missing are
+        not considered at all.
+        """
+        raise NotImplementedError()
@@ -1,26 +1,42 @@
 import numpy as np
+from ...handlers.data_handler.bars import Bars
 
 
 class MovingAverage(object):
     """Moving Average Class
 
     Provides support for both simple moving averages and exponential moving
-    averages
+    averages. The moving averages may be computed either for a pandas object
+    or directly for the bars of a data handler, in which case only the most
+    recent window of the specified price field is accessed.
     """
-    def __init__(self, window):
+    def __init__(self, window, field="adj_price_close"):
         """Initialize parameters of the moving average object."""
         self.window = window
+        self.field = field
+
+    def __recent(self, series):
+        """Extract the most recent window of observations of the time-series."""
+        if isinstance(series, Bars):
+            return series.frame(self.field, self.window)
+        else:
+            return series.iloc[-self.window:]
 
     def simple_moving_average(self, series):
         """Implementation of a simple moving average."""
-        return series.ix[-self.window:].mean()
+        return self.__recent(series).mean()
 
     def simple_z_score(self, series):
         """Implementation of a simple z-score."""
-        recent = series.ix[-self.window:]
-        return (series.ix[-1] - recent.mean()) / recent.std()
+        recent = self.__recent(series)
+        return (recent.iloc[-1] - recent.mean()) / recent.std()
 
     def exponential_moving_average(self, series, alpha):
-        """Implementation of an exponential moving average."""
-        weights = np.array([(1 - alpha) ** i for i in range(self.window)])
-        return (series.ix[-self.window:] * weights).sum()
+        """Implementation of an exponential moving average. The most recent
+        observation is given unit weight and the weights of older observations
+        decay geometrically. Each column of a data frame is averaged over its
+        rows.
+        """
+        recent = self.__recent(series)
+        weights = (1 - alpha) ** np.arange(len(recent))[::-1]
+        return recent.mul(weights, axis=0).sum()
@@ -24,9 +24,11 @@ class Williams(object):
         self.window = window
 
     def percent_r(self, bars):
-        """Implementation of Williams' %R."""
-        rec = bars.ix[:, -self.window:, :]
-        high, low = rec["adj_price_high"].max(), rec["adj_price_low"].min()
-        close = rec.ix["adj_price_close", -1, :]
+        """Implementation of Williams' %R for each active symbol of a bars
+        object.
+        """
+        high = bars.frame("adj_price_high", self.window).max()
+        low = bars.frame("adj_price_low", self.window).min()
+        close = bars.last("adj_price_close")
         return (high - close) / (high - low) * -100.0
 
@@ -1 +1,2 @@
 from .buy_and_hold_strategy import BuyAndHoldStrategy
+from .swing_strategy import SwingStrategy
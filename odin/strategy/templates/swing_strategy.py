@@ -0,0 +1,82 @@
+import pandas as pd
+from ...utilities.mixins.strategy_mixins import (
+    LongStrategyMixin,
+    EqualBuyProportionMixin,
+    DefaultPriorityMixin,
+)
+
+
+class SwingStrategy(
+        LongStrategyMixin,
+        EqualBuyProportionMixin,
+        DefaultPriorityMixin,
+):
+    """Swing Strategy Class
+
+    The swing strategy buys an asset after a session in which it closed above
+    its open, sells half of the position after a session in which it closed
+    sufficiently below its open, and exits the position entirely after a
+    session in which it closed sufficiently above its open. The strategy trades
+    frequently and is suitable for backtesting both the event-driven and the
+    vectorized funds.
+
+    Parameters
+    ----------
+    portfolio: Portfolio object.
+        The portfolio for which the strategy generates signals.
+    sell_threshold (Optional): Float.
+        The fraction of the opening price below which a close triggers a sale.
+    exit_threshold (Optional): Float.
+        The fraction of the opening price above which a close triggers an exit.
+    """
+    def __init__(self, portfolio, sell_threshold=0.995, exit_threshold=1.005):
+        """Initialize parameters of the swing strategy object."""
+        super(SwingStrategy, self).__init__(portfolio)
+        self.sell_threshold = sell_threshold
+        self.exit_threshold = exit_threshold
+
+    def generate_features(self):
+        """Implementation of abstract base class method."""
+        bars = self.portfolio.data_handler.bars
+        return pd.DataFrame({
+            "close": bars.last("adj_price_close"),
+            "open": bars.last("adj_price_open"),
+        }).dropna()
+
+    def buy_indicator(self, feats):
+        """Implementation of abstract base class method."""
+        return feats["close"] > feats["open"]
+
+    def sell_indicator(self, feats):
+        """Implementation of abstract base class method."""
+        return feats["close"] < self.sell_threshold * feats["open"]
+
+    def exit_indicator(self, feats):
+        """Implementation of abstract base class method."""
+        return feats["close"] > self.exit_threshold * feats["open"]
+
+    def compute_sell_proportion(self, feats):
+        """Implementation of abstract base class method."""
+        return 0.5
+
+    def buy_indicators(self, bars):
+        """Implementation of abstract base class method."""
+        return bars["adj_price_close"] > bars["adj_price_open"]
+
+    def sell_indicators(self, bars):
+        """Implementation of abstract base class method."""
+        return (
+            bars["adj_price_close"] <
+            self.sell_threshold * bars["adj_price_open"]
+        )
+
+    def exit_indicators(self, bars):
+        """Implementation of abstract base class method."""
+        return (
+            bars["adj_price_close"] >
+            self.exit_threshold * bars["adj_price_open"]
+        )
+
+    def compute_sell_proportions(self, bars):
+        """Implementation of abstract base class method."""
+        return 0.5
@@ -0,0 +1,141 @@
+import unittest
+import numpy as np
+import pandas as pd
+from odin.handlers.data_handler import Bars
+from odin.strategy.indicators import MovingAverage
+
+
+class BarsTest(unittest.TestCase):
+    def test_rolling_window(self):
+        """Ensure that appending bars to a window at capacity drops the oldest
+        bars and that the most recent bars are exposed as a view.
+        """
+        items = ["adj_price_close", "adj_volume"]
+        symbols = ["SPY", "OEF"]
+        dates = pd.date_range("2015-01-02", periods=5)
+        bars = Bars(items, 3, symbols)
+        slots = bars.locate(symbols)
+        for i, d in enumerate(dates):
+            bars.append(d, np.full((2, 2), float(i)), slots)
+
+        self.assertEqual(len(bars), 3)
+        self.assertTrue(bars.major_axis.equals(dates[-3:]))
+        self.assertEqual(list(bars.minor_axis), ["OEF", "SPY"])
+        self.assertTrue((bars["adj_price_close"]["SPY"] == [2., 3., 4.]).all())
+        self.assertTrue((bars.last("adj_volume") == 4.).all())
+        self.assertTrue(np.may_share_memory(bars.view(2), bars.view()))
+
+    def test_evict_and_select(self):
+        """Ensure that old bars are evicted by date and that only the selected
+        symbols are exposed.
+        """
+        dates = pd.date_range("2015-01-02", periods=4)
+        bars = Bars(["adj_price_close"], 10)
+        slots = bars.locate(["SPY", "OEF", "GOOG"])
+        for i, d in enumerate(dates):
+            bars.append(d, np.array([[i, 10. * i, 100. * i]]), slots)
+
+        bars.evict(dates[2])
+        bars.select(["GOOG", "SPY", "AMZN"])
+        close = bars["adj_price_close"]
+        self.assertTrue(close.index.equals(dates[2:]))
+        self.assertEqual(list(close.columns), ["AMZN", "GOOG", "SPY"])
+        self.assertTrue(close["AMZN"].isnull().all())
+        self.assertTrue((close["GOOG"] == [200., 300.]).all())
+
+    def test_write(self):
+        """Ensure that writing a panel only overwrites the time periods that
+        are held in the window.
+        """
+        dates = pd.date_range("2015-01-02", periods=4)
+        bars = Bars(["adj_price_close"], 3)
+        for d in dates[:3]:
+            bars.append(d, np.empty((1, 0)), np.empty(0, dtype=int))
+
+        bars.write(pd.Panel(
+            np.arange(8.).reshape((1, 4, 2)), items=["adj_price_close"],
+            major_axis=dates, minor_axis=["SPY", "OEF"]
+        ))
+        bars.select(["SPY", "OEF"])
+        close = bars["adj_price_close"]
+        self.assertTrue(close.index.equals(dates[:3]))
+        self.assertTrue((close["SPY"] == [0., 2., 4.]).all())
+        self.assertTrue((close["OEF"] == [1., 3., 5.]).all())
+
+    def test_available(self):
+        """Ensure that only symbols with a bar in the window are available and
+        that the most recent bar of an empty window cannot be retrieved.
+        """
+        dates = pd.date_range("2015-01-02", periods=3)
+        bars = Bars(["adj_price_close"], 2)
+        self.assertRaises(IndexError, bars.last, "adj_price_close")
+        slots = bars.locate(["SPY", "OEF"])
+        bars.append(dates[0], np.array([[1., np.nan]]), slots)
+        bars.append(dates[1], np.array([[2.]]), slots[:1])
+        bars.append(dates[2], np.array([[4.]]), slots[:1])
+        self.assertEqual(bars.available(["OEF", "SPY", "GOOG"]), ["SPY"])
+
+        bars.evict(dates[2] + pd.Timedelta(days=1))
+        self.assertEqual(bars.available(["SPY"]), [])
+        self.assertRaises(IndexError, bars.last, "adj_price_close")
+
+        # The available symbols are tracked through appending, writing and
+        # evicting bars, and agree with a scan of the window.
+        rng = np.random.RandomState(0)
+        symbols = ["S{}".format(i) for i in range(6)]
+        dates = pd.date_range("2015-01-02", periods=40)
+        bars = Bars(["adj_price_close", "adj_volume"], 5)
+        for i, d in enumerate(dates):
+            values = rng.rand(2, 3)
+            values[rng.rand(2, 3) < 0.6] = np.nan
+            bars.append(d, values, bars.locate(rng.choice(symbols, 3, False)))
+            if i % 3 == 1:
+                panel = pd.Panel(
+                    np.where(rng.rand(2, 2, 2) < 0.5, np.nan, 1.),
+                    items=bars.items, major_axis=bars.major_axis[-2:],
+                    minor_axis=list(rng.choice(symbols, 2, False))
+                )
+                bars.write(panel)
+            if i % 7 == 0:
+                bars.evict(d - pd.Timedelta(days=2))
+            slots = bars.locate(symbols)
+            view = bars.view()[:, :, slots]
+            present = (~np.isnan(view)).any(axis=(0, 1))
+            self.assertEqual(
+                bars.available(symbols),
+                [s for s, p in zip(symbols, present) if p]
+            )
+
+    def test_moving_average(self):
+        """Ensure that moving averages of the bars agree with moving averages of
+        the corresponding data frame, and that the most recent bar is given the
+        greatest weight by the exponential moving average.
+        """
+        dates = pd.date_range("2015-01-02", periods=12)
+        symbols = ["SPY", "OEF", "GOOG"]
+        values = np.arange(36.).reshape((1, 12, 3))
+        bars = Bars.from_panel(pd.Panel(
+            values, items=["adj_price_close"], major_axis=dates,
+            minor_axis=symbols
+        ), 12)
+        close = bars["adj_price_close"]
+        ma = MovingAverage(10)
+        self.assertTrue(
+            ma.simple_moving_average(bars).equals(
+                ma.simple_moving_average(close)
+            )
+        )
+        ema = ma.exponential_moving_average(bars, 0.5)
+        self.assertTrue(ema.equals(ma.exponential_moving_average(close, 0.5)))
+        weights = 0.5 ** np.arange(10)[::-1]
+        for s in symbols:
+            self.assertAlmostEqual(
+                ema[s], (close[s].values[-10:] * weights).sum()
+            )
+        self.assertAlmostEqual(
+            ema["SPY"], ma.exponential_moving_average(close["SPY"], 0.5)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
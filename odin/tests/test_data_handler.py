@@ -0,0 +1,192 @@
+import shutil
+import tempfile
+import unittest
+import datetime as dt
+import numpy as np
+import pandas as pd
+from unittest import mock
+from odin_securities.queries import gets
+from odin.events import EventsQueue
+from odin.utilities.finance import Indices
+from odin.handlers.data_handler import (
+    Bars, DatabaseDataHandler, InteractiveBrokersDataHandler
+)
+from odin.handlers.data_handler.database import (
+    interactive_brokers_data_handler
+)
+from odin.handlers.data_handler.sources import PriceCubeCache, PrefetchedPrices
+from odin.handlers.symbol_handler import FixedSymbolHandler
+
+
+class DataHandlerTest(unittest.TestCase):
+    def test_preloaded_database_data_handler(self):
+        """Ensure that preloading the prices for the entire backtest produces
+        exactly the same bars and prices as querying the database on every
+        trading session.
+        """
+        start, end = dt.datetime(2015, 1, 2), dt.datetime(2015, 2, 2)
+        symbols = [Indices.sp_100_etf.value, Indices.sp_500_etf.value]
+        sh = FixedSymbolHandler(symbols, [])
+        dh = DatabaseDataHandler(EventsQueue(), sh, start, end, 10)
+        dh_pre = DatabaseDataHandler(
+            EventsQueue(), sh, start, end, 10, preload=True
+        )
+        self.assertTrue(dh.bars.equals(dh_pre.bars))
+        while True:
+            dh.request_prices()
+            dh_pre.request_prices()
+            self.assertEqual(dh.continue_trading, dh_pre.continue_trading)
+            if not dh.continue_trading:
+                break
+
+            self.assertTrue(dh.prices.equals(dh_pre.prices))
+            dh.update()
+            dh_pre.update()
+            self.assertTrue(dh.bars.equals(dh_pre.bars))
+
+    def test_prefetched_database_data_handler(self):
+        """Ensure that prefetching the prices of upcoming trading sessions in the
+        background produces exactly the same bars and prices as querying the
+        database on every trading session.
+        """
+        start, end = dt.datetime(2015, 1, 2), dt.datetime(2015, 2, 2)
+        symbols = [Indices.sp_100_etf.value, Indices.sp_500_etf.value]
+        sh = FixedSymbolHandler(symbols, [])
+        dh = DatabaseDataHandler(EventsQueue(), sh, start, end, 10)
+        dh_pre = DatabaseDataHandler(
+            EventsQueue(), sh, start, end, 10, prefetch=3
+        )
+        while True:
+            dh.request_prices()
+            dh_pre.request_prices()
+            self.assertEqual(dh.continue_trading, dh_pre.continue_trading)
+            if not dh.continue_trading:
+                break
+
+            self.assertTrue(dh.prices.equals(dh_pre.prices))
+            dh.update()
+            dh_pre.update()
+            self.assertTrue(dh.bars.equals(dh_pre.bars))
+
+    def test_close_prefetched_prices(self):
+        """Ensure that the background thread prefetching prices stops and that
+        the prefetched prices are discarded when trading ends early.
+        """
+        class Source(object):
+            def prices(self, start_date, end_date=None, symbols=None):
+                return start_date
+
+        dates = list(pd.date_range("2015-01-02", periods=10))
+        prefetched = PrefetchedPrices(dates, 2, Source())
+        self.assertEqual(prefetched.advance(dates[0]), dates[0])
+        prefetched.close()
+        self.assertFalse(prefetched.thread.is_alive())
+        self.assertTrue(prefetched.queue.empty())
+        self.assertRaises(ValueError, prefetched.advance, dates[1])
+
+        start, end = dt.datetime(2015, 1, 2), dt.datetime(2015, 2, 2)
+        symbols = [Indices.sp_100_etf.value, Indices.sp_500_etf.value]
+        dh = DatabaseDataHandler(
+            EventsQueue(), FixedSymbolHandler(symbols, []), start, end, 10,
+            prefetch=3
+        )
+        dh.request_prices()
+        dh.continue_trading = False
+        self.assertFalse(dh.source.thread.is_alive())
+
+    def test_price_cube_cache(self):
+        """Ensure that prices served by the price cube cache are identical to
+        those queried from the database, including after the cache has been
+        incrementally filled and reopened from disk.
+        """
+        path = tempfile.mkdtemp()
+        symbols = [Indices.sp_100_etf.value, Indices.sp_500_etf.value]
+        start, end = dt.datetime(2015, 1, 2), dt.datetime(2015, 2, 2)
+        later = dt.datetime(2015, 3, 2)
+        cache = PriceCubeCache(path)
+        self.assertTrue(
+            cache.prices(start, end, symbols).equals(
+                gets.prices(start, end, symbols)
+            )
+        )
+        cache.prices(start, later, symbols[:1])
+        self.assertEqual(cache.end_date, later)
+        cache = PriceCubeCache(path)
+        self.assertTrue(
+            cache.prices(end, later, symbols).equals(
+                gets.prices(end, later, symbols)
+            )
+        )
+        shutil.rmtree(path)
+
+    def test_interactive_brokers_update(self):
+        """Ensure that incrementally downloading the bars of the selected
+        symbols produces the same window of bars as downloading the entire
+        window, including for newly selected symbols with bars on dates that
+        none of the symbols already held traded.
+        """
+        class Source(object):
+            """Serve the prices of the symbols that traded between two dates."""
+            def __init__(self, values, dates, symbols):
+                self.values, self.dates = values, dates
+                self.symbols = pd.Index(symbols)
+
+            def prices(self, start_date, end_date, symbols=None):
+                symbols = self.symbols if symbols is None else symbols
+                v = self.values[:, :, self.symbols.get_indexer(symbols)]
+                traded = ~np.isnan(v).all(axis=0)
+                rows = (
+                    (self.dates >= start_date) & (self.dates <= end_date) &
+                    traded.any(axis=1)
+                )
+                cols = traded[rows].any(axis=0)
+                return pd.Panel(
+                    v[:, rows][:, :, cols], items=items,
+                    major_axis=self.dates[rows],
+                    minor_axis=pd.Index(symbols)[cols]
+                )
+
+        class SymbolHandler(object):
+            selected = ["SPY", "GOOG"]
+            def selection(self, date):
+                return self.selected
+
+        # Neither SPY nor GOOG trade on the third trading session, when only OEF
+        # trades.
+        items = ["adj_price_close", "adj_volume"]
+        today = dt.datetime.combine(dt.date.today(), dt.time())
+        dates = pd.date_range(today - dt.timedelta(days=10), periods=16)
+        values = np.arange(2 * 16 * 3, dtype=float).reshape((2, 16, 3))
+        values[:, 12, [0, 2]] = np.nan
+        source = Source(values, dates, ["SPY", "OEF", "GOOG"])
+        sh, n_init = SymbolHandler(), 3
+        with mock.patch.object(
+                interactive_brokers_data_handler,
+                "InteractiveBrokersPriceHandler"
+        ):
+            dh = InteractiveBrokersDataHandler(
+                EventsQueue(), sh, n_init, source
+            )
+
+        # Begin with SPY and GOOG held, so that the third trading session is
+        # never added to the window. Then replace GOOG with OEF, which is stale
+        # and has a bar older than the most recent bar that is missing from the
+        # window, and finally reselect GOOG, which is stale and has no missing
+        # bars.
+        selections = [["SPY", "GOOG"]] * 4 + [
+            ["SPY", "OEF"], ["SPY", "OEF", "GOOG"]
+        ]
+        for date, selected in zip(dates[10:], selections):
+            dh.current_date, sh.selected = date, selected
+            dh.update()
+            start_date = date - dt.timedelta(days=n_init)
+            expected = Bars.from_panel(
+                source.prices(start_date, date, selected), n_init + 1
+            )
+            expected.select(expected.available(selected))
+            self.assertTrue(dh.bars.equals(expected))
+            self.assertEqual(dh.bars.major_axis[0], start_date)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import os
+import shutil
+import tempfile
+import unittest
+import datetime as dt
+from odin.events import BacktestEventsQueue, EventJournal, SignalEvent
+from odin.fund import SimulatedFund
+from odin.handlers.data_handler import DatabaseDataHandler, ReplayDataHandler
+from odin.handlers.execution_handler import SimulatedExecutionHandler
+from odin.handlers.fund_handler import FundHandler
+from odin.handlers.portfolio_handler import PortfolioHandler
+from odin.handlers.position_handler.templates import (
+    SuggestedProportionPositionHandler
+)
+from odin.handlers.symbol_handler import FixedSymbolHandler
+from odin.portfolio import SimulatedPortfolio
+from odin.strategy.templates import SwingStrategy
+from odin.utilities.finance import Indices
+from odin.utilities.params import TradeTypes, Directions
+
+
+class EventJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def build_fund(self, data_handler, journal, maximum_capacity=2):
+        porth = PortfolioHandler(maximum_capacity, "swing", 100000.0, "fund")
+        posh = SuggestedProportionPositionHandler(data_handler)
+        portfolio = SimulatedPortfolio(data_handler, posh, porth)
+        fh = FundHandler(
+            data_handler.events, [SwingStrategy(portfolio)],
+            data_handler.current_date, "fund"
+        )
+        return SimulatedFund(
+            data_handler, SimulatedExecutionHandler(data_handler), fh,
+            journal=journal
+        )
+
+    def test_event_journal(self):
+        """Ensure that a backtest replayed from its event journal processes the
+        same events and achieves the same performance, for data handlers that
+        both preload and query their prices.
+        """
+        start, end = dt.datetime(2015, 1, 2), dt.datetime(2015, 6, 1)
+        symbols = [Indices.sp_100_etf.value, Indices.sp_500_etf.value]
+        for preload in (True, False):
+            path = os.path.join(self.directory, "{}.journal".format(preload))
+            journal = EventJournal(path)
+            dh = DatabaseDataHandler(
+                BacktestEventsQueue(), FixedSymbolHandler(symbols, []), start,
+                end, 10, preload=preload
+            )
+            fund = self.build_fund(dh, journal)
+            fund.trade()
+            expected = fund.performance_summary()
+
+            # Replay the run, recording it in the same journal as a second run.
+            replay = ReplayDataHandler(BacktestEventsQueue(), path)
+            fund = self.build_fund(replay, journal)
+            fund.trade()
+            journal.close()
+            self.assertTrue(
+                fund.performance_summary().equals(expected)
+            )
+
+            runs = [[], []]
+            for run, event, market in EventJournal.read(path):
+                runs[run].append(event)
+            self.assertGreater(len(runs[0]), len(dh.sessions))
+            self.assertEqual(runs[0], runs[1])
+            self.assertEqual(
+                set(e.event_type.value for e in runs[0]),
+                set(["MARKET", "SIGNAL", "ORDER", "FILL"])
+            )
+
+    def test_replay_with_new_portfolio_handler(self):
+        """Ensure that a recorded run can be replayed with a different portfolio
+        handler, and that runs appended to an existing journal are interned
+        against the strings that it already contains.
+        """
+        start, end = dt.datetime(2015, 1, 2), dt.datetime(2015, 3, 1)
+        symbols = [Indices.sp_100_etf.value, Indices.sp_500_etf.value]
+        path = os.path.join(self.directory, "fund.journal")
+        dh = DatabaseDataHandler(
+            BacktestEventsQueue(), FixedSymbolHandler(symbols, []), start, end,
+            10, preload=True
+        )
+        journal = EventJournal(path)
+        self.build_fund(dh, journal).trade()
+        journal.close()
+        strings = EventJournal.read_strings(path)
+        self.assertEqual(len(strings), len(set(strings)))
+
+        expected = self.build_fund(
+            DatabaseDataHandler(
+                BacktestEventsQueue(), FixedSymbolHandler(symbols, []), start,
+                end, 10, preload=True
+            ), None, 1
+        )
+        expected.trade()
+        journal = EventJournal(path)
+        fund = self.build_fund(
+            ReplayDataHandler(BacktestEventsQueue(), path), journal, 1
+        )
+        fund.trade()
+        journal.close()
+        self.assertTrue(
+            fund.performance_summary().equals(expected.performance_summary())
+        )
+        self.assertEqual(EventJournal.read_strings(path)[:len(strings)], strings)
+        runs = set(run for run, _, _ in EventJournal.read(path))
+        self.assertEqual(runs, set([0, 1]))
+
+    def test_truncated_journal(self):
+        """Ensure that an incomplete record at the end of a journal is ignored
+        when the journal is read and discarded when it is reopened.
+        """
+        path = os.path.join(self.directory, "fund.journal")
+        date = dt.datetime(2015, 1, 2)
+        events = [
+            SignalEvent(
+                s, 0.5, TradeTypes.buy_trade, Directions.long_dir, date, "p"
+            ) for s in ("SPY", "OEF", "GOOG")
+        ]
+        journal = EventJournal(path)
+        journal.begin()
+        for e in events:
+            journal.record(e)
+        journal.close()
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) - 3)
+        self.assertEqual(
+            [e for _, e, _ in EventJournal.read(path)], events[:2]
+        )
+        self.assertEqual(EventJournal.read_strings(path)[-1], "GOOG")
+
+        journal = EventJournal(path)
+        journal.begin()
+        journal.record(events[2])
+        journal.close()
+        records = list(EventJournal.read(path))
+        self.assertEqual([e for _, e, _ in records], events)
+        self.assertEqual([r for r, _, _ in records], [0, 0, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+import datetime as dt
+from odin.events import MarketEvent, SignalEvent, OrderEvent, FillEvent
+from odin.utilities.params import TradeTypes, Directions
+
+
+class EventsTest(unittest.TestCase):
+    def test_immutable_events(self):
+        """Ensure that the attributes of events are stored in slots and cannot
+        be modified once the event has been created.
+        """
+        date = dt.datetime(2015, 1, 2)
+        d, t = Directions.long_dir, TradeTypes.buy_trade
+        order = OrderEvent("SPY", 10, t, d, date, "p")
+        fill = FillEvent.from_order_event(order, 2000.0, 1.0, False)
+        self.assertEqual(fill.price, 200.0)
+        for e in (MarketEvent(date), order, fill):
+            self.assertFalse(hasattr(e, "__dict__"))
+            with self.assertRaises(AttributeError):
+                e.datetime = dt.datetime(2015, 1, 5)
+            with self.assertRaises(AttributeError):
+                del e.event_type
+            with self.assertRaises(AttributeError):
+                e.unknown_attribute = None
+
+    def test_event_equality(self):
+        """Ensure that events with equal attributes are equal and hash equally.
+        """
+        date = dt.datetime(2015, 1, 2)
+        d, t = Directions.long_dir, TradeTypes.buy_trade
+        a = SignalEvent("SPY", 0.5, t, d, date, "p")
+        b = SignalEvent("SPY", 0.5, t, d, date, "p")
+        c = SignalEvent("SPY", 1.0, t, d, date, "p")
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertNotEqual(a, c)
+        self.assertNotEqual(
+            OrderEvent("SPY", 10, t, d, date, "p"),
+            OrderEvent("SPY", 20, t, d, date, "p")
+        )
+        self.assertNotEqual(MarketEvent(date), a)
+        self.assertEqual(len(set([a, b, c])), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import datetime as dt
+from odin.events import (
+    EventsQueue, BacktestEventsQueue, MarketEvent, SignalEvent, OrderEvent,
+    RebalanceEvent
+)
+from odin.events.event_types.event import Event
+from odin.utilities.params import (
+    Events, TradeTypes, Directions, priority_table
+)
+
+
+class EventsQueueTest(unittest.TestCase):
+    def events(self):
+        date = dt.datetime(2015, 1, 2)
+        d = Directions.long_dir
+        return [
+            MarketEvent(date),
+            SignalEvent("SPY", 0.5, TradeTypes.buy_trade, d, date, "p"),
+            SignalEvent("OEF", 1.0, TradeTypes.exit_trade, d, date, "p"),
+            SignalEvent("GOOG", 0.5, TradeTypes.buy_trade, d, date, "p"),
+            OrderEvent("SPY", 10, TradeTypes.buy_trade, d, date, "p"),
+            RebalanceEvent(date),
+        ]
+
+    def test_backtest_events_queue(self):
+        """Ensure that the backtest events queue processes events in the same
+        order as the thread-safe events queue.
+        """
+        events = self.events()
+        q, b = EventsQueue(), BacktestEventsQueue()
+        for e in events:
+            q.put(e)
+            b.put(e)
+
+        while not q.empty():
+            self.assertIs(q.get(False), b.get(False))
+        self.assertTrue(b.empty())
+
+        for e in events:
+            q.put(e)
+            b.put(e)
+        q.clear()
+        b.clear()
+        self.assertTrue(q.empty())
+        self.assertTrue(b.empty())
+
+    def test_register_priority(self):
+        """Ensure that the priority of a custom event type is registered only
+        with the queue on which it is set, and that the priorities of the
+        built-in event types cannot be changed.
+        """
+        date = dt.datetime(2015, 1, 2)
+        for queue in (EventsQueue, BacktestEventsQueue):
+            q, other = queue(), queue()
+            q.register("CUSTOM", 1)
+            q.put(MarketEvent(date))
+            q.put(Event("CUSTOM", date))
+            self.assertEqual(q.get(False).event_type, "CUSTOM")
+            self.assertRaises(KeyError, other.put, Event("CUSTOM", date))
+            self.assertRaises(ValueError, q.register, Events.signal, 1)
+        self.assertNotIn(("CUSTOM", None), priority_table)
+        self.assertEqual(
+            priority_table[Events.signal, TradeTypes.exit_trade], 4
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
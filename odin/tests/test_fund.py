@@ -0,0 +1,146 @@
+import unittest
+import itertools
+import json
+import datetime as dt
+from odin.events import BacktestEventsQueue, MarketEvent
+from odin.events.event_types.event import Event
+from odin.fund import Fund, SimulatedFund, FundProfiler
+from odin.fund.stop_conditions import (
+    MaxDrawdownStopCondition, RollingSharpeStopCondition
+)
+from odin.metrics import OnlineMetrics
+from odin.utilities.params import StopReasons
+
+
+def stub_handlers(equity, event_types=()):
+    """Construct stubs of the data handler and the fund handler for a fund with
+    a single portfolio and strategy. On each trading session the data handler
+    streams an event of each of the provided types followed by a market event,
+    and the equity of the portfolio is given by the provided equity curve.
+    """
+    class DataHandler(object):
+        events = BacktestEventsQueue()
+        continue_trading = True
+        current_date = None
+        sessions = iter(enumerate(equity))
+        def request_prices(self):
+            try:
+                i, self.equity = next(self.sessions)
+                self.current_date = dt.datetime(2015, 1, 2, i)
+                for event_type in event_types:
+                    self.events.put(Event(event_type, self.current_date))
+                self.events.put(MarketEvent(self.current_date))
+            except StopIteration:
+                self.continue_trading = False
+        def update(self):
+            pass
+
+    class PortfolioHandler(object):
+        portfolio_id = "test_portfolio_id"
+
+    class Portfolio(object):
+        portfolio_handler = PortfolioHandler()
+        online_metrics = OnlineMetrics()
+        def process_market_event(self, market_event):
+            pass
+        def process_post_events(self):
+            self.online_metrics.update(dh.equity, 0)
+
+    class Strategy(object):
+        def generate_signals(self):
+            pass
+
+    class FundHandler(object):
+        portfolios, strategies = [Portfolio()], [Strategy()]
+        handled = []
+        def process_market_event(self, market_event):
+            self.handled.append(market_event.event_type)
+        def rebalance(self):
+            pass
+
+    dh = DataHandler()
+    return dh, FundHandler()
+
+
+class FundTest(unittest.TestCase):
+    def test_custom_event_type(self):
+        """Ensure that events of a custom type are dispatched to the handler
+        registered for them in order of their priority.
+        """
+        dh, fh = stub_handlers([100., 100.], ["CUSTOM"])
+        fund = Fund(dh, None, fh, 0)
+        fund.register(
+            "CUSTOM", lambda e: fh.handled.append(e.event_type), priority=1
+        )
+        fund.trade()
+        self.assertEqual(len(fh.handled), 4)
+        self.assertEqual(fh.handled[::2], ["CUSTOM", "CUSTOM"])
+
+    def test_profiler(self):
+        """Ensure that the profiler records the handling of each event, the
+        calls to the components of the fund, each trading session and the depth
+        of the events queue, and that the profile can be exported.
+        """
+        dh, fh = stub_handlers([100., 100., 100.], ["CUSTOM"])
+        profiler = FundProfiler(clock=itertools.count().__next__)
+        fund = Fund(dh, None, fh, 0, profiler=profiler)
+        fund.register("CUSTOM", lambda e: None, priority=1)
+        fund.trade()
+
+        summary = profiler.summary()
+        self.assertEqual(summary.loc["MARKET", "count"], 3)
+        self.assertEqual(summary.loc["CUSTOM", "count"], 3)
+        self.assertEqual(summary.loc["generate_signals", "count"], 3)
+        self.assertEqual(summary.loc["process_post_events", "count"], 3)
+        self.assertEqual(summary.loc["request_prices", "count"], 4)
+        self.assertEqual(summary.loc["generate_signals", "category"], "strategy")
+        self.assertEqual(summary.loc["generate_signals", "mean"], 1.)
+        # The market handler encloses the timed calls to the portfolio and the
+        # strategy.
+        self.assertEqual(summary.loc["MARKET", "max"], 5.)
+
+        sessions = profiler.session_summary()
+        self.assertEqual(len(sessions), 3)
+        self.assertTrue((sessions["events"] == 2).all())
+        self.assertTrue((sessions["max depth"] == 1).all())
+        self.assertEqual(list(profiler.queue_depth().values), [1, 0] * 3)
+
+        trace = json.loads(json.dumps(profiler.chrome_trace()))
+        phases = [e["ph"] for e in trace["traceEvents"]]
+        self.assertEqual(phases.count("X"), 3 + len(profiler.spans))
+        self.assertEqual(phases.count("C"), 6)
+
+    def trade_equity_curve(self, equity, stop_conditions):
+        """Trade a simulated fund with a single portfolio whose equity on each
+        trading session is given by the provided equity curve.
+        """
+        dh, fh = stub_handlers(equity)
+        fund = SimulatedFund(dh, None, fh, stop_conditions=stop_conditions)
+        fund.trade()
+        return fund
+
+    def test_stop_conditions(self):
+        """Ensure that trading is stopped once a stop condition is met and that
+        the reason for stopping is recorded.
+        """
+        equity = [100., 110., 105., 95., 90., 120.]
+        fund = self.trade_equity_curve(equity, [MaxDrawdownStopCondition(0.1)])
+        self.assertEqual(fund.stop_reason, StopReasons.max_drawdown)
+        self.assertEqual(fund.stop_date, dt.datetime(2015, 1, 2, 3))
+        self.assertFalse(fund.data_handler.continue_trading)
+        portfolio = fund.fund_handler.portfolios[0]
+        self.assertEqual(portfolio.online_metrics.n_states, 4)
+
+        fund = self.trade_equity_curve(
+            equity, [RollingSharpeStopCondition(0., 2)]
+        )
+        self.assertEqual(fund.stop_reason, StopReasons.min_sharpe)
+        self.assertEqual(fund.stop_date, dt.datetime(2015, 1, 2, 3))
+
+        fund = self.trade_equity_curve(equity, [MaxDrawdownStopCondition(0.2)])
+        self.assertEqual(fund.stop_reason, StopReasons.completed)
+        self.assertIsNone(fund.stop_date)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,9 @@
 import pandas as pd
 import numpy as np
 import unittest
+import datetime as dt
 from odin.metrics import *
+from odin.utilities.params import Directions
 
 
 class MetricsTest(unittest.TestCase):
@@ -25,6 +27,95 @@ class MetricsTest(unittest.TestCase):
         self.assertTrue((dur == [0, 0, 1, 2, 0]).all())
         self.assertTrue((dd == [0, 0, 0.25, 0.125, 0]).all())
 
+    def test_compute_drawdowns_batch(self):
+        """Ensure that the drawdowns of many equity curves are computed at
+        once, matching the drawdowns of the individual curves.
+        """
+        equity = np.array([
+            [1., 2., 1.5, 1.75, 3.],
+            [4., 3., 2., 5., 4.],
+        ]).T
+        dd, dur = compute_drawdowns(equity)
+        self.assertTrue((dd == [0.25, 0.5]).all())
+        self.assertTrue((dur == [2, 2]).all())
+        frame = pd.DataFrame(equity, columns=["a", "b"])
+        dd, dur = compute_drawdowns(frame, False)
+        for c in frame:
+            ddc, durc = compute_drawdowns(frame[c], False)
+            self.assertTrue(dd[c].equals(ddc))
+            self.assertTrue(dur[c].equals(durc))
+
+    def test_online_metrics(self):
+        """Ensure that the metrics accumulated online agree with the metrics
+        computed from the complete equity curve.
+        """
+        equity = pd.Series(100. * np.exp(np.cumsum(
+            np.random.RandomState(0).normal(0., 0.01, size=500)
+        )))
+        n_positions = np.arange(500) % 7
+        metrics = OnlineMetrics()
+        for e, n in zip(equity, n_positions):
+            metrics.update(e, n)
+
+        returns = equity.pct_change()
+        dd, dur = compute_drawdowns(equity)
+        self.assertAlmostEqual(
+            metrics.sharpe_ratio, compute_sharpe_ratio(returns)
+        )
+        self.assertAlmostEqual(metrics.max_drawdown, dd)
+        self.assertEqual(metrics.max_duration, dur)
+        self.assertAlmostEqual(metrics.avg_positions, n_positions.mean())
+        self.assertAlmostEqual(
+            metrics.annualized_returns,
+            (1. + returns).prod() ** (252. / len(equity))
+        )
+        summary = metrics.summary("p")
+        self.assertEqual(summary["total equity"].iloc[0], equity.iloc[-1])
+
+    def test_bootstrap_performance(self):
+        """Ensure that the bootstrapped performance metrics are reproducible
+        for a fixed seed regardless of the number of processes, and that they
+        agree with the metrics of the returns when each path is a rotation of
+        the returns.
+        """
+        returns = pd.Series(np.random.RandomState(0).normal(0.001, 0.01, 100))
+        a = bootstrap_performance(returns, 50, 5, n_jobs=1, chunk_size=20)
+        b = bootstrap_performance(returns, 50, 5, n_jobs=2, chunk_size=20)
+        self.assertEqual(a.shape, (50, 4))
+        self.assertTrue(a.equals(b))
+        self.assertFalse(a.equals(bootstrap_performance(
+            returns, 50, 5, seed=1, chunk_size=20
+        )))
+        # A single block spanning every return produces rotations of the
+        # returns, whose mean, variance and product are unchanged.
+        c = bootstrap_performance(returns, 10, len(returns))
+        self.assertTrue(np.allclose(
+            c["sharpe ratio"], compute_sharpe_ratio(returns)
+        ))
+        self.assertTrue(np.allclose(
+            c["annualized returns"], (1. + returns).prod() ** (252. / 101)
+        ))
+        self.assertTrue((c["max drawdown"] > 0).all())
+
+    def test_compute_trade_returns(self):
+        """Ensure that the returns of closed long and short positions are
+        computed relative to the capital committed to each position.
+        """
+        class Position(object):
+            def __init__(self, direction, buys, sells, pnl):
+                self.direction = direction
+                self.tot_buys_price, self.tot_sells_price = buys, sells
+                self.realized_pnl = pnl
+
+        d1, d2 = dt.datetime(2015, 1, 5), dt.datetime(2015, 1, 2)
+        closed = {
+            d1: [Position(Directions.short_dir, 90.0, 100.0, 9.0)],
+            d2: [Position(Directions.long_dir, 200.0, 210.0, 8.0)],
+        }
+        returns = compute_trade_returns(closed)
+        self.assertEqual(list(returns.index), [d2, d1])
+        self.assertTrue(np.allclose(returns.values, [0.04, 0.09]))
+
 
 if __name__ == "__main__":
     unittest.main()
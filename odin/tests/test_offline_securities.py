@@ -0,0 +1,80 @@
+import unittest
+import datetime as dt
+from collections import namedtuple
+from odin.utilities import offline_securities
+from odin.utilities.offline_securities import connection
+from odin.utilities.offline_securities.queries import (
+    gets, exists, inserts, updates, deletes
+)
+from odin.utilities import params
+
+
+Position = namedtuple("Position", [
+    "date_entered", "avg_price", "buys", "sells", "avg_buys_price",
+    "avg_sells_price", "tot_commission", "direction", "trade_type"
+])
+Portfolio = namedtuple("Portfolio", [
+    "portfolio_id", "capital", "maximum_capacity"
+])
+Fund = namedtuple("Fund", [
+    "fund_id", "rebalance_period", "manage_period", "date_entered"
+])
+
+
+class OfflineSecuritiesTest(unittest.TestCase):
+    def setUp(self):
+        connection.connect()
+        self.symbols = offline_securities.generate_securities(5, 30)
+
+    def test_standard_sessions(self):
+        start, end = dt.datetime(2000, 1, 3), dt.datetime(2000, 1, 14)
+        sessions = gets.standard_sessions(start, end)
+        self.assertEqual(len(sessions), 10)
+        self.assertEqual(sessions["datetime"].iloc[0], start)
+        self.assertEqual(sessions["datetime"].iloc[-1], end)
+
+    def test_prices(self):
+        start, end = dt.datetime(2000, 1, 3), dt.datetime(2000, 1, 14)
+        prices = gets.prices(start, end, self.symbols[:3])
+        self.assertEqual(list(prices.items), gets.price_fields)
+        self.assertEqual(list(prices.minor_axis), self.symbols[:3])
+        self.assertEqual(len(prices.major_axis), 10)
+        high = prices["adj_price_high"].values
+        low = prices["adj_price_low"].values
+        self.assertTrue((high >= prices["adj_price_close"].values).all())
+        self.assertTrue((low <= prices["adj_price_close"].values).all())
+
+    def test_persistence(self):
+        date = dt.datetime(2000, 1, 3)
+        inserts.fund(Fund("fund", 1, 1, date))
+        fid = gets.id_for_fund("fund")
+        inserts.portfolio(Portfolio("portfolio", 100000.0, 5), fid)
+        port = gets.portfolio("portfolio")
+        self.assertEqual(port["capital"], 100000.0)
+        self.assertEqual(
+            gets.fund_for_fund_id(port["fund_id"])["fund"].values[0], "fund"
+        )
+
+        pid = gets.id_for_portfolio("portfolio")
+        sid = gets.id_for_symbol(self.symbols[0])
+        self.assertFalse(exists.position(sid, pid))
+        pos = Position(
+            date, 100.0, 100, 0, 100.0, 0.0, 1.0, params.Directions.long_dir,
+            params.TradeTypes.buy_trade
+        )
+        inserts.position(pos, sid, pid)
+        self.assertTrue(exists.position(sid, pid))
+        updates.position(pos._replace(sells=50), sid, pid)
+        self.assertEqual(
+            gets.positions_for_portfolio_id(port.name), [self.symbols[0]]
+        )
+        inserts.closed_position(sid, pid)
+        deletes.position(sid, pid)
+        self.assertFalse(exists.position(sid, pid))
+        closed = connection.conn.execute(
+            "SELECT sells, date_entered FROM closed_positions"
+        ).fetchall()
+        self.assertEqual(closed, [(50, date)])
+
+if __name__ == "__main__":
+    unittest.main()
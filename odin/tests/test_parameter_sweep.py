@@ -0,0 +1,146 @@
+import unittest
+import datetime as dt
+import numpy as np
+import pandas as pd
+from odin.events import BacktestEventsQueue
+from odin.fund import SimulatedFund
+from odin.handlers.data_handler import DatabaseDataHandler
+from odin.handlers.execution_handler import SimulatedExecutionHandler
+from odin.handlers.fund_handler import FundHandler
+from odin.handlers.portfolio_handler import PortfolioHandler
+from odin.handlers.position_handler.templates import (
+    SuggestedProportionPositionHandler
+)
+from odin.handlers.symbol_handler import FixedSymbolHandler
+from odin.optimization import ParameterSweep, WalkForwardOptimization
+from odin.portfolio import SimulatedPortfolio
+from odin.strategy.indicators import MovingAverage as MA
+from odin.utilities.finance import Indices
+from odin.utilities.mixins.strategy_mixins import (
+    LongStrategyMixin, EqualBuyProportionMixin, TotalSellProportionMixin,
+    DefaultPriorityMixin, NeverSellIndicatorMixin
+)
+
+
+start_date, end_date = dt.datetime(2015, 1, 2), dt.datetime(2015, 6, 1)
+n_init = 30
+
+
+class CrossoverStrategy(
+        LongStrategyMixin, EqualBuyProportionMixin, TotalSellProportionMixin,
+        DefaultPriorityMixin, NeverSellIndicatorMixin
+):
+    def __init__(self, portfolio, short_window, long_window):
+        super(CrossoverStrategy, self).__init__(portfolio)
+        self.short_window = short_window
+        self.long_window = long_window
+
+    def buy_indicator(self, feats):
+        return feats["short_mavg"] > feats["long_mavg"]
+
+    def exit_indicator(self, feats):
+        return feats["long_mavg"] > feats["short_mavg"]
+
+    def generate_features(self):
+        series = self.portfolio.data_handler.bars["adj_price_close"]
+        feats = pd.DataFrame(index=series.columns)
+        feats["long_mavg"] = MA(self.long_window).simple_moving_average(series)
+        feats["short_mavg"] = MA(self.short_window).simple_moving_average(
+            series
+        )
+        return feats
+
+
+def build_fund(
+        source, short_window, long_window, preload=True, start_date=start_date,
+        end_date=end_date
+):
+    symbols = [Indices.sp_500_etf.value]
+    events = BacktestEventsQueue()
+    porth = PortfolioHandler(1, "crossover", 100000.0, "fund")
+    dh = DatabaseDataHandler(
+        events, FixedSymbolHandler(symbols, [porth]), start_date, end_date,
+        n_init, preload=preload, source=source
+    )
+    posh = SuggestedProportionPositionHandler(dh)
+    portfolio = SimulatedPortfolio(dh, posh, porth)
+    strategy = CrossoverStrategy(portfolio, short_window, long_window)
+    fh = FundHandler(events, [strategy], start_date, "fund")
+    return SimulatedFund(dh, SimulatedExecutionHandler(dh), fh)
+
+
+class ParameterSweepTest(unittest.TestCase):
+    def test_parameter_sweep(self):
+        """Ensure that a parameter sweep over shared prices produces the same
+        performance as backtesting each combination of parameters in turn.
+        """
+        grid = {"short_window": [3, 5], "long_window": [10, 20]}
+        sweep = ParameterSweep(
+            build_fund, grid, start_date, end_date, n_init, n_jobs=2
+        )
+        table = sweep.run()
+        self.assertEqual(len(sweep.combinations), 4)
+        self.assertEqual(
+            table.index.names, ["short_window", "long_window", "portfolio"]
+        )
+        self.assertEqual(len(table), 8)
+        for params in sweep.combinations:
+            fund = build_fund(sweep.source, preload=False, **params)
+            fund.trade()
+            expected = fund.performance_summary()
+            actual = table.loc[(params["short_window"], params["long_window"])]
+            self.assertEqual(list(actual.index), list(expected.index))
+            self.assertTrue(
+                (actual.values == expected.values.astype(float)).all()
+            )
+
+    def test_walk_forward_optimization(self):
+        """Ensure that the walk-forward optimization selects the parameters that
+        perform best on each training window and chains the equity of the
+        portfolio over the testing windows.
+        """
+        grid = {"short_window": [3, 5], "long_window": [10, 20]}
+        wfo = WalkForwardOptimization(
+            build_fund, grid, start_date, end_date, n_init, 40, 20, n_jobs=2
+        )
+        histories = wfo.run()
+        history = histories["crossover"]
+        folds = wfo.folds
+        self.assertGreater(len(folds), 1)
+        self.assertTrue((folds["train end"] < folds["test start"]).all())
+        self.assertEqual(history.dates[0], folds["test start"].iloc[0])
+        self.assertEqual(history.dates[-1], folds["test end"].iloc[-1])
+        self.assertTrue(history.dates.is_monotonic_increasing)
+
+        equity, n_states = 100000.0, 0
+        for _, f in folds.iterrows():
+            scores = []
+            for params in wfo.combinations:
+                fund = build_fund(
+                    wfo.source, preload=False, start_date=f["train start"],
+                    end_date=f["train end"], **params
+                )
+                fund.trade()
+                scores.append(wfo.score(fund.performance_summary()))
+            best = wfo.combinations[scores.index(max(scores))]
+            self.assertEqual(best, {n: f[n] for n in wfo.names})
+            fund = build_fund(
+                wfo.source, preload=False, start_date=f["test start"],
+                end_date=f["test end"], **best
+            )
+            fund.trade()
+            test = fund.fund_handler.portfolios[0].history
+            expected = equity / 100000.0 * test.column("equity")
+            actual = history.equity[test.dates].values
+            self.assertTrue(np.allclose(actual, expected, rtol=1e-12))
+            equity = expected[-1]
+            n_states += len(test)
+
+        self.assertEqual(len(history), n_states)
+        summary = wfo.performance_summary()
+        self.assertEqual(list(summary.index), ["crossover"])
+        self.assertAlmostEqual(summary["total equity"].iloc[0], equity)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import datetime as dt
+import pandas as pd
+from collections import OrderedDict
+from odin.portfolio.components import PortfolioHistory, PortfolioState
+from odin.utilities.params import Directions
+
+
+class Position(object):
+    def __init__(self, symbol, quantity, price, direction):
+        self.symbol = symbol
+        self.quantity = quantity
+        self.direction = direction
+        sign = 1 if direction == Directions.long_dir else -1
+        self.market_value = sign * quantity * price
+        self.relative_value = quantity * price
+
+
+class PortfolioHistoryTest(unittest.TestCase):
+    def test_add_state(self):
+        """Ensure that portfolio states are recorded in columns and that the
+        recorded states are unaffected by later changes to the portfolio.
+        """
+        history = PortfolioHistory("test_portfolio_id", capacity=1)
+        positions = OrderedDict()
+        state = PortfolioState(1000.0, positions, 2, "test_portfolio_id")
+        dates = [dt.datetime(2015, 1, i) for i in (2, 5, 6)]
+        history.add_state(dates[0], state)
+        positions["SPY"] = Position("SPY", 10, 200.0, Directions.long_dir)
+        positions["OEF"] = Position("OEF", 5, 100.0, Directions.short_dir)
+        history.add_state(dates[1], state)
+        positions["SPY"].relative_value = 2100.0
+        del positions["OEF"]
+        history.add_state(dates[2], state)
+
+        self.assertEqual(len(history), 3)
+        self.assertTrue(history.dates.equals(pd.DatetimeIndex(dates)))
+        self.assertEqual(
+            list(history.column("equity")), [1000.0, 3500.0, 3100.0]
+        )
+        self.assertEqual(list(history.column("n_positions")), [0, 2, 1])
+        self.assertEqual(list(history.position_states()), [1, 1, 2])
+        self.assertEqual(list(history.position_column("direction")), [1, -1, 1])
+
+        snapshot = history.snapshot(dates[1])
+        self.assertEqual(snapshot.equity, 3500.0)
+        self.assertEqual(list(snapshot.filled_positions), ["SPY", "OEF"])
+        self.assertEqual(
+            snapshot.filled_positions["OEF"].direction, Directions.short_dir
+        )
+        self.assertEqual(snapshot.filled_positions["OEF"].market_value, -500.0)
+        self.assertEqual(list(history.states), dates)
+
+    def test_compute_attributes(self):
+        """Ensure that the equity, number of positions and returns are computed
+        from the recorded columns.
+        """
+        history = PortfolioHistory("test_portfolio_id")
+        dates = [dt.datetime(2015, 1, i) for i in (2, 5)]
+        for d, capital in zip(dates, (1000.0, 1100.0)):
+            history.add_state(
+                d, PortfolioState(capital, {}, 1, "test_portfolio_id")
+            )
+
+        history.compute_attributes()
+        self.assertEqual(list(history.equity), [1000.0, 1100.0])
+        self.assertEqual(list(history.n_positions), [0, 0])
+        self.assertAlmostEqual(history.returns.iloc[-1], 0.1)
+
+        # The attributes are cached until another state is recorded.
+        equity = history.equity
+        history.compute_attributes()
+        self.assertIs(history.equity, equity)
+        history.add_state(
+            dt.datetime(2015, 1, 6),
+            PortfolioState(1210.0, {}, 1, "test_portfolio_id")
+        )
+        history.compute_attributes()
+        self.assertEqual(list(history.equity), [1000.0, 1100.0, 1210.0])
+        self.assertAlmostEqual(history.returns.iloc[-1], 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
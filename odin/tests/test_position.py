@@ -1,6 +1,13 @@
+import copy
+import pickle
 import unittest
 import datetime as dt
-from odin.handlers.position_handler.position import FilledPosition
+import numpy as np
+from odin.handlers.position_handler.position import (
+    FilledPosition, PositionLedger, PositionBook
+)
+from odin.portfolio.components import PortfolioState
+from odin.utilities import mark_to_market
 from odin.utilities import params
 
 class TestPosition(unittest.TestCase):
@@ -100,6 +107,155 @@ class TestPosition(unittest.TestCase):
         self.assertEqual(pos.unrealized_pnl, 0.)
         self.assertEqual(pos.tot_commission, 3.0)
 
+    def test_position_ledger(self):
+        pid = "test_portfolio_id"
+        date = dt.datetime.today()
+        ledger = PositionLedger()
+        state = PortfolioState(1000.0, ledger, 2, pid)
+        for s, d in (
+                ("GOOG", params.Directions.long_dir),
+                ("SPY", params.Directions.short_dir)
+        ):
+            t = params.TradeTypes.buy_trade
+            pos = FilledPosition(s, d, t, pid, date, 100.0)
+            pos.transact_shares(params.action_dict[(d, t)], 100, 100.0)
+            ledger[s] = pos
+
+        state.check_equity = True
+        ledger["GOOG"].update_market_value(101.0)
+        ledger["SPY"].update_market_value(101.0)
+        ledger["SPY"].transact_shares(params.Actions.buy, 50, 100.5)
+        self.assertAlmostEqual(state.equity, 1000.0 + sum([
+            pos.relative_value for pos in ledger.values()
+        ]))
+        # Copies of the ledger hold copies of the positions and recompute the
+        # running total from them.
+        for other in (
+                copy.deepcopy(ledger), pickle.loads(pickle.dumps(ledger))
+        ):
+            self.assertAlmostEqual(
+                other.relative_value, ledger.relative_value
+            )
+            self.assertIs(other["SPY"].ledger, other)
+            other["SPY"].update_market_value(102.0)
+            self.assertAlmostEqual(other.relative_value, sum([
+                pos.relative_value for pos in other.values()
+            ]))
+        self.assertAlmostEqual(ledger.relative_value, sum([
+            pos.relative_value for pos in ledger.values()
+        ]))
+
+        # Copies of a position held in the ledger are detached from it.
+        total = ledger.relative_value
+        for other in (
+                copy.copy(ledger["SPY"]), copy.deepcopy(ledger["SPY"]),
+                pickle.loads(pickle.dumps(ledger["SPY"]))
+        ):
+            self.assertIsNone(other.ledger)
+            self.assertEqual(other.ledger_value, ledger["SPY"].ledger_value)
+            other.update_market_value(150.0)
+            self.assertEqual(ledger.relative_value, total)
+        self.assertIs(ledger["SPY"].ledger, ledger)
+
+        del ledger["GOOG"]
+        ledger.pop("SPY")
+        self.assertEqual(ledger.relative_value, 0.0)
+        self.assertEqual(state.equity, 1000.0)
+
+    def test_mark_to_market(self):
+        pid = "test_portfolio_id"
+        date = dt.datetime.today()
+        t = params.TradeTypes.buy_trade
+        ledger = PositionLedger()
+        positions = []
+        for s, d in (
+                ("GOOG", params.Directions.long_dir),
+                ("SPY", params.Directions.short_dir),
+                ("OEF", params.Directions.long_dir)
+        ):
+            pos = FilledPosition(s, d, t, pid, date, 100.0)
+            pos.transact_shares(params.action_dict[(d, t)], 100, 100.0)
+            positions.append(pos)
+
+        # Mark the positions in a ledger and in a book to market at once and
+        # compare them to positions updated one at a time.
+        prices = np.array([101.0, 99.5, 100.25])
+        expected = [
+            FilledPosition(p.symbol, p.direction, t, pid, date, 100.0)
+            for p in positions
+        ]
+        for pos, exp, price in zip(positions, expected, prices):
+            ledger[pos.symbol] = pos
+            a = params.action_dict[(exp.direction, t)]
+            exp.transact_shares(a, 100, 100.0)
+            exp.update_market_value(price)
+
+        book = PositionBook(dict((p.symbol, p) for p in positions))
+        mark_to_market(ledger, prices)
+        mark_to_market(book, prices)
+        for pos, exp in zip(positions, expected):
+            for p in (pos, book[pos.symbol]):
+                self.assertEqual(p.market_value, exp.market_value)
+                self.assertEqual(p.unrealized_pnl, exp.unrealized_pnl)
+                self.assertEqual(p.realized_pnl, exp.realized_pnl)
+                self.assertEqual(p.relative_value, exp.relative_value)
+            self.assertEqual(pos.ledger_value, exp.relative_value)
+        self.assertAlmostEqual(
+            ledger.relative_value, sum([p.relative_value for p in expected])
+        )
+        self.assertAlmostEqual(book.relative_value, ledger.relative_value)
+
+    def test_position_book(self):
+        pid = "test_portfolio_id"
+        date = dt.datetime.today()
+        t = params.TradeTypes.buy_trade
+        book = PositionBook(capacity=1)
+        state = PortfolioState(1000.0, book, 3, pid)
+        state.check_equity = True
+        for s, d in (
+                ("GOOG", params.Directions.long_dir),
+                ("SPY", params.Directions.short_dir)
+        ):
+            pos = FilledPosition(s, d, t, pid, date, 100.0)
+            pos.transact_shares(params.action_dict[(d, t)], 100, 100.0)
+            book[s] = pos
+
+        # Views of the positions behave as filled positions whose attributes are
+        # stored in the book.
+        spy = book["SPY"]
+        spy.update_market_value(101.0)
+        self.assertEqual(spy.market_value, -10100.0)
+        self.assertEqual(spy.unrealized_pnl, -101.0)
+        spy.transact_shares(params.Actions.buy, 50, 100.5)
+        self.assertEqual(spy.quantity, 50)
+        self.assertEqual(spy.tot_commission, 2.0)
+        self.assertAlmostEqual(
+            book.exposure(params.Directions.short_dir), spy.relative_value
+        )
+        self.assertAlmostEqual(state.equity, 1000.0 + sum([
+            pos.relative_value for pos in book.values()
+        ]))
+
+        # Copies of the book hold views of copies of the positions.
+        market_value = spy.market_value
+        for other in (copy.deepcopy(book), pickle.loads(pickle.dumps(book))):
+            self.assertAlmostEqual(other.relative_value, book.relative_value)
+            self.assertIs(other["SPY"].book, other)
+            self.assertEqual(other["SPY"].quantity, 50)
+            other["SPY"].update_market_value(102.0)
+            self.assertEqual(spy.market_value, market_value)
+
+        # Closed positions remain valid and their slots are reused.
+        slot = spy.slot
+        del book["SPY"]
+        self.assertIsNone(spy.book)
+        self.assertEqual(spy.quantity, 50)
+        pos = FilledPosition("OEF", params.Directions.long_dir, t, pid, date, 1.)
+        book["OEF"] = pos
+        self.assertEqual(book["OEF"].slot, slot)
+        self.assertEqual(spy.quantity, 50)
+        self.assertEqual(book.exposure(params.Directions.short_dir), 0.0)
+
 
 if __name__ == "__main__":
     unittest.main()
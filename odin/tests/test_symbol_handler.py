@@ -29,6 +29,42 @@ class SymbolHandlerTest(unittest.TestCase):
             sel, set((Indices.sp_500_etf.value, ))
         )
 
+    def test_precomputed_dollar_volume_symbol_handler(self):
+        start, end = dt.datetime(2015, 1, 2), dt.datetime(2015, 1, 9)
+        sh = DollarVolumeSymbolHandler(10, [], None)
+        sh_pre = DollarVolumeSymbolHandler(
+            10, [], None, start_date=start, end_date=end
+        )
+        for date in sh_pre.dates:
+            self.assertEqual(
+                set(sh.select_symbols(date)), set(sh_pre.select_symbols(date))
+            )
+
+    def test_selection_memoization(self):
+        class CountingSymbolHandler(FixedSymbolHandler):
+            n_calls = 0
+            def select_symbols(self, date):
+                self.n_calls += 1
+                return super(CountingSymbolHandler, self).select_symbols(date)
+
+        class Holdings(object):
+            filled_positions = {}
+
+        h = Holdings()
+        date = dt.datetime(2015, 1, 2)
+        sh = CountingSymbolHandler([Indices.sp_500_etf.value], [h])
+        sh.selection(date)
+        sh.selection(date)
+        self.assertEqual(sh.n_calls, 1)
+        h.filled_positions = {"GOOG": None}
+        self.assertEqual(
+            set(sh.selection(date)), set((Indices.sp_500_etf.value, "GOOG"))
+        )
+        self.assertEqual(sh.n_calls, 2)
+        sh.invalidate()
+        sh.selection(date)
+        self.assertEqual(sh.n_calls, 3)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import datetime as dt
+from odin.events import BacktestEventsQueue
+from odin.fund import SimulatedFund, VectorizedSimulatedFund
+from odin.handlers.data_handler import DatabaseDataHandler
+from odin.handlers.execution_handler import SimulatedExecutionHandler
+from odin.handlers.fund_handler import FundHandler
+from odin.handlers.portfolio_handler import PortfolioHandler
+from odin.handlers.position_handler.templates import (
+    SuggestedProportionPositionHandler
+)
+from odin.handlers.symbol_handler import FixedSymbolHandler
+from odin.portfolio import SimulatedPortfolio
+from odin.strategy.templates import BuyAndHoldStrategy, SwingStrategy
+from odin.utilities.finance import Indices
+
+
+class VectorizedSimulatedFundTest(unittest.TestCase):
+    def build_fund(self, fund_class):
+        start, end = dt.datetime(2015, 1, 2), dt.datetime(2015, 6, 1)
+        symbols = [Indices.sp_100_etf.value, Indices.sp_500_etf.value]
+        events = BacktestEventsQueue()
+        porths = [
+            PortfolioHandler(2, "swing", 100000.0, "fund"),
+            PortfolioHandler(1, "buy_and_hold", 100000.0, "fund"),
+        ]
+        dh = DatabaseDataHandler(
+            events, FixedSymbolHandler(symbols, porths), start, end, 10
+        )
+        posh = SuggestedProportionPositionHandler(dh)
+        ports = [SimulatedPortfolio(dh, posh, p) for p in porths]
+        strats = [SwingStrategy(ports[0]), BuyAndHoldStrategy(ports[1])]
+        fh = FundHandler(events, strats, start, "fund")
+        return fund_class(dh, SimulatedExecutionHandler(dh), fh)
+
+    def test_vectorized_simulated_fund(self):
+        """Ensure that the vectorized simulated fund produces the same portfolio
+        histories and performance as trading the fund with events.
+        """
+        fund = self.build_fund(SimulatedFund)
+        vec = self.build_fund(VectorizedSimulatedFund)
+        fund.trade()
+        vec.trade()
+        portfolios = zip(
+            fund.fund_handler.portfolios, vec.fund_handler.portfolios
+        )
+        for p, q in portfolios:
+            self.assertTrue(p.history.dates.equals(q.history.dates))
+            for c in ("capital", "equity", "n_positions"):
+                self.assertTrue(
+                    (p.history.column(c) == q.history.column(c)).all()
+                )
+        self.assertTrue(
+            fund.performance_summary().equals(vec.performance_summary())
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,5 @@
 from .odin_init import odin_init
 from .compute_days_elapsed import compute_days_elapsed
+from .compute_relative_value import compute_relative_value
+from .mark_to_market import mark_to_market
 from .fund_actions import period_dict
@@ -0,0 +1,20 @@
+import numpy as np
+
+
+def compute_relative_value(net, cost_basis, unrealized_pnl):
+    """Computes the relative value of positions with holdings. This is the cost
+    basis multiplied by the profit-and-loss since entering the position, and it
+    is computed in the same way for a single position or, elementwise, for
+    arrays of positions.
+
+    Parameters
+    ----------
+    net: Integer or Numpy array.
+        The net number of shares bought and sold.
+    cost_basis: Float or Numpy array.
+        The cost basis of the holdings.
+    unrealized_pnl: Float or Numpy array.
+        The unrealized profit-and-loss of the holdings.
+    """
+    percent_pnl = 1.0 + unrealized_pnl / cost_basis * np.sign(net)
+    return abs(cost_basis * percent_pnl)
@@ -0,0 +1,24 @@
+def mark_to_market(positions, prices):
+    """Update the market value and the unrealized and realized profits and
+    losses of a collection of filled positions. This is equivalent to calling
+    the update market value method of each position with the corresponding
+    price. The positions of a position ledger or a position book are updated
+    with array arithmetic, and the ledger or book is revalued once rather than
+    once for each position.
+
+    Parameters
+    ----------
+    positions: Position ledger, position book or list of filled positions.
+        The positions whose market value should be updated.
+    prices: Numpy array.
+        The current price of the underlying asset of each position, in the order
+        in which the positions are iterated.
+    """
+    if len(positions) == 0:
+        return
+
+    if hasattr(positions, "mark_to_market"):
+        positions.mark_to_market(prices)
+    else:
+        for p, price in zip(positions, prices):
+            p.update_market_value(price)
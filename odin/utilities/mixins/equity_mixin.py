@@ -1,5 +1,13 @@
 class EquityMixin(object):
-    """Equity Mixin Class"""
+    """Equity Mixin Class
+
+    When the filled positions are held in a position ledger, the equity is
+    computed from the running total of the relative value of the positions that
+    is maintained by the ledger. Setting `check_equity` to true verifies the
+    running total against a full revaluation of the positions whenever the
+    equity is computed, which is useful for debugging.
+    """
+    check_equity = False
 
     @property
     def equity(self):
@@ -7,5 +15,16 @@ class EquityMixin(object):
         the free capital available to the portfolio and the current market value
         of each position in the portfolio.
         """
-        pos = self.filled_positions.values()
-        return self.capital + sum([p.relative_value for p in pos])
+        pos = self.filled_positions
+        value = getattr(pos, "relative_value", None)
+        if value is None or self.check_equity:
+            total = sum([p.relative_value for p in pos.values()])
+            if value is None:
+                return self.capital + total
+            elif abs(value - total) > 1e-9 * max(abs(total), 1.0):
+                raise ValueError(
+                    "Running total of relative value {} is inconsistent with "
+                    "the value of the positions {}.".format(value, total)
+                )
+
+        return self.capital + value
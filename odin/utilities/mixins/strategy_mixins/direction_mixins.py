@@ -11,6 +11,10 @@ class LongStrategyMixin(AbstractStrategy):
         """Implementation of abstract base class method."""
         return Directions.long_dir
 
+    def compute_directions(self, bars):
+        """Implementation of abstract base class method."""
+        return Directions.long_dir
+
 
 class ShortStrategyMixin(AbstractStrategy):
     """Short Strategy Mixin Class
@@ -20,3 +24,7 @@ class ShortStrategyMixin(AbstractStrategy):
     def compute_direction(self, feats):
         """Implementation of abstract base class method."""
         return Directions.short_dir
+
+    def compute_directions(self, bars):
+        """Implementation of abstract base class method."""
+        return Directions.short_dir
@@ -10,7 +10,7 @@ class DefaultFeaturesMixin(AbstractStrategy):
     """
     def generate_features(self):
         """Implementation of abstract base class method."""
-        symbols = self.portfolio.data_handler.bars.ix[
-            "adj_price_close", -1, :
-        ].dropna().index
+        symbols = self.portfolio.data_handler.bars.last(
+            "adj_price_close"
+        ).dropna().index
         return pd.DataFrame(index=symbols)
@@ -1,3 +1,5 @@
+import numpy as np
+import pandas as pd
 from ....strategy import AbstractStrategy
 
 
@@ -6,10 +8,21 @@ class DefaultPriorityMixin(AbstractStrategy):
 
     This class simply retrieves the symbols that are available at the conclusion
     of the previous day and returns them in the same order that they are in the
-    bars panel object.
+    bars object.
     """
     def generate_priority(self, feats):
         """Implementation of abstract base class method."""
-        return self.portfolio.data_handler.bars.ix[
-            "adj_price_close", -1, :
-        ].dropna().index
+        return self.portfolio.data_handler.bars.last(
+            "adj_price_close"
+        ).dropna().index
+
+    def generate_priorities(self, bars):
+        """Implementation of abstract base class method. Symbols are considered
+        in alphabetical order on every date that they have a closing price.
+        """
+        close = bars["adj_price_close"]
+        rank = close.columns.argsort().argsort()
+        return pd.DataFrame(
+            np.where(close.notnull(), rank, np.nan), index=close.index,
+            columns=close.columns
+        )
@@ -11,6 +11,10 @@ class EqualBuyProportionMixin(AbstractStrategy):
         """Implementation of abstract base class method."""
         return 1.0 / self.portfolio.portfolio_handler.maximum_capacity
 
+    def compute_buy_proportions(self, bars):
+        """Implementation of abstract base class method."""
+        return 1.0 / self.portfolio.portfolio_handler.maximum_capacity
+
 
 class TotalSellProportionMixin(AbstractStrategy):
     """Total Sell Proportion Mixin Class
@@ -23,3 +27,7 @@ class TotalSellProportionMixin(AbstractStrategy):
     def compute_sell_proportion(self, feats):
         """Implementation of abstract base class method."""
         return 1.0
+
+    def compute_sell_proportions(self, bars):
+        """Implementation of abstract base class method."""
+        return 1.0
@@ -7,6 +7,10 @@ class AlwaysBuyIndicatorMixin(AbstractStrategy):
         """Implementation of abstract base class method."""
         return True
 
+    def buy_indicators(self, bars):
+        """Implementation of abstract base class method."""
+        return True
+
 
 class NeverSellIndicatorMixin(AbstractStrategy):
     """Never Sell Strategy Mixin"""
@@ -14,9 +18,17 @@ class NeverSellIndicatorMixin(AbstractStrategy):
         """Implementation of abstract base class method."""
         return False
 
+    def sell_indicators(self, bars):
+        """Implementation of abstract base class method."""
+        return False
+
 
 class NeverExitIndicatorMixin(AbstractStrategy):
     """Never Exit Strategy Mixin"""
     def exit_indicator(self, feats):
         """Implementation of abstract base class method."""
         return False
+
+    def exit_indicators(self, bars):
+        """Implementation of abstract base class method."""
+        return False
@@ -0,0 +1,46 @@
+"""Offline Securities Module
+
+This module provides an offline stand-in for the Odin Securities master
+database that is backed by SQLite. It implements the portion of the query layer
+that is used by Odin (retrieving prices and trading sessions, and persisting
+funds, portfolios and positions) so that backtests and the persistence of live
+trading state can be exercised, benchmarked and regression-tested without a
+connection to the securities master. Synthetic prices for an arbitrary number of
+symbols and trading sessions can be generated for the purposes of measuring
+backtest throughput.
+
+The offline database must be installed before any of the Odin handlers are
+imported, since they import the securities master when they are loaded:
+
+    from odin.utilities import offline_securities
+    offline_securities.install()
+    offline_securities.generate_securities(500, 2520)
+"""
+import sys
+from . import connection, queries
+from .synthetic import generate_securities
+
+
+# The connection is established by installing the offline database.
+conn = None
+
+
+def install(path=":memory:"):
+    """Connect to an offline securities database and register it in place of
+    the Odin Securities master database, so that subsequent imports of the
+    `odin_securities` package and its query modules resolve to this module.
+
+    Parameters
+    ----------
+    path (Optional): String.
+        The path of the SQLite database file. By default the database is held
+        in memory.
+    """
+    global conn
+    conn = connection.connect(path)
+    sys.modules["odin_securities"] = sys.modules[__name__]
+    sys.modules["odin_securities.queries"] = queries
+    for name in ("gets", "exists", "inserts", "updates", "deletes"):
+        sys.modules["odin_securities.queries." + name] = getattr(queries, name)
+
+    return conn
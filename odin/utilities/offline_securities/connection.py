@@ -0,0 +1,101 @@
+"""Offline Securities Connection Module
+
+This module manages the SQLite connection used by the offline stand-in for the
+Odin Securities master database. The schema mirrors the tables of the securities
+master that are accessed by Odin: symbols, daily prices, trading sessions, and
+the funds, portfolios and positions that are persisted during live trading.
+"""
+import sqlite3
+import pandas as pd
+
+
+# The connection is established by calling the connect function.
+conn = None
+
+schema = """
+CREATE TABLE IF NOT EXISTS symbols (
+    id INTEGER PRIMARY KEY,
+    symbol TEXT UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS standard_sessions (
+    id INTEGER PRIMARY KEY,
+    datetime TIMESTAMP UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS prices (
+    id INTEGER PRIMARY KEY,
+    symbol_id INTEGER NOT NULL REFERENCES symbols(id),
+    price_date TIMESTAMP NOT NULL,
+    adj_price_open REAL,
+    adj_price_high REAL,
+    adj_price_low REAL,
+    adj_price_close REAL,
+    adj_volume REAL,
+    UNIQUE (price_date, symbol_id)
+);
+CREATE TABLE IF NOT EXISTS funds (
+    id INTEGER PRIMARY KEY,
+    fund TEXT UNIQUE NOT NULL,
+    rebalance_period,
+    manage_period,
+    entry_date TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS portfolios (
+    id INTEGER PRIMARY KEY,
+    portfolio TEXT UNIQUE NOT NULL,
+    fund_id INTEGER NOT NULL REFERENCES funds(id),
+    capital REAL NOT NULL,
+    maximum_capacity INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS positions (
+    id INTEGER PRIMARY KEY,
+    symbol_id INTEGER NOT NULL REFERENCES symbols(id),
+    portfolio_id INTEGER NOT NULL REFERENCES portfolios(id),
+    date_entered TIMESTAMP NOT NULL,
+    avg_price REAL NOT NULL,
+    buys INTEGER NOT NULL,
+    sells INTEGER NOT NULL,
+    avg_buys_price REAL NOT NULL,
+    avg_sells_price REAL NOT NULL,
+    tot_commission REAL NOT NULL,
+    direction TEXT NOT NULL,
+    trade_type TEXT NOT NULL,
+    UNIQUE (symbol_id, portfolio_id)
+);
+CREATE TABLE IF NOT EXISTS closed_positions (
+    id INTEGER PRIMARY KEY,
+    symbol_id INTEGER NOT NULL REFERENCES symbols(id),
+    portfolio_id INTEGER NOT NULL REFERENCES portfolios(id),
+    date_entered TIMESTAMP NOT NULL,
+    avg_price REAL NOT NULL,
+    buys INTEGER NOT NULL,
+    sells INTEGER NOT NULL,
+    avg_buys_price REAL NOT NULL,
+    avg_sells_price REAL NOT NULL,
+    tot_commission REAL NOT NULL,
+    direction TEXT NOT NULL,
+    trade_type TEXT NOT NULL
+);
+"""
+
+
+def connect(path=":memory:"):
+    """Open a connection to an offline securities database and create the
+    tables of the securities master if they do not already exist.
+
+    Parameters
+    ----------
+    path (Optional): String.
+        The path of the SQLite database file. By default the database is held
+        in memory.
+    """
+    global conn
+    conn = sqlite3.connect(
+        path, detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False
+    )
+    conn.executescript(schema)
+    return conn
+
+
+def format_date(date):
+    """Convert a date into the string representation stored by SQLite."""
+    return str(pd.Timestamp(date))
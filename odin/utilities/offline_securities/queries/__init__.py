@@ -0,0 +1 @@
+from . import gets, exists, inserts, updates, deletes
@@ -0,0 +1,9 @@
+from .. import connection
+
+
+def position(symbol_id, portfolio_id):
+    """Delete a position from the database."""
+    connection.conn.execute(
+        "DELETE FROM positions WHERE symbol_id=? AND portfolio_id=?",
+        (int(symbol_id), int(portfolio_id))
+    )
@@ -0,0 +1,26 @@
+from .. import connection
+
+
+def __exists(qry, params):
+    """Determine whether or not the query returns any records."""
+    return connection.conn.execute(qry, params).fetchone() is not None
+
+
+def portfolio(portfolio_id):
+    """Determine whether or not the portfolio is in the database."""
+    return __exists(
+        "SELECT 1 FROM portfolios WHERE portfolio=?", (portfolio_id, )
+    )
+
+
+def fund(fund_id):
+    """Determine whether or not the fund is in the database."""
+    return __exists("SELECT 1 FROM funds WHERE fund=?", (fund_id, ))
+
+
+def position(symbol_id, portfolio_id):
+    """Determine whether or not the position is in the database."""
+    return __exists(
+        "SELECT 1 FROM positions WHERE symbol_id=? AND portfolio_id=?",
+        (int(symbol_id), int(portfolio_id))
+    )
@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+from .. import connection
+from ..connection import format_date
+
+
+# The price fields are returned in the same order as the securities master.
+price_fields = [
+    "adj_price_open", "adj_price_high", "adj_price_low", "adj_price_close",
+    "adj_volume",
+]
+
+
+def prices(start_date, end_date=None, symbols=None):
+    """Retrieve a pandas panel of the price fields of the requested symbols for
+    each date between the start and end dates (inclusive). When the end date is
+    not provided, only the prices on the start date are returned.
+    """
+    end_date = start_date if end_date is None else end_date
+    qry = """
+    SELECT s.symbol, p.price_date, {}
+    FROM prices p JOIN symbols s ON p.symbol_id = s.id
+    WHERE p.price_date BETWEEN ? AND ?
+    """.format(", ".join("p." + f for f in price_fields))
+    params = [format_date(start_date), format_date(end_date)]
+    if symbols is not None:
+        qry += " AND s.symbol IN ({})".format(", ".join("?" * len(symbols)))
+        params += list(symbols)
+
+    rec = pd.read_sql(qry, connection.conn, params=params)
+    # Arrange the records into an array whose axes are the price fields, the
+    # dates and the symbols.
+    dates = pd.DatetimeIndex(np.unique(pd.to_datetime(rec["price_date"])))
+    syms = pd.Index(np.unique(rec["symbol"].astype(str)))
+    values = np.full((len(price_fields), len(dates), len(syms)), np.nan)
+    rows = dates.get_indexer(pd.to_datetime(rec["price_date"]))
+    cols = syms.get_indexer(rec["symbol"])
+    values[:, rows, cols] = rec[price_fields].values.T
+
+    return pd.Panel(
+        values, items=price_fields, major_axis=dates, minor_axis=syms
+    )
+
+
+def standard_sessions(start_date, end_date):
+    """Retrieve a data frame of the trading sessions between the start and end
+    dates (inclusive).
+    """
+    qry = """
+    SELECT datetime FROM standard_sessions WHERE datetime BETWEEN ? AND ?
+    ORDER BY datetime
+    """
+    return pd.read_sql(
+        qry, connection.conn, params=[
+            format_date(start_date), format_date(end_date)
+        ], parse_dates=["datetime"]
+    )
+
+
+def __id_for(table, column, value):
+    """Retrieve the identifier of the record whose column takes the provided
+    value.
+    """
+    rec = connection.conn.execute(
+        "SELECT id FROM {} WHERE {}=?".format(table, column), (value, )
+    ).fetchone()
+    if rec is None:
+        raise ValueError("No {} found for {}.".format(column, value))
+
+    return rec[0]
+
+
+def id_for_symbol(symbol):
+    """Retrieve the identifier of a ticker symbol."""
+    return __id_for("symbols", "symbol", symbol)
+
+
+def id_for_portfolio(portfolio_id):
+    """Retrieve the identifier of a portfolio."""
+    return __id_for("portfolios", "portfolio", portfolio_id)
+
+
+def id_for_fund(fund_id):
+    """Retrieve the identifier of a fund."""
+    return __id_for("funds", "fund", fund_id)
+
+
+def portfolio(portfolio_id):
+    """Retrieve the record of a portfolio as a pandas series whose name is the
+    identifier of the portfolio.
+    """
+    return pd.read_sql(
+        "SELECT * FROM portfolios WHERE portfolio=?", connection.conn,
+        params=[portfolio_id], index_col=["id"]
+    ).iloc[0]
+
+
+def fund(fund_id):
+    """Retrieve the record of a fund as a data frame."""
+    return pd.read_sql(
+        "SELECT * FROM funds WHERE fund=?", connection.conn, params=[fund_id],
+        index_col=["id"]
+    )
+
+
+def fund_for_fund_id(fund_id):
+    """Retrieve the record of a fund from its identifier as a data frame."""
+    return pd.read_sql(
+        "SELECT * FROM funds WHERE id=?", connection.conn,
+        params=[int(fund_id)], index_col=["id"]
+    )
+
+
+def positions_for_portfolio_id(portfolio_id):
+    """Retrieve the symbols of the positions held by a portfolio from the
+    identifier of the portfolio.
+    """
+    qry = """
+    SELECT s.symbol FROM positions p JOIN symbols s ON p.symbol_id = s.id
+    WHERE p.portfolio_id=?
+    """
+    rec = connection.conn.execute(qry, (int(portfolio_id), )).fetchall()
+    return [r[0] for r in rec]
@@ -0,0 +1,75 @@
+from .. import connection
+from ..connection import format_date
+
+
+position_columns = (
+    "symbol_id, portfolio_id, date_entered, avg_price, buys, sells, "
+    "avg_buys_price, avg_sells_price, tot_commission, direction, trade_type"
+)
+
+
+def position_values(position):
+    """Extract the values of a filled position object that are stored in the
+    database, excluding the symbol and portfolio identifiers.
+    """
+    return (
+        format_date(position.date_entered),
+        float(position.avg_price),
+        int(position.buys),
+        int(position.sells),
+        float(position.avg_buys_price),
+        float(position.avg_sells_price),
+        float(position.tot_commission),
+        position.direction.value,
+        position.trade_type.value,
+    )
+
+
+def position(position, symbol_id, portfolio_id):
+    """Insert a filled position object into the database."""
+    connection.conn.execute(
+        "INSERT INTO positions ({}) VALUES ({})".format(
+            position_columns, ", ".join("?" * 11)
+        ), (int(symbol_id), int(portfolio_id)) + position_values(position)
+    )
+
+
+def closed_position(symbol_id, portfolio_id):
+    """Copy a position into the table of closed positions."""
+    connection.conn.execute(
+        "INSERT INTO closed_positions ({0}) SELECT {0} FROM positions "
+        "WHERE symbol_id=? AND portfolio_id=?".format(position_columns),
+        (int(symbol_id), int(portfolio_id))
+    )
+
+
+def portfolio(portfolio_handler, fund_id):
+    """Insert a portfolio handler object into the database."""
+    ph = portfolio_handler
+    connection.conn.execute(
+        "INSERT INTO portfolios (portfolio, fund_id, capital, maximum_capacity)"
+        " VALUES (?, ?, ?, ?)", (
+            ph.portfolio_id, int(fund_id), float(ph.capital),
+            int(ph.maximum_capacity)
+        )
+    )
+
+
+def fund(fund_handler):
+    """Insert a fund handler object into the database."""
+    fh = fund_handler
+    connection.conn.execute(
+        "INSERT INTO funds (fund, rebalance_period, manage_period, entry_date)"
+        " VALUES (?, ?, ?, ?)", (
+            fh.fund_id, fh.rebalance_period, fh.manage_period,
+            format_date(fh.date_entered)
+        )
+    )
+
+
+def symbols(symbols):
+    """Insert ticker symbols into the database."""
+    connection.conn.executemany(
+        "INSERT OR IGNORE INTO symbols (symbol) VALUES (?)",
+        [(s, ) for s in symbols]
+    )
@@ -0,0 +1,31 @@
+from .. import connection
+from .inserts import position_values
+
+
+def position(position, symbol_id, portfolio_id):
+    """Update the record of a filled position object in the database."""
+    connection.conn.execute(
+        "UPDATE positions SET date_entered=?, avg_price=?, buys=?, sells=?, "
+        "avg_buys_price=?, avg_sells_price=?, tot_commission=?, direction=?, "
+        "trade_type=? WHERE symbol_id=? AND portfolio_id=?",
+        position_values(position) + (int(symbol_id), int(portfolio_id))
+    )
+
+
+def portfolio(portfolio_handler, portfolio_id):
+    """Update the record of a portfolio handler object in the database."""
+    ph = portfolio_handler
+    connection.conn.execute(
+        "UPDATE portfolios SET capital=?, maximum_capacity=? WHERE id=?", (
+            float(ph.capital), int(ph.maximum_capacity), int(portfolio_id)
+        )
+    )
+
+
+def fund(fund_handler, fund_id):
+    """Update the record of a fund handler object in the database."""
+    fh = fund_handler
+    connection.conn.execute(
+        "UPDATE funds SET rebalance_period=?, manage_period=? WHERE id=?",
+        (fh.rebalance_period, fh.manage_period, int(fund_id))
+    )
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+from . import connection
+from .connection import format_date
+from .queries import inserts
+
+
+def generate_securities(
+        n_symbols, n_sessions, start_date="2000-01-03", seed=0, drift=0.0002,
+        volatility=0.02
+):
+    """Populate the offline securities database with synthetic daily prices for
+    a universe of symbols over a sequence of business-day trading sessions. The
+    closing prices follow a geometric Brownian motion and the remaining price
+    fields are generated around them, so that backtests over the database are
+    reproducible for a fixed random seed.
+
+    Parameters
+    ----------
+    n_symbols: Integer.
+        The number of symbols in the synthetic universe.
+    n_sessions: Integer.
+        The number of trading sessions for which prices are generated.
+    start_date (Optional): Datetime object.
+        The date of the first trading session.
+    seed (Optional): Integer.
+        The seed of the random number generator.
+    drift (Optional): Float.
+        The expected daily logarithmic return of each symbol.
+    volatility (Optional): Float.
+        The standard deviation of the daily logarithmic returns.
+    """
+    rng = np.random.RandomState(seed)
+    dates = pd.bdate_range(start_date, periods=n_sessions)
+    symbols = ["SYN{:05d}".format(i) for i in range(n_symbols)]
+    shape = (n_sessions, n_symbols)
+
+    # Generate closing prices and then derive opening prices from the previous
+    # close. The high and low prices bracket both the open and the close.
+    close = rng.uniform(10.0, 200.0, n_symbols) * np.exp(
+        np.cumsum(rng.normal(drift, volatility, shape), axis=0)
+    )
+    opening = np.vstack((close[:1], close[:-1])) * np.exp(
+        rng.normal(0.0, volatility / 4.0, shape)
+    )
+    high = np.maximum(opening, close) * (
+        1.0 + np.abs(rng.normal(0.0, volatility / 2.0, shape))
+    )
+    low = np.minimum(opening, close) * (
+        1.0 - np.abs(rng.normal(0.0, volatility / 2.0, shape))
+    )
+    volume = np.round(rng.lognormal(13.0, 1.0, shape))
+
+    conn = connection.conn
+    inserts.symbols(symbols)
+    conn.executemany(
+        "INSERT OR IGNORE INTO standard_sessions (datetime) VALUES (?)",
+        [(format_date(d), ) for d in dates]
+    )
+    ids = dict(conn.execute("SELECT symbol, id FROM symbols").fetchall())
+    sids = np.array([ids[s] for s in symbols])
+    stamps = [format_date(d) for d in dates]
+    conn.executemany(
+        "INSERT OR REPLACE INTO prices (symbol_id, price_date, adj_price_open, "
+        "adj_price_high, adj_price_low, adj_price_close, adj_volume) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)", (
+            (int(sids[j]), stamps[i], opening[i, j], high[i, j], low[i, j],
+             close[i, j], volume[i, j])
+            for i in range(n_sessions) for j in range(n_symbols)
+        )
+    )
+    conn.commit()
+
+    return symbols
@@ -4,7 +4,8 @@ from .trade_types import TradeTypes
 from .interactive_brokers import InteractiveBrokers as IB
 from .interactive_brokers import ib_commission, ib_silent_errors
 from .actions import Actions, action_dict
-from .priorities import priority_dict
+from .priorities import priority_dict, priority_table, custom_priorities
 from .io_params import IOFiles
 from .verbosity import Verbosities, verbosity_dict
 from .price_fields import PriceFields
+from .stop_reasons import StopReasons
@@ -10,6 +10,7 @@ This file contains privileged account information for both the live trading
 account and the paper trading account. These are required for submitting trades
 in their respective trading environments.
 """
+import numpy as np
 from .odin_enum import OdinEnum
 
 
@@ -23,12 +24,17 @@ class InteractiveBrokers(OdinEnum):
 
 
 def ib_commission(quantity, price):
-    """Compute the commission charged by Interactive Brokers."""
+    """Compute the commission charged by Interactive Brokers. The quantities
+    and prices may also be Numpy arrays, in which case the commission of each
+    trade is computed.
+    """
     c = 0.005 * quantity
     maximum =  0.005 * quantity * price
     minimum = 1.0
 
-    if c < minimum:
+    if np.ndim(c) > 0:
+        return np.where(c < minimum, minimum, np.where(c > maximum, maximum, c))
+    elif c < minimum:
         # The commission may not be less than one dollar.
         c = minimum
     elif c > maximum:
@@ -27,3 +27,36 @@ priority_dict = {
     Events.rebalance: 8,
     Events.management: 9,
 }
+
+# Integer priorities keyed by event type and trade type, so that the priority of
+# an event is found with a single lookup. Only signal events are prioritized by
+# their trade type; events without a trade type are keyed by None.
+priority_table = {}
+for e, p in priority_dict.items():
+    for t in list(TradeTypes) + [None]:
+        if isinstance(p, dict):
+            if t in p:
+                priority_table[(e, t)] = p[t]
+        else:
+            priority_table[(e, t)] = p
+
+
+def custom_priorities(event_type, priority):
+    """Create the entries of a priority table for a custom event type. Built-in
+    event types are rejected so that their priorities, and in particular the
+    ordering of signal events by trade type, cannot be overwritten.
+
+    Parameters
+    ----------
+    event_type: Object.
+        The custom event type.
+    priority: Integer.
+        The priority of events of the custom type.
+    """
+    if event_type in priority_dict:
+        raise ValueError(
+            "The priority of the built-in event type {} cannot be changed."
+            .format(event_type)
+        )
+
+    return {(event_type, t): priority for t in list(TradeTypes) + [None]}
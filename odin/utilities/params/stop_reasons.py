@@ -0,0 +1,14 @@
+"""Stop Reason Declaration Module
+
+A simulated fund may either trade until the data handler has exhausted its bar
+data, in which case the backtest is 'COMPLETED', or it may stop early because
+one of its stop conditions was met. In the latter case, the reason records
+which kind of condition ended the backtest.
+"""
+from .odin_enum import OdinEnum
+
+
+class StopReasons(OdinEnum):
+    completed = "COMPLETED"
+    max_drawdown = "MAX_DRAWDOWN"
+    min_sharpe = "MIN_SHARPE"